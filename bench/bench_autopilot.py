@@ -0,0 +1,71 @@
+"""
+Benchmark : bot par anticipation (autopilot.Autopilot) sur des parties sans affichage.
+
+- Parties complètes (plafonnées à MAX_TICKS) : bot vs inputs scriptés, distance,
+  phase atteinte, cause de game over.
+- Coût de planification : par décision (moyenne, max), par tick, rollouts par décision.
+- Sans budget : décisions déterministes (même partie deux fois) ; avec budget
+  (mode interactif) : décisions coupées par le budget.
+
+Usage (depuis la racine du projet) :
+    python bench/bench_autopilot.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from autopilot import BUDGET_S, Autopilot  # noqa: E402
+from simulation import SIM_HZ  # noqa: E402
+from world import World  # noqa: E402
+
+SEEDS = list(range(6))
+MAX_TICKS = 240 * SIM_HZ
+
+
+def play(seed, policy):
+    world = World(seed=seed)
+    phase = 0
+    while not world.game_over and world.ticks < MAX_TICKS:
+        world.tick(*policy(world))
+        phase = max(phase, world.phase)
+    return world.ticks, round(world.sim.distance, 6), world.death_reason or "-", phase + 1
+
+
+def scripted(world):
+    i = world.ticks
+    return (i % 180) < 120, (i % 90) == 0
+
+
+def main():
+    ok = True
+    print(f"{'seed':>4} | {'scripté':^22} | {'bot':^22} | {'ms/décision':>11} | {'max':>6} | "
+          f"{'ms/tick':>7} | {'rollouts':>8} | déterministe")
+    far = 0
+    for seed in SEEDS:
+        s_ticks, s_dist, s_end, s_lvl = play(seed, scripted)
+        bot = Autopilot(budget_s=None)
+        b_ticks, b_dist, b_end, b_lvl = play(seed, bot)
+        again = play(seed, Autopilot(budget_s=None)) == (b_ticks, b_dist, b_end, b_lvl)
+        ok &= again
+        far += b_dist > s_dist
+        r = bot.report()
+        print(f"{seed:4d} | {s_dist:7.0f} px L{s_lvl} {s_end:>7} | {b_dist:7.0f} px L{b_lvl} {b_end:>7} | "
+              f"{r['mean_ms']:11.2f} | {r['max_ms']:6.2f} | {r['per_tick_ms']:7.3f} | "
+              f"{r['rollouts_per_decision']:8.1f} | {'oui' if again else 'NON'}")
+    print(f"bot plus loin que les inputs scriptés : {far}/{len(SEEDS)} parties")
+    ok &= far == len(SEEDS)
+
+    bot = Autopilot(budget_s=BUDGET_S)
+    ticks, dist, end, lvl = play(SEEDS[0], bot)
+    r = bot.report()
+    print(f"budget {BUDGET_S * 1000:.1f} ms : {dist:.0f} px L{lvl} {end}, {r['mean_ms']:.2f} ms/décision "
+          f"(max {r['max_ms']:.2f}), {r['over_budget']}/{r['decisions']} décisions coupées par le budget")
+
+    print("OK" if ok else "ÉCHEC")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Benchmark : rendu des pièces, deux pygame.draw.circle par pièce (ancien) vs sprites
+pré-rendus envoyés en un seul Surface.blits.
+
+- Vérification pixel à pixel (sprite fixe) contre les deux cercles.
+- Temps de draw de 2 à 200 pièces visibles (et avec 8 images de rotation).
+
+Usage (depuis la racine du projet) :
+    python bench/bench_coin_render.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame  # noqa: E402
+
+from collectibles import CollectibleManager  # noqa: E402
+
+WIDTH, HEIGHT = 900, 600
+Y_OFFSET = 45
+REPEAT = 400
+
+
+def make_manager(n, spin_frames=1, seed=0):
+    """n pièces visibles, réparties sur l'écran (distance = 0, player_x = 0)."""
+    rng = random.Random(seed)
+    m = CollectibleManager(WIDTH, HEIGHT, y_offset=Y_OFFSET, spin_frames=spin_frames)
+    xs = sorted(float(rng.randrange(WIDTH)) for _ in range(n))
+    m.xs.extend(xs)
+    m.ys.extend(rng.uniform(150, HEIGHT - 50) for _ in range(n))
+    m.taken.extend(bytes(n))
+    return m
+
+
+def draw_circles(screen, m):
+    """Ancien rendu : deux cercles par pièce."""
+    for x, y, taken in zip(m.xs, m.ys, m.taken):
+        if taken:
+            continue
+        x_screen = int(x)
+        y_screen = int(y - m.y_offset)
+        pygame.draw.circle(screen, (255, 215, 0), (x_screen, y_screen), 10)
+        pygame.draw.circle(screen, (255, 240, 150), (x_screen, y_screen), 6)
+
+
+def timed(fn, screen):
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    return (time.perf_counter() - t0) / REPEAT
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    # vérification pixel
+    m = make_manager(200)
+    screen.fill((40, 90, 160))
+    draw_circles(screen, m)
+    ref = pygame.image.tobytes(screen, "RGB")
+    screen.fill((40, 90, 160))
+    m.draw(screen, 0.0, 0, None)
+    same = pygame.image.tobytes(screen, "RGB") == ref
+
+    # pièces ramassées : leurs calques sont recuits
+    for i in range(0, 200, 7):
+        m.check_collect(m.xs[i], 0, m.ys[i] - m.y_offset, None)
+    screen.fill((40, 90, 160))
+    draw_circles(screen, m)
+    ref = pygame.image.tobytes(screen, "RGB")
+    screen.fill((40, 90, 160))
+    m.draw(screen, 0.0, 0, None)
+    same &= pygame.image.tobytes(screen, "RGB") == ref
+    print(f"Pixels sprite fixe vs cercles (avant / après ramassage) : {'identiques' if same else 'DIFFÉRENTS'}")
+
+    print(f"{'pièces':>7} | {'cercles (µs)':>12} | {'blits (µs)':>10} | {'blits 8 img (µs)':>16}")
+    for n in (2, 10, 50, 100, 200):
+        m = make_manager(n)
+        spin = make_manager(n, spin_frames=8)
+        t_old = timed(lambda: draw_circles(screen, m), screen)
+        t_new = timed(lambda: m.draw(screen, 0.0, 0, None), screen)
+        t_spin = timed(lambda: spin.draw(screen, 0.0, 0, None, time_s=1.3), screen)
+        print(f"{n:7d} | {t_old * 1e6:12.1f} | {t_new * 1e6:10.1f} | {t_spin * 1e6:16.1f}")
+
+    print("OK" if same else "ÉCHEC : rendu différent")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""
+Benchmark : pièces en liste de dicts (ancien) vs stockage trié en tableaux + fenêtre bisect.
+
+- Vérification : mêmes pièces ramassées, frame par frame, sur un parcours au ras du sol.
+- Temps par frame (update + check_collect + draw) à la densité actuelle (coin_every=500)
+  et en dispositions denses (x10, x50).
+
+Usage (depuis la racine du projet) :
+    python bench/bench_collectibles.py
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame  # noqa: E402
+
+from collectibles import CollectibleManager  # noqa: E402
+from terrain import Terrain  # noqa: E402
+
+WIDTH, HEIGHT = 900, 600
+PLAYER_X = 250
+Y_OFFSET = 45
+DT = 1.0 / 60
+SPEED = 420.0
+FRAMES = 3000
+
+
+class ListCollectibles:
+    """Ancienne version : liste de dicts, hauteur relue dans le terrain à chaque frame."""
+
+    def __init__(self, width, height, y_offset=40):
+        self.width = width
+        self.height = height
+        self.y_offset = y_offset
+        self.items = []
+        self.next_spawn_wx = 800.0
+
+    def update(self, distance_world, player_x_screen, terrain):
+        horizon = distance_world + 2500
+        if self.next_spawn_wx < horizon:
+            for tx in terrain.coins_between(self.next_spawn_wx + player_x_screen,
+                                            horizon + player_x_screen):
+                self.items.append({"wx": tx - player_x_screen, "taken": False})
+            self.next_spawn_wx = horizon
+
+        cutoff = distance_world - 2000
+        if len(self.items) > 0 and self.items[0]["wx"] < cutoff:
+            self.items = [it for it in self.items if it["wx"] >= cutoff]
+
+    def draw(self, screen, distance_world, player_x_screen, terrain):
+        for it in self.items:
+            if it["taken"]:
+                continue
+            x_screen = player_x_screen + (it["wx"] - distance_world)
+            if x_screen < -50 or x_screen > self.width + 50:
+                continue
+            y = terrain.get_height_screen_x(x_screen) - self.y_offset
+            pygame.draw.circle(screen, (255, 215, 0), (int(x_screen), int(y)), 10)
+            pygame.draw.circle(screen, (255, 240, 150), (int(x_screen), int(y)), 6)
+
+    def check_collect(self, distance_world, player_x_screen, player_y, terrain, collect_radius=18):
+        got = 0
+        for it in self.items:
+            if it["taken"]:
+                continue
+            x_screen = player_x_screen + (it["wx"] - distance_world)
+            if x_screen < -50 or x_screen > self.width + 50:
+                continue
+            y = terrain.get_height_screen_x(x_screen) - self.y_offset
+            dx = x_screen - player_x_screen
+            dy = y - player_y
+            if dx*dx + dy*dy <= collect_radius*collect_radius:
+                it["taken"] = True
+                got += 1
+        return got
+
+
+def run(cls, coin_every, screen, log=None):
+    """Parcours au ras du sol (ramasse les pièces). Retourne (temps/frame, pièces)."""
+    terrain = Terrain(WIDTH, HEIGHT, dx=14, base_y_ratio=0.65, seed=3, coin_every=coin_every)
+    coins = cls(WIDTH, HEIGHT, y_offset=Y_OFFSET)
+    distance = 0.0
+    total = 0
+    spent = 0.0
+    for _ in range(FRAMES):
+        distance += SPEED * DT
+        terrain.update_scroll(SPEED * DT)
+        player_y = terrain.get_height_screen_x(PLAYER_X) - Y_OFFSET
+
+        t0 = time.perf_counter()
+        coins.update(distance, PLAYER_X, terrain)
+        got = coins.check_collect(distance, PLAYER_X, player_y, terrain)
+        coins.draw(screen, distance, PLAYER_X, terrain)
+        spent += time.perf_counter() - t0
+
+        total += got
+        if log is not None:
+            log.append(got)
+    return spent / FRAMES, total
+
+
+def main():
+    pygame.init()
+    screen = pygame.Surface((WIDTH, HEIGHT))
+
+    ok = True
+    print(f"{'coin_every':>10} | {'liste (µs/frame)':>16} | {'tableaux (µs/frame)':>19} | gain | pièces")
+    for coin_every in (500, 50, 10):
+        log_old, log_new = [], []
+        t_old, n_old = run(ListCollectibles, coin_every, screen, log_old)
+        t_new, n_new = run(CollectibleManager, coin_every, screen, log_new)
+        same = log_old == log_new
+        ok &= same
+        print(f"{coin_every:10d} | {t_old * 1e6:16.1f} | {t_new * 1e6:19.1f} | "
+              f"x{t_old / t_new:.1f} | {n_new} {'(identiques)' if same else f'(ancien : {n_old}) DIFFÉRENT'}")
+
+    print("OK" if ok else "ÉCHEC : ramassage différent")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
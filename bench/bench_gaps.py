@@ -0,0 +1,122 @@
+"""
+bench_gaps.py — Index de trous (GapIndex) vs ancien parcours linéaire de la liste
+
+1) Vérification : sur une longue séquence de trous aléatoires (paramètres qui varient
+   comme en phase 3), height_at_world et height_at_world_many doivent donner exactement
+   les mêmes hauteurs que l'ancienne implémentation (liste + parcours complet).
+2) Mesure : coût d'une requête de hauteur selon le nombre de trous actifs.
+
+Usage (depuis la racine du projet) :
+    python bench/bench_gaps.py
+"""
+
+import math
+import os
+import random
+import sys
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import numpy as np  # noqa: E402
+from terrain import Terrain  # noqa: E402
+
+
+def legacy_height(terrain: Terrain, gaps, world_x: float) -> float:
+    """Ancien height_at_world : parcours de toute la liste de trous."""
+    normal_y = terrain.base_y
+    for amp, freq in terrain.waves:
+        normal_y += amp * math.sin(world_x * freq)
+
+    if terrain.gaps_enabled:
+        hole_y = terrain.height + 250
+        for a, b in gaps:
+            r = terrain.gap_ramp
+            if a - r <= world_x < a:
+                t = (world_x - (a - r)) / r
+                return normal_y * (1 - t) + hole_y * t
+            if a <= world_x <= b:
+                return hole_y
+            if b < world_x <= b + r:
+                t = (world_x - b) / r
+                return hole_y * (1 - t) + normal_y * t
+    return normal_y
+
+
+def legacy_prune(gaps, cutoff: float):
+    """Ancien nettoyage : reconstruction de la liste."""
+    return [(a, b) for (a, b) in gaps if b >= cutoff]
+
+
+def spawn_gaps(terrain: Terrain, rng: random.Random, next_x: float, max_x: float) -> float:
+    """Séquence de trous aléatoires (ancien tirage : espacement et largeur ± 30 %)."""
+    while next_x < max_x:
+        width = rng.uniform(terrain.gap_width * 0.7, terrain.gap_width * 1.3)
+        terrain.gaps.append((next_x, next_x + width))
+        next_x += rng.uniform(terrain.gap_every * 0.7, terrain.gap_every * 1.3)
+    return next_x
+
+
+def verify(seed: int, steps: int = 4000) -> int:
+    """Compare nouvelle et ancienne implémentation, retourne le nombre de hauteurs vérifiées."""
+    rng = random.Random(seed)
+    terrain = Terrain(900, 600, dx=14, base_y_ratio=0.65, seed=seed)
+    terrain.gaps_enabled = True
+    terrain.gaps.clear()
+    next_x = 0.0
+    checked = 0
+
+    for step in range(steps):
+        t3 = step / steps
+        terrain.gap_every = 1800.0 - 900.0 * t3
+        terrain.gap_width = 140.0 + 140.0 * t3
+        terrain.gap_ramp = rng.choice([160.0, 200.0, 240.0, 260.0])
+        terrain.world_x0 = step * 60.0
+
+        next_x = spawn_gaps(terrain, rng, next_x, terrain.world_x0 + 3000.0)
+        gaps_ref = legacy_prune(list(terrain.gaps), terrain.world_x0 - 2000.0)
+        terrain.gaps.prune(terrain.world_x0 - 2000.0)
+        assert gaps_ref == list(terrain.gaps), f"gaps divergent (seed={seed}, step={step})"
+
+        xs = [terrain.world_x0 + rng.uniform(-2500.0, 4000.0) for _ in range(24)]
+        # points exacts sur les bords (là où les arrondis comptent)
+        for a, b in gaps_ref[:3]:
+            r = terrain.gap_ramp
+            xs += [a - r, a, b, b + r, math.nextafter(b + r, math.inf), math.nextafter(a - r, -math.inf)]
+
+        ref = [legacy_height(terrain, gaps_ref, x) for x in xs]
+        got = [terrain.height_at_world(x) for x in xs]
+        assert got == ref, f"height_at_world divergent (seed={seed}, step={step})"
+
+        many = terrain.height_at_world_many(np.array(xs * 2)).tolist()
+        assert many == ref * 2, f"height_at_world_many divergent (seed={seed}, step={step})"
+        checked += 3 * len(xs)
+
+    return checked
+
+
+def main() -> None:
+    checked = sum(verify(seed) for seed in range(5))
+    print(f"vérification OK : {checked} hauteurs identiques à l'ancienne implémentation\n")
+
+    print(f"{'gaps':>5} {'liste (us)':>11} {'index (us)':>11} {'speedup':>8}")
+    for n_gaps in (4, 8, 32, 128):
+        terrain = Terrain(900, 600, dx=14, base_y_ratio=0.65, seed=7)
+        terrain.gaps_enabled = True
+        terrain.gap_every = 900.0
+        terrain.gaps.clear()
+        spawn_gaps(terrain, random.Random(7), 0.0, 900.0 * n_gaps)
+        gaps_ref = list(terrain.gaps)
+        xs = [x * 7.3 for x in range(len(gaps_ref) * 100)]
+
+        number = 3
+        t_ref = min(timeit.repeat(lambda: [legacy_height(terrain, gaps_ref, x) for x in xs],
+                                  number=number, repeat=3)) / number / len(xs)
+        t_new = min(timeit.repeat(lambda: [terrain.height_at_world(x) for x in xs],
+                                  number=number, repeat=3)) / number / len(xs)
+        print(f"{len(gaps_ref):>5} {t_ref * 1e6:>11.2f} {t_new * 1e6:>11.2f} {t_ref / t_new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+bench_generation_budget.py — Pics de génération de terrain : synchrone vs file + budget (pump)
+
+Scroll scripté avec pics de dt (x20 toutes les 120 frames, comme un changement d'onglet).
+Mesure le pire temps de update_scroll par frame, avec et sans pump() en fin de frame,
+et affiche les compteurs de génération (échantillons en file / générés / forcés).
+Difficulté variable pendant le scroll : les chunks figés doivent être identiques avec
+ou sans pump, quel que soit le budget (paramètres capturés à la mise en file).
+
+Usage (depuis la racine du projet) :
+    python bench/bench_generation_budget.py
+"""
+
+import hashlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from terrain import Terrain  # noqa: E402
+
+FRAMES = 6000
+BUDGET_S = 0.001
+
+
+def run(budget_s):
+    """budget_s None : génération synchrone seulement. Retourne (pire, moyenne, compteurs, empreintes)."""
+    terrain = Terrain(900, 600, dx=14, base_y_ratio=0.65, seed=5)
+    terrain.gaps_enabled = True
+    worst = 0.0
+    total = 0.0
+    prints = {}
+    for f in range(FRAMES):
+        # difficulté qui change en continu (comme Simulation._apply_difficulty)
+        terrain.set_biome(f / FRAMES)
+        terrain.gap_every = 2200.0 - f * 0.2
+        speed = 120.0 if f % 120 == 0 else 6.0
+        t0 = time.perf_counter()
+        terrain.update_scroll(speed)
+        dt = time.perf_counter() - t0
+        worst = max(worst, dt)
+        total += dt
+        if budget_s is not None:
+            terrain.pump(budget_s)
+        for c, chunk in terrain.chunk_state()[0].items():
+            if c not in prints:
+                prints[c] = hashlib.sha1(chunk.ys.tobytes()).hexdigest()
+    return worst * 1e6, total / FRAMES * 1e6, terrain.gen_stats, prints
+
+
+def main() -> int:
+    ref = None
+    ok = True
+    for label, budget_s in (("synchrone        ", None), ("file + pump(1 ms)", BUDGET_S),
+                            ("file + pump(0)   ", 0.0), ("file + pump(1 s) ", 1.0)):
+        worst, mean, stats, prints = run(budget_s)
+        same = "-"
+        if ref is None:
+            ref = prints
+        else:
+            common = set(ref) & set(prints)
+            ok &= bool(common) and all(ref[c] == prints[c] for c in common)
+            same = "identiques" if ok else "DIFFÉRENTS"
+        print(f"{label} : pire frame {worst:7.1f} us, moyenne {mean:5.1f} us, chunks {same}, "
+              f"compteurs {stats}")
+    print("OK" if ok else "ÉCHEC : le contenu des chunks dépend du budget de génération")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
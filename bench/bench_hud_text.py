@@ -0,0 +1,77 @@
+"""
+Benchmark : HUD (Score / Coins / Level), font.render à chaque frame (ancien)
+vs cache de textes + chiffres composés glyphe par glyphe (UI.text / UI.draw_number).
+
+- Rendus font.render par frame (compteurs UI.frame_renders) sur une partie simulée
+  où le score change à chaque frame.
+- Temps du HUD par frame, avant / après.
+
+Usage (depuis la racine du projet) :
+    python bench/bench_hud_text.py
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame  # noqa: E402
+
+from ui import UI  # noqa: E402
+
+WIDTH, HEIGHT = 900, 600
+FRAMES = 5000
+BLACK = (10, 10, 10)
+
+
+def hud_render(ui, screen, score, coins, level):
+    """Ancien HUD : trois font.render par frame."""
+    surf = ui.font.render(f"Score: {int(score)}", True, BLACK)
+    screen.blit(surf, (12, 10))
+    coins_txt = ui.font.render(f"Coins: {coins}", True, BLACK)
+    screen.blit(coins_txt, (12, 40))
+    level_txt = ui.font.render(f"Level: {level}", True, BLACK)
+    screen.blit(level_txt, (12, 95))
+    return 3
+
+
+def hud_cached(ui, screen, score, coins, level):
+    ui.begin_frame()
+    ui.draw_hud(screen, score, 0.0, "SOL", False)
+    screen.blit(ui.text(ui.font, f"Coins: {coins}", BLACK), (12, 40))
+    screen.blit(ui.text(ui.font, f"Level: {level}", BLACK), (12, 95))
+    return ui.frame_renders
+
+
+def run(ui, screen, hud):
+    """Partie simulée : score +7 par frame, une pièce toutes les 90 frames."""
+    renders = []
+    t0 = time.perf_counter()
+    for f in range(FRAMES):
+        score = 7.3 * f
+        coins = f // 90
+        level = 1 + min(2, f // 2000)
+        renders.append(hud(ui, screen, score, coins, level))
+    return (time.perf_counter() - t0) / FRAMES, renders
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    t_old, r_old = run(UI(), screen, hud_render)
+    ui = UI()
+    t_new, r_new = run(ui, screen, hud_cached)
+
+    print(f"font.render / frame : avant {sum(r_old) / FRAMES:.2f}, après {sum(r_new) / FRAMES:.4f} "
+          f"(max {max(r_new)}, {sum(1 for r in r_new if r)} frames sur {FRAMES} avec un rendu)")
+    print(f"cache : {len(ui._text_cache)} entrées, {ui.cache_hits} hits, {ui.render_count} rendus")
+    print(f"HUD : avant {t_old * 1e6:.1f} µs/frame, après {t_new * 1e6:.1f} µs/frame "
+          f"(x{t_old / t_new:.1f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+Benchmark : voile de nuit, Surface SRCALPHA allouée à chaque frame (ancien) vs
+overlay alloué une fois et blitté par zone (UI.draw_night).
+
+- Vérification pixel à pixel (sans bord dégradé).
+- Temps par frame pour différentes positions du front de nuit (driver vidéo dummy),
+  plus la variante Surface sans alpha par pixel (set_alpha) et le bord dégradé.
+
+Usage (depuis la racine du projet) :
+    python bench/bench_night_overlay.py
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame  # noqa: E402
+
+from ui import NIGHT_COLOR, UI  # noqa: E402
+
+WIDTH, HEIGHT = 900, 600
+REPEAT = 300
+FRONTS = [60, 250, 600, 900]
+
+
+def night_alloc(screen, night_screen_x):
+    """Ancien rendu (run())."""
+    if night_screen_x > 0:
+        w = int(min(night_screen_x, WIDTH))
+        overlay = pygame.Surface((w, HEIGHT), pygame.SRCALPHA)
+        overlay.fill(NIGHT_COLOR)
+        screen.blit(overlay, (0, 0))
+
+
+def timed(fn):
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    return (time.perf_counter() - t0) / REPEAT
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    background = pygame.image.load(os.path.join(os.path.dirname(__file__), "..", "assets",
+                                                "images", "background.jpg")).convert()
+    background = pygame.transform.scale(background, (WIDTH, HEIGHT))
+    ui = UI()
+
+    # pixels
+    same = True
+    for x in FRONTS + [0, 333.7]:
+        screen.blit(background, (0, 0))
+        night_alloc(screen, x)
+        ref = pygame.image.tobytes(screen, "RGB")
+        screen.blit(background, (0, 0))
+        ui.draw_night(screen, x)
+        same &= pygame.image.tobytes(screen, "RGB") == ref
+    print(f"Pixels vs ancien rendu : {'identiques' if same else 'DIFFÉRENTS'}")
+
+    # variante set_alpha (pas d'alpha par pixel)
+    r, g, b, a = NIGHT_COLOR
+    flat = pygame.Surface((WIDTH, HEIGHT)).convert()
+    flat.fill((r, g, b))
+    flat.set_alpha(a)
+
+    soft = UI()
+    print(f"{'front (px)':>10} | {'alloc (µs)':>10} | {'réutilisé (µs)':>14} | {'set_alpha (µs)':>14} "
+          f"| {'+ dégradé 32 px (µs)':>20} | gagné (µs)")
+    for x in FRONTS:
+        t_old = timed(lambda: night_alloc(screen, x))
+        t_new = timed(lambda: ui.draw_night(screen, x))
+        t_flat = timed(lambda: screen.blit(flat, (0, 0), (0, 0, x, HEIGHT)))
+        t_soft = timed(lambda: soft.draw_night(screen, x, soft_edge=32))
+        print(f"{x:10d} | {t_old * 1e6:10.1f} | {t_new * 1e6:14.1f} | {t_flat * 1e6:14.1f} "
+              f"| {t_soft * 1e6:20.1f} | {(t_old - t_new) * 1e6:9.1f}")
+
+    print("OK" if same else "ÉCHEC : rendu différent")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""
+Benchmark : physique en lot (PlayerBatch, NumPy) vs N Player.update (scalaire).
+
+- Vérification : N billes aux réglages différents, inputs aléatoires, trous activés ;
+  PlayerBatch + GroundBatch doit donner le même état que N Player (swept=False) sur
+  N Terrain. Le jeu tourne en swept=True : pour lui, les résultats du lot sont approchés
+  (cf. player_batch.py et bench/check_swept_collision.py).
+- Débit en billes·pas par seconde selon la taille du lot.
+
+Usage (depuis la racine du projet) :
+    python bench/bench_player_batch.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import numpy as np  # noqa: E402
+
+from player import Player  # noqa: E402
+from player_batch import GroundBatch, PlayerBatch  # noqa: E402
+from terrain import Terrain  # noqa: E402
+
+WIDTH, HEIGHT = 900, 600
+SEED = 7
+DT = 1.0 / 120
+WAVES = [(70, 0.010), (35, 0.020), (15, 0.040)]
+
+
+def make_terrain() -> Terrain:
+    t = Terrain(WIDTH, HEIGHT, dx=14, base_y_ratio=0.65, waves=WAVES, seed=SEED)
+    t.gaps_enabled = True
+    t.gap_every = 3000.0
+    t.gap_width = 90.0
+    t.gap_ramp = 260.0
+    return t
+
+
+def tunings(n: int, rng: random.Random):
+    return {
+        "boost_gain": [rng.uniform(0.3, 0.9) for _ in range(n)],
+        "uphill_drag": [rng.uniform(200.0, 450.0) for _ in range(n)],
+        "jump_decay": [rng.uniform(0.6, 0.9) for _ in range(n)],
+        "boost_push": [rng.uniform(150.0, 260.0) for _ in range(n)],
+    }
+
+
+def inputs(n: int, steps: int, rng: random.Random):
+    down = np.array([[rng.random() < 0.6 for _ in range(n)] for _ in range(steps)])
+    pressed = np.array([[rng.random() < 0.02 for _ in range(n)] for _ in range(steps)])
+    return down, pressed
+
+
+def run_scalar(n, steps, tune, down, pressed):
+    players, terrains = [], []
+    for i in range(n):
+        p = Player(250, 12)
+        p.keyboard_fallback = False
+        p.swept = False   # PlayerBatch reproduit le pas classique (Euler + test en fin de pas)
+        for name, vals in tune.items():
+            setattr(p, name, vals[i])
+        players.append(p)
+        terrains.append(make_terrain())
+
+    for s in range(steps):
+        for i, (p, t) in enumerate(zip(players, terrains)):
+            t.update_scroll(p.vx * DT)
+            p.boosting = bool(down[s, i])
+            p.action_pressed = bool(pressed[s, i])
+            p.update(DT, t)
+    return players
+
+
+def run_batch(n, steps, tune, down, pressed):
+    t = make_terrain()
+    batch = PlayerBatch(n, 250, 12, **tune)
+    ground = GroundBatch.from_terrain(t, n)
+    for s in range(steps):
+        batch.step(DT, ground, down[s], pressed[s])
+    return batch
+
+
+def verify():
+    n, steps = 48, 3000
+    rng = random.Random(0)
+    tune = tunings(n, rng)
+    down, pressed = inputs(n, steps, rng)
+
+    players = run_scalar(n, steps, tune, down, pressed)
+    batch = run_batch(n, steps, tune, down, pressed)
+
+    worst = 0.0
+    for name in ("y", "vx", "vy", "energy", "air_time", "impact_timer", "impact_strength"):
+        ref = np.array([getattr(p, name) for p in players])
+        worst = max(worst, float(np.max(np.abs(ref - getattr(batch, name)))))
+    same_state = [p.state for p in players] == batch.state.tolist()
+    same_jumps = [p.jump_count for p in players] == batch.jump_count.tolist()
+
+    print(f"Vérification ({n} billes x {steps} pas) : écart max = {worst:g}, "
+          f"états {'OK' if same_state else 'DIFFÉRENTS'}, sauts {'OK' if same_jumps else 'DIFFÉRENTS'}")
+    return worst == 0.0 and same_state and same_jumps
+
+
+def bench():
+    steps = 500
+    rng = random.Random(1)
+    print(f"{'billes':>7} | {'scalaire (billes·pas/s)':>24} | {'lot (billes·pas/s)':>20} | gain")
+    for n in (1, 10, 100, 1000, 10000):
+        tune = tunings(n, rng)
+        down, pressed = inputs(n, steps, rng)
+
+        t0 = time.perf_counter()
+        run_batch(n, steps, tune, down, pressed)
+        t_batch = time.perf_counter() - t0
+
+        if n <= 100:
+            t0 = time.perf_counter()
+            run_scalar(n, steps, tune, down, pressed)
+            t_scalar = time.perf_counter() - t0
+            scalar = n * steps / t_scalar
+            col = f"{scalar:24.0f}"
+            gain = f"x{t_scalar / t_batch:.1f}"
+        else:
+            col = f"{'-':>24}"
+            gain = ""
+        print(f"{n:7d} | {col} | {n * steps / t_batch:20.0f} | {gain}")
+
+
+def main():
+    ok = verify()
+    bench()
+    print("OK" if ok else "ÉCHEC : PlayerBatch diverge de Player")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
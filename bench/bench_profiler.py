@@ -0,0 +1,129 @@
+"""
+Benchmark : profilage par frame (profiler.FrameProfiler).
+
+- Coût de la frame (tick + rendu + flip, comme Game.run) : sans profiler, profiler
+  désactivé (appels vides), mesure active, mesure + overlay (indicatif : bruit de
+  quelques % d'une exécution à l'autre).
+- Surcoût désactivé, mesuré appel par appel : appels vides de Game.run par frame
+  (la simulation et le renderer ne reçoivent pas de profiler désactivé).
+- Somme des phases == temps de frame mesuré (aucun trou entre les laps).
+- Export CSV et JSON : relus, une ligne par frame, mêmes phases.
+
+Usage (depuis la racine du projet) :
+    python bench/bench_profiler.py
+"""
+
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame  # noqa: E402
+
+from profiler import FrameProfiler  # noqa: E402
+from render import FrameRenderer  # noqa: E402
+from ui import UI  # noqa: E402
+from world import World  # noqa: E402
+
+WIDTH, HEIGHT = 900, 600
+FRAMES = 1500
+SEED = 7
+GAME_CALLS_PER_FRAME = 9     # begin_frame + 7 laps + end_frame dans Game.run
+CALLS = 1_000_000
+
+
+def play(screen, background, prof, attach, overlay=False):
+    """FRAMES frames à 60 FPS (sans attente). Retourne le temps moyen par frame (µs)."""
+    world = World(WIDTH, HEIGHT, seed=SEED)
+    renderer = FrameRenderer(background, UI())
+    if attach:
+        world.sim.profiler = prof
+        renderer.profiler = prof
+    prof.visible = overlay
+
+    t0 = time.perf_counter()
+    for f in range(FRAMES):
+        prof.begin_frame()
+        prof.lap("events")
+        if world.game_over:
+            world = World(WIDTH, HEIGHT, seed=SEED)
+            if attach:
+                world.sim.profiler = prof
+        world.step(1.0 / 60, (f % 180) < 120, f % 45 == 0)
+        prof.lap("world")
+        renderer.draw(screen, world.sim, world.alpha)
+        if prof.visible:
+            prof.draw(screen)
+            prof.lap("profiler")
+        pygame.display.flip()
+        prof.lap("display.flip")
+        prof.end_frame()
+    return (time.perf_counter() - t0) / FRAMES * 1e6
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    background = pygame.transform.scale(
+        pygame.image.load("assets/images/background.jpg").convert(), (WIDTH, HEIGHT))
+    ok = True
+
+    runs = [
+        ("sans profiler", FrameProfiler(enabled=False), False, False),
+        ("désactivé", FrameProfiler(enabled=False), True, False),
+        ("mesure", FrameProfiler(enabled=True), True, False),
+        ("mesure + overlay", FrameProfiler(enabled=True), True, True),
+    ]
+    times = {}
+    play(screen, background, FrameProfiler(), False)   # échauffement
+    for name, prof, attach, overlay in runs:
+        # meilleur de 3 (bruit de la machine)
+        times[name] = min(play(screen, background, prof, attach, overlay) for _ in range(3))
+    base = times["sans profiler"]
+    for name, t in times.items():
+        print(f"{name:<17} : {t:8.1f} µs/frame ({(t / base - 1) * 100:+5.1f} %)")
+
+    off = FrameProfiler(enabled=False)
+    lap = off.lap
+    t0 = time.perf_counter()
+    for _ in range(CALLS):
+        lap("world")
+    per_call = (time.perf_counter() - t0) / CALLS * 1e6
+    overhead = per_call * GAME_CALLS_PER_FRAME
+    print(f"désactivé : {per_call * 1000:.0f} ns/appel, {overhead:.2f} µs/frame "
+          f"({overhead / base * 100:.3f} % de la frame)")
+    ok &= overhead < base * 0.005
+
+    prof = runs[2][1]
+    print(f"\nphases : {', '.join(prof.names)}")
+    p50, p99 = prof.percentiles()
+    print(f"frame : p50 {p50:.2f} ms, p99 {p99:.2f} ms")
+    sums = sum(prof._ring[name] for name in prof.names)
+    gap = float(abs(sums - prof._total).max())
+    print(f"somme des phases - total : {gap * 1000:.3f} µs max")
+    ok &= gap < 1e-6
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path_csv = os.path.join(tmp, "profile.csv")
+        path_json = os.path.join(tmp, "profile.json")
+        prof.export(path_csv)
+        prof.export(path_json)
+        with open(path_csv, "r", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        with open(path_json, "r", encoding="utf-8") as f:
+            doc = json.load(f)
+    ok &= rows[0] == ["frame", "total_ms"] + prof.names and len(rows) == 3 * FRAMES + 1
+    ok &= doc["frames"] == 3 * FRAMES and sorted(doc["sections"]) == sorted(prof.names)
+    print(f"export : CSV {len(rows) - 1} frames, JSON {doc['frames']} frames")
+
+    print("OK" if ok else "ÉCHEC")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""
+Benchmark : niveaux de qualité (quality.py) et gouverneur adaptatif.
+
+- Coût de rendu mesuré par niveau (draw + présentation dans une fenêtre 900x600,
+  driver vidéo dummy) : chaque niveau doit être moins cher que le précédent.
+- Gouverneur rejoué sur des temps de frame synthétiques tirés de ces coûts
+  (machine rapide, machine x9 plus lente, ralentissement temporaire) : niveau final,
+  journal des changements, et nombre de changements sans hystérésis pour comparaison.
+
+Usage (depuis la racine du projet) :
+    python bench/bench_quality_governor.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame  # noqa: E402
+
+import quality  # noqa: E402
+from quality import QUALITY_LEVELS, QualityGovernor  # noqa: E402
+from render import FrameRenderer, Viewport  # noqa: E402
+from simulation import SIM_HZ, FixedStep, Simulation  # noqa: E402
+from ui import UI  # noqa: E402
+
+WIDTH, HEIGHT = 900, 600
+SEED = 5
+FRAMES = 600
+TRACE_FRAMES = 7200      # 2 min à 60 FPS
+SIM_MS = 0.6             # simulation + événements (hors rendu), ms sur cette machine
+
+
+def play(i: int):
+    """Boost tenu 1 s sur 1,5 s, tap toutes les 0,75 s."""
+    return (i % 180) < 120, (i % 90) == 0
+
+
+def level_cost(background, level):
+    """Temps moyen (ms) de rendu + présentation d'une frame au niveau donné."""
+    window = pygame.display.set_mode((WIDTH, HEIGHT))
+    viewport = Viewport(WIDTH, HEIGHT, level.render_scale)
+    viewport.fit(window)
+    renderer = FrameRenderer(background, UI())
+    renderer.set_scale(viewport.scale)
+    renderer.set_quality(level)
+
+    sim = Simulation(WIDTH, HEIGHT, seed=SEED)
+    stepper = FixedStep(SIM_HZ)
+    spent = 0.0
+    for _ in range(FRAMES):
+        for _ in range(stepper.advance(1.0 / 60)):
+            sim.tick(stepper.dt, *play(sim.ticks))
+        t0 = time.perf_counter()
+        renderer.draw(viewport.surface, sim, stepper.alpha)
+        viewport.present()
+        spent += time.perf_counter() - t0
+    return spent / FRAMES * 1000.0
+
+
+def trace(costs, slowdown, seed):
+    """Générateur de temps de frame (ms) : coût du niveau x lenteur(frame), bruit + pics."""
+    rng = random.Random(seed)
+
+    def frame_ms(frame, index):
+        k = slowdown(frame)
+        ms = (costs[index] + SIM_MS) * k * rng.uniform(0.9, 1.15)
+        if rng.random() < 0.02:
+            ms *= 2.5      # GC, onglet, etc.
+        return ms
+    return frame_ms
+
+
+def replay(frame_ms, hysteresis=True):
+    """Gouverneur sur TRACE_FRAMES frames. Retourne (gouverneur, niveau par frame)."""
+    saved = (quality.UP_RATIO, quality.UP_HOLD_FRAMES)
+    if not hysteresis:
+        quality.UP_RATIO, quality.UP_HOLD_FRAMES = quality.DOWN_RATIO, 0
+    try:
+        gov = QualityGovernor(60.0)
+        levels = []
+        for frame in range(TRACE_FRAMES):
+            gov.update(frame_ms(frame, gov.index))
+            levels.append(gov.index)
+    finally:
+        quality.UP_RATIO, quality.UP_HOLD_FRAMES = saved
+    return gov, levels
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    background = pygame.image.load(os.path.join(os.path.dirname(__file__), "..", "assets",
+                                                "images", "background.jpg")).convert()
+
+    print("Coût de rendu par niveau :")
+    costs = []
+    for level in QUALITY_LEVELS:
+        costs.append(level_cost(background, level))
+        print(f"  {level.name:>8} : {costs[-1] * 1000:7.1f} µs/frame  {level}")
+    ok = all(b < a for a, b in zip(costs, costs[1:]))
+
+    scenarios = [
+        ("machine rapide", lambda f: 1.0),
+        ("machine x9 plus lente", lambda f: 9.0),
+        ("ralentie x12 de 30 s à 70 s", lambda f: 12.0 if 1800 <= f < 4200 else 1.0),
+    ]
+    print()
+    for name, slowdown in scenarios:
+        gov, levels = replay(trace(costs, slowdown, 0))
+        _, levels_raw = replay(trace(costs, slowdown, 0), hysteresis=False)
+        flips_raw = sum(a != b for a, b in zip(levels_raw, levels_raw[1:]))
+        print(f"{name} : niveau final {gov.level.name}, {len(gov.changes)} changements "
+              f"(sans hystérésis : {flips_raw})")
+        for frame, before, after, p in gov.changes:
+            print(f"    frame {frame:5d} : {before} -> {after} (p{quality.PERCENTILE} = {p:.1f} ms)")
+
+    print("OK" if ok else "ÉCHEC : niveaux non ordonnés par coût")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Benchmark : résolution de rendu interne (Viewport + FrameRenderer.set_scale).
+
+- Temps par frame (rendu à l'échelle + agrandissement dans la fenêtre 900x600) pour
+  plusieurs échelles internes, driver vidéo dummy, agrandissement CPU (transform.scale).
+  L'agrandissement par SDL (fenêtre pygame.SCALED, défaut de main.py) se fait sur le
+  GPU / le canvas et ne se mesure pas avec le driver dummy.
+- Redimensionnement : tailles de fenêtre successives, sans recharger l'image de fond.
+
+Usage (depuis la racine du projet) :
+    python bench/bench_render_scale.py
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame  # noqa: E402
+
+from render import FrameRenderer, Viewport  # noqa: E402
+from simulation import SIM_HZ, FixedStep, Simulation  # noqa: E402
+from ui import UI  # noqa: E402
+
+WIDTH, HEIGHT = 900, 600
+SEED = 5
+FRAMES = 900
+SCALES = [1.0, 0.75, 0.5]
+WINDOWS = [(900, 600), (1280, 720), (640, 480), (900, 600)]
+
+
+def play(i: int):
+    """Boost tenu 1 s sur 1,5 s, tap toutes les 0,75 s."""
+    return (i % 180) < 120, (i % 90) == 0
+
+
+def run(background, scale):
+    """Partie seedée rendue à l'échelle scale et présentée dans la fenêtre : temps moyen par frame."""
+    window = pygame.display.set_mode((WIDTH, HEIGHT))
+    viewport = Viewport(WIDTH, HEIGHT, scale)
+    viewport.fit(window)
+    renderer = FrameRenderer(background, UI())
+    renderer.set_scale(viewport.scale)
+
+    sim = Simulation(WIDTH, HEIGHT, seed=SEED)
+    stepper = FixedStep(SIM_HZ)
+    spent = 0.0
+    for _ in range(FRAMES):
+        for _ in range(stepper.advance(1.0 / 60)):
+            sim.tick(stepper.dt, *play(sim.ticks))
+        t0 = time.perf_counter()
+        renderer.draw(viewport.surface, sim, stepper.alpha)
+        viewport.present()
+        spent += time.perf_counter() - t0
+    return spent / FRAMES
+
+
+def resize(background):
+    """Fenêtres successives : échelles et tailles de cible, image de fond jamais rechargée."""
+    loads = [0]
+    load = pygame.image.load
+
+    def counting_load(*args, **kwargs):
+        loads[0] += 1
+        return load(*args, **kwargs)
+
+    pygame.image.load = counting_load
+    try:
+        viewport = Viewport(WIDTH, HEIGHT, 0.75)
+        renderer = FrameRenderer(background, UI())
+        sim = Simulation(WIDTH, HEIGHT, seed=SEED)
+        for size in WINDOWS:
+            window = pygame.display.set_mode(size)
+            if viewport.fit(window):
+                renderer.set_scale(viewport.scale)
+            renderer.draw(viewport.surface, sim, 0.0)
+            viewport.present()
+            print(f"  fenêtre {size[0]}x{size[1]} -> rendu {viewport.surface.get_width()}x"
+                  f"{viewport.surface.get_height()} (échelle {viewport.scale:.3f}), image {viewport.dest.size}")
+    finally:
+        pygame.image.load = load
+    return loads[0]
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    background = pygame.image.load(os.path.join(os.path.dirname(__file__), "..", "assets",
+                                                "images", "background.jpg")).convert()
+
+    print(f"{'échelle':>7} | {'rendu + transform.scale (µs/frame)':>34}")
+    for scale in SCALES:
+        t = run(background, scale)
+        print(f"{scale:7.2f} | {t * 1e6:34.1f}")
+
+    print("Redimensionnement :")
+    loads = resize(background)
+    print(f"  images rechargées : {loads}")
+    ok = loads == 0
+
+    print("OK" if ok else "ÉCHEC")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
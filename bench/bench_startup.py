@@ -0,0 +1,124 @@
+"""
+Benchmark : démarrage du jeu (assets.py, tools/build_assets.py).
+
+Chaque mesure est un processus neuf (python -c, comme un lancement réel, imports
+compris) qui crée Game et fait tourner sa boucle jusqu'à la première frame affichée
+et la fin du chargement des assets. Temps depuis le début du processus :
+- première frame interactive (Game.t_first_frame), et depuis la création de Game
+  (sans les imports, qui ne dépendent pas des assets et varient beaucoup),
+- assets tous chargés (Assets.t_done), temps de chargement par asset.
+Modes : fichiers d'origine chargés avant la première frame (lancement d'avant le
+pipeline), fichiers d'origine en différé, fichiers du pipeline en différé ; plus les
+octets à charger par plateforme (téléchargement web).
+
+Usage (depuis la racine du projet) :
+    python bench/bench_startup.py
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+RUNS = 7
+
+# Processus mesuré : t = 0 avant tout import
+CHILD = r"""
+import time
+T0 = time.perf_counter()
+import asyncio, json, sys
+sys.path.insert(0, "src")
+import main
+
+async def measure():
+    t_import = time.perf_counter()
+    game = main.Game()
+
+    async def stop():
+        while game.t_first_frame is None or not game.assets.done:
+            await asyncio.sleep(0)
+        game.running = False
+
+    await asyncio.gather(game.run(), stop())
+    print(json.dumps({
+        "import_s": t_import - T0,
+        "first_frame_s": game.t_first_frame - T0,
+        "game_s": game.t_first_frame - game.t_created,
+        "ready_s": max(game.t_first_frame, game.assets.t_done) - T0,
+        "game_ready_s": max(game.t_first_frame, game.assets.t_done) - game.t_created,
+        "load_s": game.assets.load_s,
+    }))
+
+asyncio.run(measure())
+"""
+
+
+def build_manifest(out_dir):
+    """Assets préparés par le pipeline dans out_dir ; retourne le chemin du manifest."""
+    subprocess.run([sys.executable, os.path.join("tools", "build_assets.py"), "--out", out_dir],
+                   cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+    return os.path.join(out_dir, "manifest.json")
+
+
+def measure(manifest, loading, runs=RUNS):
+    """runs lancements (manifest "" : fichiers d'origine ; loading : lazy / eager) -> liste de dicts."""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1", TINYWINGS_ASSET_MANIFEST=manifest,
+               TINYWINGS_ASSETS=loading)
+    for key in ("TINYWINGS_RECORD", "TINYWINGS_REPLAY", "TINYWINGS_PROFILE_OUT"):
+        env.pop(key, None)
+    out = []
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, "-c", CHILD], cwd=ROOT, env=env, check=True,
+                              capture_output=True, text=True)
+        out.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return out
+
+
+def asset_bytes(manifest_path):
+    """Octets à charger par plateforme : d'origine, et après le pipeline."""
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        assets = json.load(f)["assets"]
+    source = sum(a["source_bytes"] for a in assets.values())
+    built = {p: sum(a["bytes"][p] for a in assets.values()) for p in ("desktop", "web")}
+    return source, built
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest = build_manifest(tmp)
+        modes = {
+            "origine, immédiat": ("", "eager"),
+            "origine, différé": ("", "lazy"),
+            "pipeline, différé": (manifest, "lazy"),
+        }
+        print(f"{'mode':<20} | {'imports (ms)':>12} | {'1re frame (ms)':>14} | {'dont Game':>9} | "
+              f"{'assets (ms)':>11} | chargement par asset (ms)")
+        first = {}
+        for label, (path, loading) in modes.items():
+            runs = measure(path, loading)
+            med = {k: statistics.median(r[k] for r in runs)
+                   for k in ("import_s", "first_frame_s", "game_s", "ready_s")}
+            per_asset = ", ".join(f"{name} {statistics.median(r['load_s'][name] for r in runs) * 1000:.1f}"
+                                  for name in runs[0]["load_s"])
+            first[label] = med["game_s"]
+            print(f"{label:<20} | {med['import_s'] * 1000:12.1f} | {med['first_frame_s'] * 1000:14.1f} | "
+                  f"{med['game_s'] * 1000:9.1f} | {med['ready_s'] * 1000:11.1f} | {per_asset}")
+
+        source, built = asset_bytes(manifest)
+        print(f"octets des assets : origine {source / 1024:.0f} k, "
+              + ", ".join(f"{p} {n / 1024:.0f} k" for p, n in built.items()))
+
+    gain = first["origine, immédiat"] - first["pipeline, différé"]
+    print(f"1re frame (depuis Game) : {gain * 1000:.1f} ms plus tôt qu'avec le chargement d'origine "
+          f"({first['pipeline, différé'] / first['origine, immédiat']:.0%} du temps)")
+    ok = gain > 0
+    print("OK" if ok else "ÉCHEC")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""
+bench_terrain_draw.py — Rendu du terrain (polygon) selon le niveau de qualité
+
+Coût par frame de terrain + bg_terrain (mêmes réglages que main.py) pour chaque niveau
+de quality.QUALITY_LEVELS (détail, contour, échelle), sous le driver vidéo dummy :
+médiane de RUNS mesures alternées. Vérifie que le niveau 0 (rendu d'origine) donne
+exactement l'image du polygon d'origine (Terrain.points).
+
+Usage (depuis la racine du projet) :
+    python bench/bench_terrain_draw.py
+"""
+
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame  # noqa: E402
+from quality import QUALITY_LEVELS  # noqa: E402
+from terrain import Terrain  # noqa: E402
+
+WIDTH, HEIGHT = 900, 600
+GROUND = (70, 190, 110)
+OUTLINE = (10, 60, 25)
+BG_GROUND = (60, 120, 90)
+SKY = (180, 210, 240)
+FRAMES = 2000
+RUNS = 7
+
+
+def draw_polygon(screen, terrain: Terrain, color_ground, color_outline=None) -> None:
+    """Terrain.draw d'origine : polygon + lines sur tous les points du buffer."""
+    pts = terrain.points
+    poly = pts + [[pts[-1][0], terrain.height], [pts[0][0], terrain.height]]
+    pygame.draw.polygon(screen, color_ground, poly)
+    if color_outline is not None:
+        pygame.draw.lines(screen, color_outline, False, pts, 3)
+
+
+def draw_level(level):
+    """Terrain.draw avec les réglages d'un niveau de qualité (parallaxe comprise)."""
+    def draw(screen, terrain: Terrain, color_ground, color_outline=None) -> None:
+        if color_outline is None and not level.parallax:
+            return
+        terrain.draw(screen, color_ground, color_outline, scale=level.render_scale,
+                     detail=level.terrain_detail, outline_width=level.outline_width)
+    return draw
+
+
+def make_terrains():
+    terrain = Terrain(WIDTH, HEIGHT, dx=14, base_y_ratio=0.65, seed=3)
+    terrain.gaps_enabled = True
+    terrain.gap_every = 1400.0
+
+    bg_terrain = Terrain(WIDTH, HEIGHT, dx=30, base_y_ratio=0.65, waves=[(35, 0.006), (18, 0.012)])
+    return terrain, bg_terrain
+
+
+def run(screen, draw_fn, speed: float = 5.0):
+    """Temps moyen de dessin par frame (µs), scroll hors mesure."""
+    terrain, bg_terrain = make_terrains()
+    total = 0.0
+    for _ in range(FRAMES):
+        bg_terrain.update_scroll(speed * 0.5)
+        terrain.update_scroll(speed)
+        screen.fill(SKY)
+        t0 = time.perf_counter()
+        draw_fn(screen, bg_terrain, BG_GROUND, None)
+        draw_fn(screen, terrain, GROUND, OUTLINE)
+        total += time.perf_counter() - t0
+    return total / FRAMES * 1e6
+
+
+def same_as_polygon(screen) -> bool:
+    """Niveau 0 : même image que le polygon d'origine, sur la même frame."""
+    terrain, bg_terrain = make_terrains()
+    for _ in range(300):
+        bg_terrain.update_scroll(2.5)
+        terrain.update_scroll(5.0)
+
+    draw = draw_level(QUALITY_LEVELS[0])
+    screen.fill(SKY)
+    draw(screen, bg_terrain, BG_GROUND, None)
+    draw(screen, terrain, GROUND, OUTLINE)
+    a = screen.copy()
+
+    screen.fill(SKY)
+    draw_polygon(screen, bg_terrain, BG_GROUND, None)
+    draw_polygon(screen, terrain, GROUND, OUTLINE)
+
+    mask = pygame.mask.from_threshold(a, (0, 0, 0), (1, 1, 1, 255), screen, 1)
+    return mask.count() == WIDTH * HEIGHT
+
+
+def main() -> int:
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    same = same_as_polygon(screen)
+    print(f"niveau 0 vs polygon d'origine : {'identique' if same else 'DIFFÉRENT'}")
+
+    fns = [("polygon d'origine", draw_polygon)] + [(q.name, draw_level(q)) for q in QUALITY_LEVELS]
+    times = {name: [] for name, _ in fns}
+    for _ in range(RUNS):
+        for name, fn in fns:
+            times[name].append(run(screen, fn))
+    for name, _ in fns:
+        t = times[name]
+        print(f"{name:<18}: {statistics.median(t):8.1f} us/frame  (min {min(t):.1f}, max {max(t):.1f})")
+
+    print("OK" if same else "ÉCHEC : le niveau 0 ne reproduit pas le rendu d'origine")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+bench_terrain_sampling.py — Micro-benchmark : height_at_world (scalaire) vs height_at_world_many (NumPy)
+
+Le chemin NumPy est mesuré à toutes les tailles (worldgen.SMALL_BATCH mis à 0 pendant
+la mesure) ; en dessous du seuil, height_at_world_many repasse en boucle scalaire.
+
+Usage (depuis la racine du projet) :
+    python bench/bench_terrain_sampling.py
+"""
+
+import os
+import random
+import sys
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import numpy as np  # noqa: E402
+import worldgen  # noqa: E402
+from terrain import Terrain  # noqa: E402
+
+BATCH_SIZES = [1, 4, 16, 32, 48, 64, 96, 128, 256, 1024]
+
+
+def make_terrain() -> Terrain:
+    """Terrain de phase 3 (vagues dures + trous fréquents)."""
+    terrain = Terrain(900, 600, dx=14, base_y_ratio=0.65, seed=1234)
+    terrain.set_waves([(95, 0.016), (55, 0.035), (28, 0.070)])
+    terrain.gaps_enabled = True
+    terrain.gap_ramp = 160.0
+
+    # ~22 trous sur [0, 20000] (espacement 900 ± 30 %, largeur 280 ± 30 %)
+    rng = random.Random(1234)
+    terrain.gaps.clear()
+    x = 0.0
+    while x < 20000.0:
+        terrain.gaps.append((x, x + rng.uniform(196.0, 364.0)))
+        x += rng.uniform(630.0, 1170.0)
+    return terrain
+
+
+def main() -> None:
+    terrain = make_terrain()
+    threshold = worldgen.SMALL_BATCH
+    worldgen.SMALL_BATCH = 0
+    crossover = None
+
+    print(f"{'batch':>6} {'scalar (us)':>12} {'many (us)':>12} {'speedup':>8} {'max |err|':>10}")
+    for n in BATCH_SIZES:
+        xs = np.linspace(1000.0, 1000.0 + 14.0 * n, n, endpoint=False)
+        xs_list = xs.tolist()
+
+        ref = [terrain.height_at_world(x) for x in xs_list]
+        err = float(np.max(np.abs(terrain.height_at_world_many(xs) - np.array(ref))))
+
+        number = max(1, 20000 // n)
+        t_scalar = min(timeit.repeat(lambda: [terrain.height_at_world(x) for x in xs_list],
+                                     number=number, repeat=5)) / number
+        t_many = min(timeit.repeat(lambda: terrain.height_at_world_many(xs),
+                                    number=number, repeat=5)) / number
+
+        print(f"{n:>6} {t_scalar * 1e6:>12.1f} {t_many * 1e6:>12.1f} "
+              f"{t_scalar / t_many:>7.1f}x {err:>10.2e}")
+        if crossover is None and t_many < t_scalar:
+            crossover = n
+
+    worldgen.SMALL_BATCH = threshold
+    print(f"NumPy plus rapide à partir de {crossover} abscisses ; worldgen.SMALL_BATCH = {threshold}")
+
+
+if __name__ == "__main__":
+    main()
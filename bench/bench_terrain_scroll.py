@@ -0,0 +1,106 @@
+"""
+bench_terrain_scroll.py — Scrolling du terrain : buffer circulaire (actuel) vs liste de listes (ancien)
+
+Mesure par frame : update_scroll + get_height_screen_x + get_slope_screen_x (comme Player.update),
+à plusieurs vitesses de scroll, puis la mémoire allouée après un long run.
+
+Usage (depuis la racine du projet) :
+    python bench/bench_terrain_scroll.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from terrain import Terrain  # noqa: E402
+
+SPEEDS = [3.0, 8.0, 30.0, 300.0]   # px / frame (300 = pic de dt)
+FRAMES = 20000
+
+
+class ListTerrain(Terrain):
+    """Ancienne fenêtre de points : liste de [x_screen, y], décalée et pop(0) à chaque frame."""
+
+    def _init_points(self) -> None:
+        n = self.width // self.dx + 3
+        self.list_points = []
+        for i in range(n):
+            world_x = self.world_x0 + i * self.dx
+            self.list_points.append([i * self.dx, self.height_at_world(world_x)])
+
+    def update_scroll(self, scroll_speed_px: float) -> None:
+        for p in self.list_points:
+            p[0] -= scroll_speed_px
+
+        while len(self.list_points) > 0 and self.list_points[0][0] < -self.dx:
+            self.list_points.pop(0)
+            self.world_x0 += self.dx
+
+        while (len(self.list_points) < (self.width // self.dx + 3)
+               or self.list_points[-1][0] < self.width + self.dx):
+            new_x = self.list_points[-1][0] + self.dx
+            world_x = self.world_x0 + new_x
+            self.list_points.append([new_x, self.height_at_world(world_x)])
+
+    def get_height_screen_x(self, x_screen: float) -> float:
+        pts = self.list_points
+        if x_screen <= pts[0][0]:
+            return float(pts[0][1])
+        if x_screen >= pts[-1][0]:
+            return float(pts[-1][1])
+        i = max(0, min(int((x_screen - pts[0][0]) // self.dx), len(pts) - 2))
+        x0, y0 = pts[i]
+        x1, y1 = pts[i + 1]
+        return float(y0 + (x_screen - x0) / (x1 - x0) * (y1 - y0))
+
+    def get_slope_screen_x(self, x_screen: float) -> float:
+        pts = self.list_points
+        i = max(0, min(int((x_screen - pts[0][0]) // self.dx), len(pts) - 2))
+        x0, y0 = pts[i]
+        x1, y1 = pts[i + 1]
+        return float((y1 - y0) / (x1 - x0))
+
+
+def run_frames(terrain: Terrain, speed: float, frames: int) -> float:
+    """Temps moyen par frame (µs)."""
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        terrain.update_scroll(speed)
+        terrain.get_height_screen_x(250.0)
+        terrain.get_slope_screen_x(250.0)
+    return (time.perf_counter() - t0) / frames * 1e6
+
+
+def make(cls, dx: int) -> Terrain:
+    return cls(900, 600, dx=dx, base_y_ratio=0.65, seed=42)
+
+
+def main() -> None:
+    print(f"{'dx':>3} {'px/frame':>9} {'list (us)':>10} {'ring (us)':>10} {'speedup':>8}")
+    for dx in (14, 30):
+        for speed in SPEEDS:
+            frames = FRAMES if speed < 100 else FRAMES // 10
+            t_list = run_frames(make(ListTerrain, dx), speed, frames)
+            t_ring = run_frames(make(Terrain, dx), speed, frames)
+            print(f"{dx:>3} {speed:>9.0f} {t_list:>10.2f} {t_ring:>10.2f} {t_list / t_ring:>7.1f}x")
+
+    # mémoire : doit rester plate sur un très long run
+    # (après le remplissage du cache LRU de chunks du WorldGenerator, borné)
+    terrain = make(Terrain, 14)
+    terrain.gaps_enabled = True
+    tracemalloc.start()
+    run_frames(terrain, 8.0, 20000)
+    before = tracemalloc.get_traced_memory()[0]
+    run_frames(terrain, 8.0, 200000)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"\nmémoire après 20k frames : {before / 1024:.1f} KiB, après 220k frames : {after / 1024:.1f} KiB "
+          f"(distance {terrain.world_x0:.0f} px)")
+
+
+if __name__ == "__main__":
+    main()
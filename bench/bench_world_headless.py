@@ -0,0 +1,127 @@
+"""
+Benchmark : parties sans affichage (world.World).
+
+- Aucun sous-système pygame initialisé (display, mixer, polices), ni par l'import de
+  main.py ni par des parties complètes.
+- World.step (dt de frame irrégulier) équivalent à la boucle Simulation + FixedStep
+  d'origine : mêmes ticks, score, pièces et cause de game over.
+- Déterminisme : même seed + mêmes inputs -> mêmes événements.
+- Débit : parties complètes par minute sur un cœur (World.tick, inputs scriptés).
+
+Usage (depuis la racine du projet) :
+    python bench/bench_world_headless.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame  # noqa: E402
+
+from simulation import SIM_HZ, FixedStep, Simulation  # noqa: E402
+from world import COIN, GAME_OVER, PHASE, World  # noqa: E402
+
+WIDTH, HEIGHT = 900, 600
+SEEDS = list(range(20))
+MAX_TICKS = 120 * SIM_HZ      # partie plafonnée à 2 min de jeu
+THROUGHPUT_S = 10.0
+
+
+def policy(i: int):
+    """Boost tenu 1 s sur 1,5 s, tap toutes les 0,75 s."""
+    return (i % 180) < 120, (i % 90) == 0
+
+
+def subsystems():
+    return {"display": pygame.display.get_init(), "mixer": bool(pygame.mixer.get_init()),
+            "font": pygame.font.get_init()}
+
+
+def frame_dts(seed):
+    rng = random.Random(seed)
+    while True:
+        yield rng.choice((1.0 / 60, 1.0 / 60, 1.0 / 30, 1.0 / 144))
+
+
+def play_world(seed):
+    """World.step, dt de frame irréguliers. Retourne (résultat, événements)."""
+    world = World(WIDTH, HEIGHT, seed=seed)
+    events = []
+    frame = 0
+    for dt in frame_dts(seed):
+        if world.game_over or world.ticks >= MAX_TICKS:
+            break
+        down, _ = policy(frame)
+        events += world.step(dt, down, frame % 45 == 0)
+        frame += 1
+    return (world.ticks, round(world.score, 6), world.coins, world.death_reason), events
+
+
+def play_reference(seed):
+    """Même partie avec la boucle d'origine de main.py (Simulation + FixedStep + edge gardé)."""
+    sim = Simulation(WIDTH, HEIGHT, seed=seed)
+    stepper = FixedStep(SIM_HZ)
+    pressed = False
+    frame = 0
+    for dt in frame_dts(seed):
+        if sim.game_over or sim.ticks >= MAX_TICKS:
+            break
+        down, _ = policy(frame)
+        pressed = pressed or frame % 45 == 0
+        for _ in range(stepper.advance(dt)):
+            if sim.game_over:
+                break
+            sim.tick(stepper.dt, down, pressed)
+            pressed = False
+        frame += 1
+    score = sim.final_score if sim.game_over else sim.score
+    return sim.ticks, round(score, 6), sim.coins, sim.death_reason
+
+
+def play_ticks(seed):
+    """Partie complète tick par tick (chemin le plus rapide). Retourne le nombre de ticks."""
+    world = World(WIDTH, HEIGHT, seed=seed)
+    while not world.game_over and world.ticks < MAX_TICKS:
+        world.tick(*policy(world.ticks))
+    return world.ticks
+
+
+def main():
+    import main as game_main  # noqa: F401  (aucun effet de bord attendu)
+    ok = not any(subsystems().values())
+    print(f"après import de main.py : {subsystems()}")
+
+    print(f"{'seed':>4} | {'ticks':>6} | {'score':>8} | {'pièces':>6} | {'fin':>7} | "
+          f"{'phases':>6} | identique à la boucle d'origine | déterministe")
+    for seed in SEEDS[:8]:
+        result, events = play_world(seed)
+        same = result == play_reference(seed)
+        again = play_world(seed) == (result, events)
+        ok &= same and again
+        coins = sum(e.value for e in events if e.kind == COIN)
+        ok &= coins == result[2]
+        ok &= [e.value for e in events if e.kind == GAME_OVER] == ([result[3]] if result[3] else [])
+        phases = [e.value for e in events if e.kind == PHASE]
+        print(f"{seed:4d} | {result[0]:6d} | {result[1]:8.0f} | {result[2]:6d} | {result[3] or '-':>7} | "
+              f"{str(phases):>6} | {'oui' if same else 'NON':>31} | {'oui' if again else 'NON'}")
+
+    games = ticks = 0
+    t0 = time.perf_counter()
+    while time.perf_counter() - t0 < THROUGHPUT_S:
+        ticks += play_ticks(SEEDS[games % len(SEEDS)])
+        games += 1
+    spent = time.perf_counter() - t0
+    print(f"débit : {games / spent * 60:.0f} parties/min sur un cœur "
+          f"({ticks / games:.0f} ticks/partie, {spent / ticks * 1e6:.1f} µs/tick)")
+
+    print(f"après les parties : {subsystems()}")
+    ok &= not any(subsystems().values())
+    print("OK" if ok else "ÉCHEC")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+bench_worldgen.py — WorldGenerator : reproductibilité + coût d'un chunk (froid / en cache)
+
+1) Vérification : un chunk est une fonction pure de (seed, index, paramètres) :
+   même résultat quel que soit l'ordre de génération ou après éviction du cache ;
+   idem pour les chunks d'un calendrier (scheduled_chunk, chaînes de trous comprises).
+2) Mesure : génération d'un chunk à froid vs lecture dans le cache LRU, et taux de
+   hits sur deux parties rejouées avec la même seed et un generator partagé.
+
+Usage (depuis la racine du projet) :
+    python bench/bench_worldgen.py
+"""
+
+import os
+import sys
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import numpy as np  # noqa: E402
+from simulation import TerrainSchedule  # noqa: E402
+from terrain import Terrain  # noqa: E402
+from worldgen import WorldGenerator, WorldParams  # noqa: E402
+
+PHASE3 = WorldParams(((85.0, 0.013), (46.0, 0.028), (23.0, 0.057)), True, 1350.0, 210.0, 200.0)
+
+
+def make_generator(seed: int, cache_size: int = 64) -> WorldGenerator:
+    return WorldGenerator(seed, dx=14, base_y=390.0, hole_y=850.0, coin_every=500.0,
+                          cache_size=cache_size)
+
+
+def same(c1, c2) -> bool:
+    return np.array_equal(c1.ys, c2.ys) and c1.gaps == c2.gaps and c1.coins == c2.coins
+
+
+def verify() -> None:
+    forward = make_generator(11, cache_size=4)
+    backward = make_generator(11, cache_size=4)
+    chunks = [forward.chunk(i, PHASE3) for i in range(200)]
+    for i in reversed(range(200)):
+        assert same(chunks[i], backward.chunk(i, PHASE3)), f"chunk {i} dépend de l'ordre"
+    # après éviction (cache de 4), régénération identique
+    assert same(chunks[0], forward.chunk(0, PHASE3)), "chunk régénéré différent"
+    assert not same(chunks[5], make_generator(12).chunk(5, PHASE3)), "seed ignorée"
+
+    # calendrier (phases 1 à 3, ~410 kpx) : chaînes de trous tirées dans un autre ordre
+    schedule = TerrainSchedule(lead=900.0)
+    forward = make_generator(11, cache_size=4)
+    backward = make_generator(11, cache_size=4)
+    chunks = [forward.scheduled_chunk(i, schedule) for i in range(200)]
+    for i in reversed(range(200)):
+        assert same(chunks[i], backward.scheduled_chunk(i, schedule)), \
+            f"chunk {i} (calendrier) dépend de l'ordre"
+    assert same(chunks[0], forward.scheduled_chunk(0, schedule)), "chunk (calendrier) régénéré différent"
+    print("vérification OK : 2 x 200 chunks identiques (ordre inverse, éviction, même seed)")
+
+
+def play(generator: WorldGenerator, frames: int = 6000) -> None:
+    """Partie scriptée : scroll constant, trous activés à mi-parcours."""
+    terrain = Terrain(900, 600, dx=14, base_y_ratio=0.65, generator=generator)
+    for f in range(frames):
+        terrain.gaps_enabled = f > frames // 2
+        terrain.update_scroll(6.0)
+        terrain.coins_between(terrain.world_x0 + 250.0, terrain.world_x0 + 2750.0)
+
+
+def main() -> None:
+    verify()
+
+    gen = make_generator(7, cache_size=4096)
+    n = 300
+    t_cold = timeit.timeit(lambda: [gen.chunk(i, PHASE3) for i in range(n)], number=1) / n
+    t_hot = timeit.timeit(lambda: [gen.chunk(i, PHASE3) for i in range(n)], number=20) / (20 * n)
+    print(f"\nchunk de {gen.samples} échantillons : froid {t_cold * 1e6:.1f} us, "
+          f"en cache {t_hot * 1e6:.2f} us ({t_cold / t_hot:.0f}x)")
+
+    shared = make_generator(3, cache_size=64)
+    play(shared)
+    first = (shared.hits, shared.misses)
+    play(shared)
+    print(f"partie 1 : {first[0]} hits / {first[1]} miss ; "
+          f"partie 2 (même seed) : {shared.hits - first[0]} hits / {shared.misses - first[1]} miss")
+
+
+if __name__ == "__main__":
+    main()
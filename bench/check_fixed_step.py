@@ -0,0 +1,124 @@
+"""
+Vérification : simulation à pas fixe indépendante du FPS de rendu.
+
+- Même seed, parties jouées par le bot (Autopilot sans budget : décisions
+  déterministes, prises à chaque tick sur l'état de la simulation) à 30, 60, 144 FPS
+  et avec un dt irrégulier, jusqu'au game over (plafonné à MAX_TICKS) : le bot va
+  jusqu'aux phases 2-3 (trous, nuit qui accélère). Comme la boucle de main.py, chaque
+  frame génère ensuite le terrain à venir sous budget (Terrain.pump) : le nombre de
+  chunks générés en avance dépend donc du FPS et du temps réel.
+  L'état final doit être identique au bit près à tous les FPS ; au moins une partie
+  doit atteindre la phase 3.
+- Pour comparaison, l'ancienne intégration à dt variable (un tick par frame, dt = durée
+  de la frame, bot consulté à chaque frame) diverge selon le FPS.
+
+Usage (depuis la racine du projet) :
+    python bench/check_fixed_step.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from autopilot import Autopilot  # noqa: E402
+from simulation import SIM_HZ, FixedStep  # noqa: E402
+from world import World  # noqa: E402
+
+WIDTH, HEIGHT = 900, 600
+SEEDS = [1, 7, 42]
+MAX_TICKS = 240 * SIM_HZ     # 4 min de jeu
+RATES = [30, 60, 144, "jitter"]
+GEN_BUDGET_S = 0.001         # comme main.GEN_BUDGET_S
+
+
+def state(world: World):
+    sim = world.sim
+    p = sim.player
+    return (sim.ticks, sim.distance, sim.score, sim.night_world_x, sim.coins,
+            sim.game_over, sim.death_reason, p.y, p.vx, p.vy, p.energy, p.state)
+
+
+def frame_times(kind, seconds: float):
+    n = int(seconds * 200) + 10
+    if kind == "jitter":
+        rng = random.Random(0)
+        return [rng.uniform(0.004, 0.050) for _ in range(n)]
+    return [1.0 / kind] * n
+
+
+def pump(world: World) -> None:
+    """Génération en avance de fin de frame (cf. main.py)."""
+    t0 = time.perf_counter()
+    world.sim.terrain.pump(GEN_BUDGET_S)
+    world.sim.bg_terrain.pump(max(0.0, GEN_BUDGET_S - (time.perf_counter() - t0)))
+
+
+def run_fixed(seed: int, frames):
+    """Boucle à pas fixe ; retourne (état final, phase max atteinte)."""
+    world = World(WIDTH, HEIGHT, seed=seed)
+    bot = Autopilot(budget_s=None)
+    stepper = FixedStep(SIM_HZ)
+    phase = 0
+    for frame_dt in frames:
+        for _ in range(stepper.advance(frame_dt)):
+            if world.ticks >= MAX_TICKS or world.game_over:
+                return state(world), phase
+            world.tick(*bot(world))
+            phase = max(phase, world.phase)
+        pump(world)
+    return state(world), phase
+
+
+def run_variable(seed: int, frames):
+    """Ancienne boucle : un tick par frame avec dt = durée de la frame."""
+    world = World(WIDTH, HEIGHT, seed=seed)
+    sim = world.sim
+    bot = Autopilot(budget_s=None)
+    for frame_dt in frames:
+        if sim.ticks >= MAX_TICKS or sim.game_over:
+            break
+        down, pressed = bot(world)
+        sim.tick(frame_dt, down, pressed)
+        pump(world)
+    return state(world)
+
+
+def main():
+    ok = True
+    top = 0
+
+    print(f"Pas fixe, parties du bot : état final (game over ou {MAX_TICKS} ticks), "
+          f"terrain généré sous budget à chaque frame")
+    for seed in SEEDS:
+        results = {}
+        for r in RATES:
+            results[r], phase = run_fixed(seed, frame_times(r, MAX_TICKS / SIM_HZ))
+            top = max(top, phase)
+        ref = results[RATES[0]]
+        same = all(v == ref for v in results.values())
+        ok &= same
+        print(f"  seed {seed:3d} : distance={ref[1]:9.2f} ticks={ref[0]} phase {phase + 1} "
+              f"{ref[6] or 'vivant'} -> {'IDENTIQUE' if same else 'DIFFÉRENT'}")
+        if not same:
+            for r, v in results.items():
+                print(f"      {r}: {v}")
+    reached = top >= 2
+    ok &= reached
+    print(f"  phase max atteinte : {top + 1}{'' if reached else ' (phase 3 jamais atteinte)'}")
+
+    print("Dt variable (ancienne boucle) : distance en fin de partie")
+    for seed in SEEDS:
+        ds = [run_variable(seed, frame_times(r, MAX_TICKS / SIM_HZ))[1] for r in RATES]
+        spread = max(ds) - min(ds)
+        print(f"  seed {seed:3d} : " + "  ".join(f"{r}={d:9.2f}" for r, d in zip(RATES, ds))
+              + f"  (écart {spread:.2f} px)")
+
+    print("OK" if ok else "ÉCHEC : la simulation dépend du FPS")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
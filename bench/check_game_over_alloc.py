@@ -0,0 +1,161 @@
+"""
+Vérification : l'écran de game over n'alloue aucune Surface par frame.
+
+- Compte les Surfaces créées (pygame.Surface, font.render, transform.*, copy) pendant
+  600 frames de game over : tout doit être construit à la première frame.
+- Compare les pixels avec l'ancien rendu (overlay + textes + smoothscale à chaque frame)
+  aux instants où la pulsation tombe sur une image précalculée.
+- Temps par frame, avant / après.
+
+Usage (depuis la racine du projet) :
+    python bench/check_game_over_alloc.py
+"""
+
+import math
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame  # noqa: E402
+
+from ui import PULSE_FRAMES, UI  # noqa: E402
+
+WIDTH, HEIGHT = 900, 600
+FRAMES = 600
+DT = 1.0 / 60
+SCORE = 48213.7
+REASON = "Fell in a hole"
+
+
+class CountingFont:
+    """Proxy de pygame.font.Font qui compte les render()."""
+
+    def __init__(self, font, counter):
+        self._font = font
+        self._counter = counter
+
+    def render(self, *args, **kwargs):
+        self._counter[0] += 1
+        return self._font.render(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._font, name)
+
+
+def instrument(ui, counter):
+    """Compte toute création de Surface visible depuis ui.py."""
+    for name in ("font", "font_big", "font_med"):
+        setattr(ui, name, CountingFont(getattr(ui, name), counter))
+
+    real_surface = pygame.Surface
+
+    class CountingSurface(real_surface):
+        def __init__(self, *args, **kwargs):
+            counter[0] += 1
+            super().__init__(*args, **kwargs)
+
+    def counting(fn):
+        def wrapper(*args, **kwargs):
+            counter[0] += 1
+            return fn(*args, **kwargs)
+        return wrapper
+
+    patched = [(pygame, "Surface", real_surface)]
+    pygame.Surface = CountingSurface
+    for name in ("smoothscale", "scale", "rotozoom", "rotate"):
+        patched.append((pygame.transform, name, getattr(pygame.transform, name)))
+        setattr(pygame.transform, name, counting(getattr(pygame.transform, name)))
+    return patched
+
+
+def restore(patched):
+    for mod, name, value in patched:
+        setattr(mod, name, value)
+
+
+def legacy_game_over(ui, screen, score, t, is_new_record, reason):
+    """Ancien rendu (ui.draw_game_over_screen + raison dans run())."""
+    w, h = screen.get_width(), screen.get_height()
+    overlay = pygame.Surface((w, h), pygame.SRCALPHA)
+    overlay.fill((10, 10, 30, 200))
+    screen.blit(overlay, (0, 0))
+    title = ui.font_big.render("GAME OVER", True, (240, 240, 240))
+    screen.blit(title, title.get_rect(center=(w // 2, h // 2 - 120)))
+    pulse = 1.0 + 0.06 * math.sin(6.0 * t)
+    score_surf = ui.font_big.render(f"SCORE: {int(score)}", True, (255, 255, 255))
+    score_surf = pygame.transform.smoothscale(
+        score_surf, (int(score_surf.get_width() * pulse), int(score_surf.get_height() * pulse)))
+    screen.blit(score_surf, score_surf.get_rect(center=(w // 2, h // 2 - 20)))
+    hs_color = (255, 230, 140) if is_new_record else (220, 220, 220)
+    hs_surf = ui.font_med.render(f"HIGHSCORE: {int(ui.highscore)}", True, hs_color)
+    screen.blit(hs_surf, hs_surf.get_rect(center=(w // 2, h // 2 + 45)))
+    if is_new_record:
+        badge = ui.font.render("NEW RECORD!", True, (255, 230, 140))
+        screen.blit(badge, badge.get_rect(center=(w // 2, h // 2 + 80)))
+    hint = ui.font.render("R : Rejouer   |   ESC : Quitter", True, (230, 230, 230))
+    screen.blit(hint, hint.get_rect(center=(w // 2, h // 2 + 130)))
+    reason_surf = ui.font.render(reason, True, (230, 230, 230))
+    screen.blit(reason_surf, (w // 2 - reason_surf.get_width() // 2, h // 2 + 150))
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    ok = True
+
+    # allocations
+    ui = UI()
+    counter = [0]
+    patched = instrument(ui, counter)
+    try:
+        per_frame = []
+        for f in range(FRAMES):
+            before = counter[0]
+            ui.draw_game_over_screen(screen, SCORE, f * DT, is_new_record=True, reason=REASON)
+            per_frame.append(counter[0] - before)
+    finally:
+        restore(patched)
+    steady = sum(per_frame[1:])
+    ok &= steady == 0
+    print(f"Surfaces créées : 1re frame {per_frame[0]}, frames suivantes {steady} "
+          f"({'OK' if steady == 0 else 'ALLOCATIONS PAR FRAME'})")
+
+    # pixels aux instants des images précalculées
+    period = 2.0 * math.pi / 6.0
+    diffs = 0
+    for k in range(PULSE_FRAMES):
+        # ancien rendu à la phase exacte, nouveau juste après (même image précalculée)
+        t = k * period / PULSE_FRAMES
+        for record in (False, True):
+            screen.fill((90, 160, 220))
+            legacy_game_over(ui, screen, SCORE, t, record, REASON)
+            ref = pygame.image.tobytes(screen, "RGB")
+            screen.fill((90, 160, 220))
+            ui.draw_game_over_screen(screen, SCORE, t + 1e-9, is_new_record=record, reason=REASON)
+            diffs += pygame.image.tobytes(screen, "RGB") != ref
+    ok &= diffs == 0
+    print(f"Pixels vs ancien rendu ({PULSE_FRAMES} phases x 2) : "
+          f"{'identiques' if diffs == 0 else f'{diffs} images différentes'}")
+
+    # temps
+    ui = UI()
+    t0 = time.perf_counter()
+    for f in range(FRAMES):
+        legacy_game_over(ui, screen, SCORE, f * DT, True, REASON)
+    t_old = (time.perf_counter() - t0) / FRAMES
+    t0 = time.perf_counter()
+    for f in range(FRAMES):
+        ui.draw_game_over_screen(screen, SCORE, f * DT, is_new_record=True, reason=REASON)
+    t_new = (time.perf_counter() - t0) / FRAMES
+    print(f"Game over : avant {t_old * 1e6:.0f} µs/frame, après {t_new * 1e6:.0f} µs/frame "
+          f"(x{t_old / t_new:.1f})")
+
+    print("OK" if ok else "ÉCHEC")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
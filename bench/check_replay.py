@@ -0,0 +1,161 @@
+"""
+Vérification : enregistrement et rejeu de parties (replay.py).
+
+- Parties enregistrées comme dans Game.run : dt de frame irréguliers, inputs scriptés,
+  génération du terrain sous budget de temps (nombre de chunks variable selon la machine).
+- Fichier : relu à l'identique ; taille par frame.
+- Rejeu sans affichage, aussi vite que possible, à partir de la seed et des inputs
+  seuls : même ticks, score, pièces et cause de game over ; vitesse par rapport au
+  temps réel.
+- Rejeu avec une autre génération du terrain (tout à la demande, ou tout en avance à
+  chaque frame) : même résultat, le budget ne change pas le contenu des chunks.
+- Rejeu en temps réel par le jeu lui-même (main.py, TINYWINGS_REPLAY, rendu compris),
+  réenregistré au passage (TINYWINGS_RECORD) : même résultat. À la fin du rejeu, le jeu
+  continue sans faire avancer le monde, jusqu'à ESC (envoyé ici après HOLD_FRAMES).
+
+Usage (depuis la racine du projet) :
+    python bench/check_replay.py
+    python bench/check_replay.py partie.twr     (rejoue un enregistrement, sans affichage)
+"""
+
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from replay import Recording, play_headless, world_result  # noqa: E402
+from world import World  # noqa: E402
+
+WIDTH, HEIGHT = 900, 600
+SEEDS = list(range(6))
+GEN_BUDGET_S = 0.0003       # petit budget : nombre de chunks par frame très variable
+MAX_FRAMES = 60 * 120
+REALTIME_FRAMES = 240       # partie (tronquée) rejouée en temps réel par main.py
+HOLD_FRAMES = 30            # frames affichées après la fin du rejeu, avant ESC
+
+
+def record(seed, max_frames=MAX_FRAMES):
+    """Partie enregistrée : dt de frame en ms entières (clock.tick), boost / taps scriptés."""
+    rng = random.Random(seed)
+    world = World(WIDTH, HEIGHT, seed=seed)
+    rec = Recording(world.seed, WIDTH, HEIGHT)
+    frame = 0
+    while not world.game_over and frame < max_frames:
+        dt = rng.choice((16, 16, 17, 33, 7)) / 1000.0
+        down = (frame % 150) < 100
+        pressed = rng.random() < 0.03
+        world.step(dt, down, pressed)
+        world.sim.terrain.pump(GEN_BUDGET_S)
+        rec.add(dt, down, pressed)
+        frame += 1
+    rec.finish(world)
+    return rec
+
+
+def play_pumped(rec, budget_s):
+    """Rejeu avec génération du terrain sous budget_s à chaque frame."""
+    world = rec.new_world()
+    for dt, down, pressed in rec.frames:
+        world.step(dt, down, pressed)
+        world.sim.terrain.pump(budget_s)
+    return world
+
+
+def show(result):
+    return (f"{result['ticks']:6d} ticks, score {result['score']:8.0f}, {result['coins']:3d} pièces, "
+            f"{result['death_reason'] or '-':>6}")
+
+
+def replay_file(path):
+    rec = Recording.load(path)
+    t0 = time.perf_counter()
+    world = play_headless(rec)
+    spent = time.perf_counter() - t0
+    result = world_result(world)
+    print(f"enregistré : {show(rec.result)}")
+    print(f"rejoué     : {show(result)}  ({spent:.2f} s)")
+    ok = result == rec.result
+    print("OK" if ok else "ÉCHEC")
+    return 0 if ok else 1
+
+
+async def play_realtime(game_main):
+    """Rejeu par main.Game ; retourne True si le jeu a tenu HOLD_FRAMES après la fin, monde figé."""
+    import pygame
+    game = game_main.Game()
+
+    async def press_escape():
+        while not game.replay_done:
+            await asyncio.sleep(0)
+        ticks = game.world.ticks
+        for _ in range(HOLD_FRAMES):     # la boucle du jeu rend la main une fois par frame
+            await asyncio.sleep(0)
+        held = game.running and game.world.ticks == ticks
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE))
+        return held
+
+    watcher = asyncio.create_task(press_escape())
+    await game.run()
+    game.save_recording()
+    pygame.quit()
+    return watcher.done() and watcher.result()
+
+
+def main():
+    ok = True
+    other_gen = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'seed':>4} | {'partie enregistrée':<50} | octets/frame | rejeu | x temps réel")
+        for seed in SEEDS:
+            rec = record(seed)
+            path = os.path.join(tmp, f"{seed}.twr")
+            rec.save(path)
+            loaded = Recording.load(path)
+            ok &= loaded.frames == rec.frames and loaded.result == rec.result
+
+            t0 = time.perf_counter()
+            world = play_headless(loaded)
+            spent = time.perf_counter() - t0
+            same = world_result(world) == rec.result
+            ok &= same
+            # play_headless génère tout à la demande ; ici tout en avance à chaque frame
+            other_gen += world_result(play_pumped(loaded, 1.0)) == rec.result
+
+            real = sum(f[0] for f in rec.frames)
+            print(f"{seed:4d} | {show(rec.result):<50} | {os.path.getsize(path) / len(rec):12.3f} | "
+                  f"{'oui' if same else 'NON':>5} | {real / spent:11.0f}")
+        print(f"génération du terrain rejouée autrement : {other_gen}/{len(SEEDS)} parties identiques")
+        ok &= other_gen == len(SEEDS)
+
+        # rejeu en temps réel par le jeu, réenregistré au passage
+        rec = record(SEEDS[0], REALTIME_FRAMES)
+        src = os.path.join(tmp, "realtime.twr")
+        again = os.path.join(tmp, "again.twr")
+        rec.save(src)
+        os.environ["TINYWINGS_REPLAY"] = src
+        os.environ["TINYWINGS_RECORD"] = again
+        import main as game_main
+        t0 = time.perf_counter()
+        held = asyncio.run(play_realtime(game_main))
+        spent = time.perf_counter() - t0
+        rerec = Recording.load(again)
+        same = rerec.result == rec.result and rerec.frames == rec.frames
+        ok &= same and held
+        print(f"temps réel (main.py) : {len(rec)} frames en {spent:.1f} s, {show(rerec.result)}, "
+              f"{'identique' if same else 'DIFFÉRENT'} ; fin du rejeu : "
+              f"{'figé puis ESC' if held else 'NON TENUE'}")
+
+    print("OK" if ok else "ÉCHEC")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(replay_file(sys.argv[1]))
+    sys.exit(main())
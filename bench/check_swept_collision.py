@@ -0,0 +1,104 @@
+"""
+Vérification : collision continue (Player.swept) et physique à bas tick rate.
+
+Même seed, mêmes inputs (définis en temps, pas en ticks) : la trajectoire à 20, 30
+et 60 Hz est comparée à une référence à 240 Hz, toutes les 0,1 s (instants communs
+à toutes les fréquences) : distance parcourue et hauteur de la bille au-dessus du
+sol (0 au sol). Avec swept=False (Euler + test d'atterrissage en fin de pas),
+l'écart est donné pour comparaison.
+
+PlayerBatch reproduit swept=False au bit près (cf. bench/bench_player_batch.py) :
+swept=False à son pas (120 Hz) doit rester dans les mêmes tolérances que la
+référence swept, pour que les réglages trouvés en lot valent pour le jeu.
+
+Usage (depuis la racine du projet) :
+    python bench/check_swept_collision.py
+"""
+
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from simulation import Simulation  # noqa: E402
+
+WIDTH, HEIGHT = 900, 600
+SEED = 7
+DURATION_S = 12.0
+SAMPLE_EVERY_S = 0.1
+REF_HZ = 240
+RATES = [20, 30, 60]
+BATCH_HZ = 120   # pas de bench/bench_player_batch.py
+
+# tolérances (mode swept) vs la référence 240 Hz
+TOL_DISTANCE = 0.02       # fraction de la distance parcourue
+TOL_CLEARANCE_PX = 20.0   # hauteur au-dessus du sol
+
+# scénarios d'inputs : boost tenu sur des intervalles (s), taps à des instants (s)
+SCENARIOS = {
+    "mixte": ([(0.5, 2.0), (3.0, 5.5), (7.0, 8.0), (9.0, 11.0)],
+              [1.0, 2.6, 2.8, 6.0, 6.3, 8.5, 11.5]),
+    "boost": ([(0.0, 12.0)], []),
+    "sauts": ([(4.0, 6.0)], [0.8, 1.1, 1.3, 2.5, 3.2, 3.35, 7.0, 7.5, 8.0, 9.7, 10.1]),
+}
+
+
+def run(scenario: str, hz: int, swept: bool):
+    boost, taps = SCENARIOS[scenario]
+    sim = Simulation(WIDTH, HEIGHT, seed=SEED)
+    player = sim.player
+    player.swept = swept
+    dt = 1.0 / hz
+    every = int(round(SAMPLE_EVERY_S * hz))
+    tap_ticks = {int(math.ceil(tap * hz - 1e-9)) for tap in taps}
+    traj = []
+    for i in range(int(round(DURATION_S * hz))):
+        t = i * dt
+        down = any(a <= t < b for a, b in boost)
+        pressed = i in tap_ticks
+        if i % every == 0:
+            ground = sim.terrain.get_height_screen_x(player.x) - player.radius
+            traj.append((sim.distance, max(0.0, ground - player.y)))
+        sim.tick(dt, down, pressed)
+        if sim.game_over:
+            break
+    return traj
+
+
+def worst_gap(traj, ref):
+    n = min(len(traj), len(ref))
+    d = max(abs(traj[i][0] - ref[i][0]) for i in range(n))
+    y = max(abs(traj[i][1] - ref[i][1]) for i in range(n))
+    return d, y
+
+
+def main():
+    ok = True
+    print(f"Écart max vs {REF_HZ} Hz sur {DURATION_S:.0f} s (distance px / hauteur au-dessus du sol px)")
+    print(f"{'scénario':>9} {'Hz':>4} | {'swept':>17} | {'fin de pas (ancien)':>20}")
+    for name in SCENARIOS:
+        ref_swept = run(name, REF_HZ, True)
+        ref_old = run(name, REF_HZ, False)
+        for hz in RATES:
+            d, h = worst_gap(run(name, hz, True), ref_swept)
+            d_old, h_old = worst_gap(run(name, hz, False), ref_old)
+            good = d <= TOL_DISTANCE * ref_swept[-1][0] and h <= TOL_CLEARANCE_PX
+            ok &= good
+            print(f"{name:>9} {hz:4d} | {d:7.1f} / {h:7.1f} | {d_old:8.1f} / {h_old:8.1f}"
+                  f"  {'' if good else '<- hors tolérance'}")
+
+    print(f"Modèle de PlayerBatch (swept=False, {BATCH_HZ} Hz) vs swept {REF_HZ} Hz")
+    for name in SCENARIOS:
+        ref_swept = run(name, REF_HZ, True)
+        d, h = worst_gap(run(name, BATCH_HZ, False), ref_swept)
+        good = d <= TOL_DISTANCE * ref_swept[-1][0] and h <= TOL_CLEARANCE_PX
+        ok &= good
+        print(f"{name:>9} {BATCH_HZ:4d} | {d:7.1f} / {h:7.1f}  {'' if good else '<- hors tolérance'}")
+
+    print("OK" if ok else "ÉCHEC : trajectoire trop éloignée de la référence")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,376 @@
+"""
+suite.py — Suite de benchmarks déterministe (simulation + rendu)
+
+Chaque benchmark tourne à seeds fixes (SEEDS) et à chaque phase de difficulté :
+le monde est amené sans chronométrage à une distance de la phase (PHASES), puis on
+chronomètre chaque appel (perf_counter_ns) sur un nombre fixe d'itérations, avec
+inputs scriptés et dt constant (1 / SIM_HZ).
+Démarrage (startup.*) : processus neufs, assets du pipeline (cf. bench_startup.py),
+temps depuis la création de Game jusqu'à la première frame et jusqu'aux assets chargés.
+
+- run     : lance la suite, écrit un JSON (médiane, p99, moyenne par benchmark et phase).
+- compare : compare deux fichiers de résultats, signale les régressions
+            (code retour 1 s'il y en a).
+
+Usage (depuis la racine du projet) :
+    SDL_VIDEODRIVER=dummy python bench/suite.py run -o bench_base.json
+    SDL_VIDEODRIVER=dummy python bench/suite.py run -o bench_new.json
+    python bench/suite.py compare bench_base.json bench_new.json
+Options : --quick (moins d'itérations), --only terrain (filtre sur le nom).
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+from bench_startup import build_manifest, measure  # noqa: E402
+from render import BG_GROUND, GROUND, OUTLINE, FrameRenderer  # noqa: E402
+from simulation import SIM_HZ, Simulation  # noqa: E402
+from ui import UI  # noqa: E402
+
+WIDTH, HEIGHT = 900, 600
+DT = 1.0 / SIM_HZ
+SEEDS = (1, 2, 3)
+
+# Distance de départ de chaque phase (cf. Simulation._apply_difficulty) :
+# Level 1 (< 12000), Level 2 (< 30000), Level 3 au début et au bout de la rampe.
+PHASES = {
+    "phase1": 6000.0,
+    "phase2": 20000.0,
+    "phase3_ramp": 60000.0,
+    "phase3_max": 90000.0,
+}
+
+ITERATIONS = 2000
+QUICK_ITERATIONS = 300
+STARTUP_RUNS = 15
+QUICK_STARTUP_RUNS = 5
+WARMUP = 20
+STAGE_STEP_PX = 60.0     # pas d'avance (px) pour amener le monde à une phase
+STAGE_VX = 400.0         # vitesse du joueur au départ d'un benchmark
+
+# Seuils de compare : ratio nouveau / référence au-delà duquel on signale
+MEDIAN_THRESHOLD = 0.10
+P99_THRESHOLD = 0.25
+
+
+# -------------------------
+# MISE EN PLACE (non chronométrée)
+# -------------------------
+def staged_sim(seed, distance):
+    """Simulation amenée à distance (terrains, difficulté, pièces), joueur posé au sol."""
+    sim = Simulation(WIDTH, HEIGHT, seed=seed)
+    player = sim.player
+    while sim.distance < distance:
+        step = min(STAGE_STEP_PX, distance - sim.distance)
+        sim.distance += step
+        sim._apply_difficulty()
+        sim.bg_terrain.update_scroll(step * 0.5)
+        sim.terrain.update_scroll(step)
+        sim.collectibles.update(sim.distance, player.x, sim.terrain)
+    sim.score = sim.distance
+    sim.night_world_x = sim.distance - 1500.0
+    place_player(sim)
+    sim._prev = sim._snapshot()
+    return sim
+
+
+def place_player(sim):
+    """Remet le joueur au sol, à vitesse de croisière (après une chute dans un trou)."""
+    player = sim.player
+    player.vx = STAGE_VX
+    player.vy = 0.0
+    player.energy = 1.0
+    player.y = sim.terrain.get_height_screen_x(player.x) - player.radius
+    player.state = "SOL"
+    player._last_ground_y = None
+
+
+def policy(i):
+    """Inputs scriptés : boost tenu 1 s sur 1,5 s, tap toutes les 0,75 s."""
+    return (i % 180) < 120, (i % 90) == 0
+
+
+def tick(sim, i):
+    """Un tick de jeu ; une partie finie est relancée au même endroit (non chronométré)."""
+    sim.tick(DT, *policy(i))
+    if sim.game_over:
+        sim.game_over = False
+        sim.death_reason = ""
+        sim.energy_zero_time = 0.0
+        sim.night_world_x = sim.distance - 1500.0
+        place_player(sim)
+
+
+# -------------------------
+# BENCHMARKS : f(sim, ctx, n) -> n durées (ns)
+# -------------------------
+def bench_update_scroll(sim, ctx, n):
+    terrain = sim.terrain
+    step = STAGE_VX * DT
+    out = []
+    for _ in range(n):
+        t0 = time.perf_counter_ns()
+        terrain.update_scroll(step)
+        out.append(time.perf_counter_ns() - t0)
+    return out
+
+
+def bench_height_at_world(sim, ctx, n):
+    terrain = sim.terrain
+    rng = random.Random(ctx["seed"])
+    x0 = terrain.world_x0
+    xs = [x0 + rng.uniform(0.0, WIDTH) for _ in range(n)]
+    out = []
+    for x in xs:
+        t0 = time.perf_counter_ns()
+        terrain.height_at_world(x)
+        out.append(time.perf_counter_ns() - t0)
+    return out
+
+
+def bench_screen_sampling(sim, ctx, n):
+    """get_height_screen_x + get_slope_screen_x (comme Player.update)."""
+    terrain = sim.terrain
+    rng = random.Random(ctx["seed"])
+    xs = [rng.uniform(0.0, WIDTH) for _ in range(n)]
+    out = []
+    for x in xs:
+        t0 = time.perf_counter_ns()
+        terrain.get_height_screen_x(x)
+        terrain.get_slope_screen_x(x)
+        out.append(time.perf_counter_ns() - t0)
+    return out
+
+
+def bench_player_update(sim, ctx, n):
+    player = sim.player
+    terrain = sim.terrain
+    out = []
+    for i in range(n):
+        terrain.update_scroll(player.vx * DT)
+        player.boosting, player.action_pressed = policy(i)
+        t0 = time.perf_counter_ns()
+        player.update(DT, terrain)
+        out.append(time.perf_counter_ns() - t0)
+        if player.y > HEIGHT + 200:
+            place_player(sim)
+    return out
+
+
+def bench_check_collect(sim, ctx, n):
+    player = sim.player
+    coins = sim.collectibles
+    out = []
+    for i in range(n):
+        tick(sim, i)
+        t0 = time.perf_counter_ns()
+        coins.check_collect(sim.distance, player.x, player.y, sim.terrain)
+        out.append(time.perf_counter_ns() - t0)
+    return out
+
+
+def bench_collectibles_draw(sim, ctx, n):
+    screen = ctx["screen"]
+    player = sim.player
+    out = []
+    for i in range(n):
+        tick(sim, i)
+        t0 = time.perf_counter_ns()
+        sim.collectibles.draw(screen, sim.distance, player.x, sim.terrain)
+        out.append(time.perf_counter_ns() - t0)
+    return out
+
+
+def bench_terrain_draw(sim, ctx, n):
+    screen = ctx["screen"]
+    out = []
+    for i in range(n):
+        tick(sim, i)
+        t0 = time.perf_counter_ns()
+        sim.bg_terrain.draw(screen, color_ground=BG_GROUND)
+        sim.terrain.draw(screen, GROUND, OUTLINE)
+        out.append(time.perf_counter_ns() - t0)
+    return out
+
+
+def bench_hud(sim, ctx, n):
+    screen = ctx["screen"]
+    ui = ctx["ui"]
+    player = sim.player
+    out = []
+    for i in range(n):
+        tick(sim, i)
+        t0 = time.perf_counter_ns()
+        ui.begin_frame()
+        ui.draw_hud(screen, sim.score, player.vx, player.state, player.boosting,
+                    coins=sim.coins, level=sim.phase + 1)
+        out.append(time.perf_counter_ns() - t0)
+    return out
+
+
+def bench_frame(sim, ctx, n):
+    """Frame complète : tick + rendu (FrameRenderer, mode full) + flip."""
+    screen = ctx["screen"]
+    renderer = FrameRenderer(ctx["background"], ctx["ui"])
+    out = []
+    for i in range(n):
+        t0 = time.perf_counter_ns()
+        tick(sim, i)
+        renderer.draw(screen, sim, 0.5)
+        pygame.display.flip()
+        out.append(time.perf_counter_ns() - t0)
+    return out
+
+
+BENCHMARKS = {
+    "terrain.update_scroll": bench_update_scroll,
+    "terrain.height_at_world": bench_height_at_world,
+    "terrain.screen_height_slope": bench_screen_sampling,
+    "player.update": bench_player_update,
+    "collectibles.check_collect": bench_check_collect,
+    "collectibles.draw": bench_collectibles_draw,
+    "terrain.draw": bench_terrain_draw,
+    "ui.hud": bench_hud,
+    "frame": bench_frame,
+}
+
+
+# -------------------------
+# RUN
+# -------------------------
+def summarize(samples_ns):
+    a = np.asarray(samples_ns, dtype=np.float64) / 1000.0
+    return {
+        "n": int(a.size),
+        "median_us": round(float(np.median(a)), 3),
+        "p99_us": round(float(np.percentile(a, 99)), 3),
+        "mean_us": round(float(a.mean()), 3),
+    }
+
+
+def run(args):
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    background = pygame.transform.scale(
+        pygame.image.load("assets/images/background.jpg").convert(), (WIDTH, HEIGHT))
+    ctx = {"screen": screen, "background": background, "ui": UI()}
+    n = QUICK_ITERATIONS if args.quick else ITERATIONS
+
+    # chaque (benchmark, phase, seed) repart d'un monde fraîchement mis en place
+    results = {}
+    print(f"{'benchmark':<30} {'phase':<12} {'médiane (µs)':>13} {'p99 (µs)':>10}")
+    for name, fn in BENCHMARKS.items():
+        if args.only and args.only not in name:
+            continue
+        for phase, distance in PHASES.items():
+            samples = []
+            for seed in SEEDS:
+                ctx["seed"] = seed
+                sim = staged_sim(seed, distance)
+                fn(sim, ctx, WARMUP)
+                gc.collect()
+                samples += fn(sim, ctx, n)
+            stats = summarize(samples)
+            results[f"{name}/{phase}"] = stats
+            print(f"{name:<30} {phase:<12} {stats['median_us']:>13.2f} {stats['p99_us']:>10.2f}")
+
+    pygame.quit()
+
+    # démarrage : un lancement = un échantillon (s -> ns comme les autres benchmarks)
+    startup = {"startup.first_frame": "game_s", "startup.assets_ready": "game_ready_s"}
+    if any(not args.only or args.only in name for name in startup):
+        with tempfile.TemporaryDirectory() as tmp:
+            runs = measure(build_manifest(tmp), "lazy", QUICK_STARTUP_RUNS if args.quick else STARTUP_RUNS)
+        for name, key in startup.items():
+            if args.only and args.only not in name:
+                continue
+            stats = summarize([r[key] * 1e9 for r in runs])
+            results[f"{name}/pipeline"] = stats
+            print(f"{name:<30} {'pipeline':<12} {stats['median_us']:>13.2f} {stats['p99_us']:>10.2f}")
+
+    doc = {
+        "meta": {
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "machine": platform.machine(),
+            "seeds": list(SEEDS),
+            "phases": PHASES,
+            "iterations": n,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=1, sort_keys=True)
+    print(f"\n{len(results)} résultats -> {args.output}")
+    return 0
+
+
+# -------------------------
+# COMPARE
+# -------------------------
+def compare(args):
+    with open(args.base, "r", encoding="utf-8") as f:
+        base = json.load(f)["results"]
+    with open(args.new, "r", encoding="utf-8") as f:
+        new = json.load(f)["results"]
+
+    regressions = 0
+    print(f"{'benchmark':<43} {'médiane':>18} {'p99':>18}")
+    for key in sorted(set(base) | set(new)):
+        if key not in new:
+            print(f"{key:<43} {'(absent du nouveau fichier)':>37}")
+            continue
+        if key not in base:
+            print(f"{key:<43} {'(nouveau)':>37}")
+            continue
+        b, c = base[key], new[key]
+        r_med = c["median_us"] / max(b["median_us"], 1e-9)
+        r_p99 = c["p99_us"] / max(b["p99_us"], 1e-9)
+        bad = r_med > 1.0 + args.median_threshold or r_p99 > 1.0 + args.p99_threshold
+        regressions += bad
+        print(f"{key:<43} {b['median_us']:>8.2f} -> x{r_med:<6.2f} {b['p99_us']:>8.2f} -> x{r_p99:<6.2f}"
+              f"{'  RÉGRESSION' if bad else ''}")
+
+    print(f"\n{regressions} régression(s) (seuils : médiane +{args.median_threshold:.0%}, "
+          f"p99 +{args.p99_threshold:.0%})")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks déterministes de Tiny Wings")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="lance la suite et écrit les résultats (JSON)")
+    p_run.add_argument("-o", "--output", default="bench_results.json")
+    p_run.add_argument("--quick", action="store_true", help=f"{QUICK_ITERATIONS} itérations au lieu de {ITERATIONS}")
+    p_run.add_argument("--only", default="", help="ne lance que les benchmarks dont le nom contient ce texte")
+    p_run.set_defaults(func=run)
+
+    p_cmp = sub.add_parser("compare", help="compare deux fichiers de résultats")
+    p_cmp.add_argument("base")
+    p_cmp.add_argument("new")
+    p_cmp.add_argument("--median-threshold", type=float, default=MEDIAN_THRESHOLD)
+    p_cmp.add_argument("--p99-threshold", type=float, default=P99_THRESHOLD)
+    p_cmp.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,288 @@
+"""
+sweep.py — Balayage de paramètres sur parties sans affichage, sur plusieurs cœurs
+
+Chaque job = (combinaison de paramètres, seed) : une partie World jouée tick par tick
+par une politique d'input (POLICIES), jusqu'au game over ou MAX_TICKS. Les jobs sont
+répartis par lots sur un ProcessPoolExecutor (un processus par cœur par défaut) ; aucun
+état partagé, donc un débit quasi proportionnel au nombre de cœurs.
+
+Paramètres (--param nom=valeurs) :
+- difficulté (simulation.Tuning), en facteur des valeurs de chaque phase :
+  gap_every, gap_width, gap_ramp, night_k, night_b ;
+- joueur (attributs de Player), en valeur absolue : boost_push, uphill_drag, jump_decay, ...
+Valeurs : liste "a,b,c" (grille : produit cartésien), ou intervalle "lo:hi" avec
+--sample N (N combinaisons tirées au hasard, --sample-seed fixe).
+
+Résultats en colonnes dans le dossier de sortie : un fichier .npz par lot (job, combo,
+seed, paramètres, distance, score, pièces, ticks, time_s, death_reason) + sweep.json
+(la spécification). Relancer la même commande reprend un balayage interrompu : les
+jobs déjà présents sont sautés. « summary » agrège par combinaison.
+
+Usage (depuis la racine du projet) :
+    python bench/sweep.py run out/sweep1 --param gap_every=0.8,1,1.2 --param boost_push=160,200,240 --seeds 32
+    python bench/sweep.py run out/sweep2 --param night_k=0.9:1.1 --param jump_decay=0.7:0.85 --sample 40
+    python bench/sweep.py summary out/sweep1
+"""
+
+import argparse
+import glob
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import numpy as np  # noqa: E402
+
+from autopilot import Autopilot  # noqa: E402
+from player import Player  # noqa: E402
+from simulation import SIM_HZ, Tuning  # noqa: E402
+from world import World  # noqa: E402
+
+WIDTH, HEIGHT = 900, 600
+MAX_TICKS = 300 * SIM_HZ     # partie plafonnée à 5 min de jeu
+BATCH = 8                    # jobs par tâche envoyée à un processus
+SPEC_FILE = "sweep.json"
+
+
+# -------------------------
+# POLITIQUES D'INPUT : factory(seed) -> policy(world) -> (down, pressed)
+# -------------------------
+def scripted_policy(seed):
+    """Boost tenu 1 s sur 1,5 s, tap toutes les 0,75 s."""
+    def policy(world):
+        i = world.ticks
+        return (i % 180) < 120, (i % 90) == 0
+    return policy
+
+
+def random_policy(seed):
+    """Boost tenu par séquences de durée aléatoire, taps aléatoires (tirage seedé)."""
+    rng = random.Random(seed)
+    state = {"down": False, "until": 0}
+
+    def policy(world):
+        if world.ticks >= state["until"]:
+            state["down"] = not state["down"]
+            state["until"] = world.ticks + rng.randint(SIM_HZ // 4, 2 * SIM_HZ)
+        return state["down"], rng.random() < 0.01
+    return policy
+
+
+def bot_policy(seed):
+    """Bot par anticipation, sans budget de temps (décisions déterministes)."""
+    return Autopilot(budget_s=None)
+
+
+POLICIES = {
+    "scripted": scripted_policy,
+    "random": random_policy,
+    "bot": bot_policy,
+}
+
+
+# -------------------------
+# SPÉCIFICATION -> JOBS
+# -------------------------
+def parse_param(text):
+    """'nom=a,b,c' (liste) ou 'nom=lo:hi' (intervalle, pour --sample)."""
+    name, _, values = text.partition("=")
+    if name not in Tuning._fields and not hasattr(Player(0, 1), name):
+        raise SystemExit(f"paramètre inconnu : {name!r}")
+    if ":" in values:
+        lo, hi = (float(v) for v in values.split(":"))
+        return name, {"range": [lo, hi]}
+    return name, {"values": [float(v) for v in values.split(",")]}
+
+
+def parse_seeds(text):
+    """'32' (seeds 0..31) ou '100-131'."""
+    if "-" in text:
+        a, b = (int(v) for v in text.split("-"))
+        return list(range(a, b + 1))
+    return list(range(int(text)))
+
+
+def combos(spec):
+    """Combinaisons de paramètres (dicts), dans un ordre fixe."""
+    params = spec["params"]
+    names = sorted(params)
+    if spec["sample"]:
+        rng = random.Random(spec["sample_seed"])
+        out = []
+        for _ in range(spec["sample"]):
+            combo = {}
+            for name in names:
+                p = params[name]
+                combo[name] = rng.uniform(*p["range"]) if "range" in p else rng.choice(p["values"])
+            out.append(combo)
+        return out
+    for name in names:
+        if "range" in params[name]:
+            raise SystemExit(f"{name} : un intervalle demande --sample N")
+    return [dict(zip(names, vals)) for vals in itertools.product(*(params[n]["values"] for n in names))]
+
+
+def jobs(spec):
+    """(job, combo, seed, paramètres) pour tous les jobs de la spécification."""
+    out = []
+    for c, combo in enumerate(combos(spec)):
+        for seed in spec["seeds"]:
+            out.append((len(out), c, seed, combo))
+    return out
+
+
+# -------------------------
+# WORKER
+# -------------------------
+def play(seed, params, policy_name, max_ticks):
+    """Une partie sans affichage. Retourne (distance, score, pièces, ticks, death_reason)."""
+    tuning = Tuning(**{k: v for k, v in params.items() if k in Tuning._fields})
+    world = World(WIDTH, HEIGHT, seed=seed, tuning=tuning)
+    player = world.sim.player
+    for name, value in params.items():
+        if name not in Tuning._fields:
+            setattr(player, name, value)
+
+    policy = POLICIES[policy_name](seed)
+    tick = world.tick
+    while not world.game_over and world.ticks < max_ticks:
+        tick(*policy(world))
+    return world.sim.distance, world.score, world.coins, world.ticks, world.death_reason
+
+
+def run_batch(batch, policy_name, max_ticks):
+    """Lot de jobs -> colonnes (listes)."""
+    cols = {k: [] for k in ("job", "combo", "seed", "distance", "score", "coins", "ticks", "death_reason")}
+    for job, combo, seed, params in batch:
+        distance, score, coins, ticks, reason = play(seed, params, policy_name, max_ticks)
+        for k, v in zip(cols, (job, combo, seed, distance, score, coins, ticks, reason or "alive")):
+            cols[k].append(v)
+    return cols
+
+
+# -------------------------
+# RÉSULTATS (colonnes .npz)
+# -------------------------
+def load_results(out_dir):
+    """Toutes les colonnes du dossier, concaténées (dict nom -> ndarray), ou None."""
+    parts = [dict(np.load(p)) for p in sorted(glob.glob(os.path.join(out_dir, "part-*.npz")))]
+    if not parts:
+        return None
+    return {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
+
+
+def write_part(out_dir, cols, batch, hz):
+    """Un lot terminé -> part-<premier job>.npz (écrit sous un nom temporaire puis renommé)."""
+    names = sorted(batch[0][3])
+    arrays = {k: np.asarray(v) for k, v in cols.items()}
+    arrays["death_reason"] = np.asarray(cols["death_reason"], dtype="U8")
+    arrays["time_s"] = arrays["ticks"] / hz
+    for name in names:
+        arrays[name] = np.asarray([params[name] for _, _, _, params in batch])
+    path = os.path.join(out_dir, f"part-{batch[0][0]:07d}.npz")
+    tmp = os.path.join(out_dir, f"tmp-{batch[0][0]:07d}.npz")   # hors du motif part-*.npz
+    np.savez(tmp, **arrays)
+    os.replace(tmp, path)
+
+
+def run(args):
+    spec = {
+        "params": dict(parse_param(p) for p in args.param),
+        "seeds": parse_seeds(args.seeds),
+        "sample": args.sample,
+        "sample_seed": args.sample_seed,
+        "policy": args.policy,
+        "max_ticks": args.max_ticks,
+        "hz": SIM_HZ,
+    }
+    if args.policy not in POLICIES:
+        raise SystemExit(f"politique inconnue : {args.policy!r} ({', '.join(POLICIES)})")
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    spec_path = os.path.join(args.out_dir, SPEC_FILE)
+    if os.path.exists(spec_path):
+        with open(spec_path, "r", encoding="utf-8") as f:
+            if json.load(f) != json.loads(json.dumps(spec)):
+                raise SystemExit(f"{args.out_dir} contient un autre balayage (cf. {SPEC_FILE})")
+    else:
+        with open(spec_path, "w", encoding="utf-8") as f:
+            json.dump(spec, f, indent=1)
+
+    all_jobs = jobs(spec)
+    done = load_results(args.out_dir)
+    done_ids = set(done["job"].tolist()) if done is not None else set()
+    todo = [j for j in all_jobs if j[0] not in done_ids]
+    batches = [todo[i:i + BATCH] for i in range(0, len(todo), BATCH)]
+    workers = args.workers or os.cpu_count() or 1
+    print(f"{len(all_jobs)} jobs ({len(combos(spec))} combinaisons x {len(spec['seeds'])} seeds), "
+          f"{len(done_ids)} déjà faits, {len(todo)} à faire sur {workers} processus")
+
+    t0 = time.perf_counter()
+    games = ticks = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_batch, b, spec["policy"], spec["max_ticks"]): b for b in batches}
+        for future in as_completed(futures):
+            cols = future.result()
+            write_part(args.out_dir, cols, futures[future], spec["hz"])
+            games += len(cols["job"])
+            ticks += sum(cols["ticks"])
+            spent = time.perf_counter() - t0
+            print(f"\r{games}/{len(todo)} parties, {games / spent * 60:.0f} parties/min, "
+                  f"{ticks / spent / 1000:.0f}k ticks/s", end="", flush=True)
+    print()
+    return summary(args)
+
+
+def summary(args):
+    cols = load_results(args.out_dir)
+    if cols is None:
+        print("aucun résultat")
+        return 1
+    with open(os.path.join(args.out_dir, SPEC_FILE), "r", encoding="utf-8") as f:
+        names = sorted(json.load(f)["params"])
+
+    reasons = sorted(set(cols["death_reason"].tolist()))
+    head = " ".join(f"{n[:10]:>10}" for n in names)
+    print(f"{head} | {'n':>4} | {'distance p50':>12} | {'score moy.':>10} | "
+          f"{'mort (s) p10/p50/p90':>20} | " + " ".join(f"{r:>6}" for r in reasons))
+    for c in np.unique(cols["combo"]):
+        m = cols["combo"] == c
+        t10, t50, t90 = np.percentile(cols["time_s"][m], (10, 50, 90))
+        vals = " ".join(f"{cols[n][m][0]:>10.4g}" for n in names)
+        counts = " ".join(f"{int((cols['death_reason'][m] == r).sum()):>6}" for r in reasons)
+        print(f"{vals} | {int(m.sum()):>4} | {np.median(cols['distance'][m]):>12.0f} | "
+              f"{cols['score'][m].mean():>10.0f} | {t10:>6.1f} {t50:>6.1f} {t90:>6.1f} | {counts}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Balayage de paramètres (parties sans affichage)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="lance (ou reprend) un balayage")
+    p_run.add_argument("out_dir")
+    p_run.add_argument("--param", action="append", default=[], help="nom=a,b,c ou nom=lo:hi")
+    p_run.add_argument("--seeds", default="16", help="nombre de seeds (0..N-1) ou intervalle a-b")
+    p_run.add_argument("--sample", type=int, default=0, help="N combinaisons tirées au hasard")
+    p_run.add_argument("--sample-seed", type=int, default=0)
+    p_run.add_argument("--policy", default="scripted", help=", ".join(POLICIES))
+    p_run.add_argument("--max-ticks", type=int, default=MAX_TICKS)
+    p_run.add_argument("--workers", type=int, default=0, help="processus (défaut : nombre de cœurs)")
+    p_run.set_defaults(func=run)
+
+    p_sum = sub.add_parser("summary", help="agrège les résultats par combinaison")
+    p_sum.add_argument("out_dir")
+    p_sum.set_defaults(func=summary)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,7 +7,8 @@ PAGES_BRANCH="gh-pages"
 APK_BASENAME="game.apk"
 TITLE_TEXT="Tiny Wings"
 TMP_DIR="/tmp/tw_webdeploy"
-BUILD_DIR="build/web"
+STAGE_DIR="build/stage"
+BUILD_DIR="$STAGE_DIR/build/web"
 
 # -------- HELPERS --------
 die() { echo "❌ $*" >&2; exit 1; }
@@ -18,6 +19,8 @@ require_cmd() { command -v "$1" >/dev/null 2>&1 || die "Commande manquante: $1";
 # -------- PRECHECKS --------
 require_cmd git
 require_cmd python
+# sons Ogg du build web (sans ffmpeg, build_assets.py livrerait des WAV non compressés)
+command -v ffmpeg >/dev/null 2>&1 || die "ffmpeg manquant : requis pour les sons du build web (cf. README)"
 
 git rev-parse --is-inside-work-tree >/dev/null 2>&1 || die "Pas dans un repo git"
 
@@ -28,13 +31,24 @@ CUR_BRANCH="$(git branch --show-current)"
 git diff --quiet || die "Working tree non clean (commit/stash avant)."
 git diff --cached --quiet || die "Index non clean (git status)."
 
+# -------- ASSETS --------
+# Dossier packagé : le jeu + les assets préparés seulement (ni originaux, ni bench/, ni tools/).
+# Assets refaits dans le dossier packagé : aucun fichier périmé (ex. WAV d'un build sans ffmpeg).
+rm -rf build
+mkdir -p "$STAGE_DIR/assets"
+info "Préparation des assets (tools/build_assets.py)..."
+python tools/build_assets.py --require-ffmpeg --out "$STAGE_DIR/assets/build" \
+    || die "Préparation des assets échouée"
+cp main.py "$STAGE_DIR/"
+cp -R src "$STAGE_DIR/"
+find "$STAGE_DIR" -name "__pycache__" -type d -prune -exec rm -rf {} +
+
 # -------- BUILD (pygbag) --------
 info "Build web via pygbag..."
 python -m pip install -q --upgrade pip
 python -m pip install -q pygbag
 
-rm -rf build
-python -m pygbag .
+python -m pygbag "$STAGE_DIR"
 
 [ -d "$BUILD_DIR" ] || die "Build folder introuvable: $BUILD_DIR"
 [ -f "$BUILD_DIR/index.html" ] || die "index.html introuvable dans $BUILD_DIR"
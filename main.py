@@ -1,9 +1,12 @@
 import sys
 import os
+import asyncio
 import importlib
 
 # Ajoute src/ au path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
-# Import du vrai jeu (src/main.py)
-importlib.import_module("main")
+# Import du vrai jeu (src/main.py) : l'import seul ne lance rien
+game = importlib.import_module("main")
+
+asyncio.run(game.main())
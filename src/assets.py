@@ -0,0 +1,161 @@
+"""
+assets.py — Chargement des assets (Tiny Wings)
+
+- ASSETS : images et sons du jeu, par priorité. Les assets critiques (fond) sont
+  chargés avant la première frame ; les autres (sons) le sont ensuite, quelques-uns
+  par frame (pump, sous budget de temps) : la première frame interactive n'attend
+  pas le décodage des sons, et le jeu affiche un état de chargement en attendant.
+- Manifest (assets/build/manifest.json, écrit par tools/build_assets.py) : fichiers
+  préparés pour chaque plateforme (fond déjà à la taille de rendu, sons compressés).
+  Sans manifest, les fichiers d'origine de assets/ sont chargés (le fond est alors
+  mis à la taille de rendu par le renderer, comme avant).
+- Un asset non critique absent ou illisible (ou un son sans mixer) vaut None : le jeu
+  continue sans lui (cf. audio.py) ; un asset critique manquant est une erreur.
+"""
+
+import json
+import os
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+import pygame
+
+ASSET_DIR = "assets"
+MANIFEST_PATH = os.path.join(ASSET_DIR, "build", "manifest.json")
+MANIFEST_FORMAT = "tiny-wings-assets"
+MANIFEST_VERSION = 1
+
+
+class AssetSpec(NamedTuple):
+    """Un asset : type (image / sound), fichier d'origine (dans assets/), priorité."""
+    kind: str
+    source: str
+    priority: int
+    critical: bool = False
+
+
+# Par priorité : le fond avant la première frame, puis les sons, les plus courts d'abord
+ASSETS: Dict[str, AssetSpec] = {
+    "background": AssetSpec("image", "images/background.jpg", 0, critical=True),
+    "coin": AssetSpec("sound", "sounds/coin.wav", 1),
+    "game_over": AssetSpec("sound", "sounds/gameover.wav", 2),
+    "music": AssetSpec("sound", "sounds/music_web.wav", 3),
+}
+
+
+def load_manifest(path: str = MANIFEST_PATH) -> Optional[dict]:
+    """Manifest du pipeline, ou None (absent, illisible ou d'une autre version)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("format") != MANIFEST_FORMAT or manifest.get("version") != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+class Assets:
+    """
+    Assets d'une plateforme ("desktop" ou "web") : load_critical() avant la première
+    frame, puis pump(budget_s) à chaque frame jusqu'à done ; get(name) pour le résultat.
+    """
+
+    def __init__(self, platform: str = "desktop", manifest_path: Optional[str] = MANIFEST_PATH):
+        manifest = load_manifest(manifest_path) if manifest_path else None
+        self.prepared = manifest is not None
+        self.paths: Dict[str, str] = {}
+        self.sizes: Dict[str, int] = {}
+        for name, spec in ASSETS.items():
+            if manifest is not None:
+                entry = manifest["assets"].get(name)
+                if entry is None:
+                    continue
+                path = os.path.join(os.path.dirname(manifest_path), entry["files"][platform])
+            else:
+                path = os.path.join(ASSET_DIR, spec.source)
+            # un asset critique absent reste à charger : son erreur remonte au lancement
+            if os.path.exists(path):
+                self.paths[name] = path
+                self.sizes[name] = os.path.getsize(path)
+            elif spec.critical:
+                self.paths[name] = path
+                self.sizes[name] = 0
+
+        self.loaded: Dict[str, object] = {}
+        self.pending: List[str] = sorted(self.paths, key=lambda n: ASSETS[n].priority)
+        self.total_bytes = sum(self.sizes.values())
+        self.loaded_bytes = 0
+
+        # instrumentation : temps de chargement (décodage) par asset, fin du chargement
+        self.load_s: Dict[str, float] = {}
+        self.t_done: Optional[float] = None if self.pending else time.perf_counter()
+
+    @property
+    def done(self) -> bool:
+        return not self.pending
+
+    @property
+    def progress(self) -> float:
+        """Part (en octets) des assets chargés, entre 0 et 1."""
+        return self.loaded_bytes / self.total_bytes if self.total_bytes else 1.0
+
+    def get(self, name: str):
+        return self.loaded.get(name)
+
+    def load(self, name: str):
+        """Charge name tout de suite (s'il ne l'est pas déjà) ; retourne l'asset ou None."""
+        if name not in self.pending:
+            return self.loaded.get(name)
+        t0 = time.perf_counter()
+        kind = ASSETS[name].kind
+        path = self.paths[name]
+        asset = None
+        try:
+            if kind == "image":
+                asset = pygame.image.load(path)
+                if pygame.display.get_surface() is not None:
+                    asset = asset.convert()
+            elif pygame.mixer.get_init():
+                asset = pygame.mixer.Sound(path)
+        except (pygame.error, OSError):
+            if ASSETS[name].critical:
+                raise
+            asset = None
+        self.load_s[name] = time.perf_counter() - t0
+
+        self.pending.remove(name)
+        self.loaded[name] = asset
+        self.loaded_bytes += self.sizes[name]
+        if not self.pending:
+            self.t_done = time.perf_counter()
+        return asset
+
+    def load_critical(self) -> List[str]:
+        """Charge les assets nécessaires à la première frame ; retourne leurs noms."""
+        names = [n for n in self.pending if ASSETS[n].critical]
+        for name in names:
+            self.load(name)
+        return names
+
+    def load_all(self) -> List[str]:
+        """Charge tout ce qui reste (chargement immédiat, sans état de chargement)."""
+        names = list(self.pending)
+        for name in names:
+            self.load(name)
+        return names
+
+    def pump(self, budget_s: float) -> List[str]:
+        """
+        Charge les assets suivants, par priorité, tant qu'il reste du budget (au moins
+        un par appel : un chargement ne se découpe pas). Retourne les noms chargés.
+        """
+        names = []
+        t0 = time.perf_counter()
+        while self.pending:
+            name = self.pending[0]
+            self.load(name)
+            names.append(name)
+            if time.perf_counter() - t0 >= budget_s:
+                break
+        return names
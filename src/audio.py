@@ -0,0 +1,86 @@
+"""
+audio.py — Sons du jeu (Tiny Wings)
+
+- SFX (pièce, game over) + musique en boucle, bouton ON/OFF (volumes uniquement).
+- Sons fournis après coup par le chargement des assets (set_sound, cf. assets.py) :
+  tant qu'un son n'est pas chargé, il est simplement muet.
+- Web (pygbag) :
+  - musique jouée via pygame.mixer.Sound (plus fiable que mixer.music en Web),
+  - démarre après interaction utilisateur (try_start_music).
+- Sans mixer (ou fichiers absents) : tout devient silencieux, sans erreur.
+"""
+
+import pygame
+
+
+class Audio:
+    def __init__(self):
+        self.enabled = True
+        self.coin = None
+        self.game_over = None
+        self.music = None
+        self.music_channel = None
+        self.music_started = False
+
+        try:
+            pygame.mixer.init()
+        except Exception:
+            self.enabled = False
+
+        if pygame.mixer.get_init():
+            self.set_enabled(True)
+
+    def set_sound(self, name: str, sound) -> None:
+        """Son chargé (name : coin, game_over ou music), au volume courant."""
+        setattr(self, name, sound)
+        self.set_enabled(self.enabled)
+
+    def set_enabled(self, enabled: bool) -> None:
+        """ON/OFF son (web-safe) : volumes uniquement."""
+        self.enabled = enabled
+
+        if not pygame.mixer.get_init():
+            self.enabled = False
+            return
+
+        if self.coin:
+            self.coin.set_volume(0.5 if self.enabled else 0.0)
+        if self.game_over:
+            self.game_over.set_volume(0.6 if self.enabled else 0.0)
+        if self.music:
+            self.music.set_volume(0.4 if self.enabled else 0.0)
+
+    def try_start_music(self) -> None:
+        """Démarre la musique en boucle après interaction (web policy)."""
+        if self.music_started or self.music is None:
+            return
+        if not pygame.mixer.get_init():
+            return
+        try:
+            self.music.set_volume(0.4 if self.enabled else 0.0)
+            self.music_channel = self.music.play(loops=-1)
+            self.music_started = True
+        except pygame.error:
+            pass
+
+    def stop_music(self, rearm: bool = True) -> None:
+        """
+        Coupe la musique. rearm=True : try_start_music pourra la relancer (nouvelle partie) ;
+        rearm=False : elle reste coupée (écran de game over).
+        """
+        if self.music_channel:
+            try:
+                self.music_channel.stop()
+            except Exception:
+                pass
+        if rearm:
+            self.music_channel = None
+            self.music_started = False
+
+    def play_coin(self) -> None:
+        if self.enabled and self.coin:
+            self.coin.play()
+
+    def play_game_over(self) -> None:
+        if self.enabled and self.game_over:
+            self.game_over.play()
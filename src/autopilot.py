@@ -0,0 +1,207 @@
+"""
+autopilot.py — Bot de jeu par anticipation (Tiny Wings)
+
+Autopilot(world) -> (down, pressed) : même interface que les politiques d'input
+(bench/sweep.py) et que controls.ActionInput.poll() (boucle interactive, mode démo).
+
+Toutes les REPLAN_TICKS, il planifie :
+- requêtes groupées sur le terrain devant le joueur : profil du sol figé, de l'écran
+  au chunk gardé après le bord droit (Terrain.profile_screen : hauteurs, pentes par
+  différences) et trous à venir (Terrain.gaps.touching) ;
+- quelques plans candidats (boost tenu / relâché, tap immédiat ou plus tard, double
+  saut, changement à mi-horizon), chacun simulé en avance avec la vraie physique (copie
+  de Player sur une copie du profil, qui défile comme Terrain.update_scroll) à pas
+  PLAN_DT ; sans trou à portée et au sol, seuls les plans sans tap ;
+- note d'un plan : distance parcourue + énergie restante, lourde pénalité si la bille
+  tombe dans un trou (même règle que Simulation), pénalité si elle finit l'horizon sous
+  l'écran ; le meilleur plan est suivi jusqu'à la replanification.
+Calcul borné : horizon et pas fixes, candidats évalués par priorité jusqu'à
+budget_s par décision (None : tous, résultat déterministe pour les parties headless).
+Coût de planification par décision mesuré (stats, report()).
+"""
+
+import copy
+import time
+from typing import List, Optional, Tuple
+
+from simulation import FALL_MARGIN, SIM_HZ
+
+# Replanification (ticks de simulation), horizon et pas de la simulation anticipée (s)
+REPLAN_TICKS = 6
+HORIZON_S = 1.6
+PLAN_DT = 1.0 / 30
+
+# Budget de calcul par décision (s), mode interactif
+BUDGET_S = 0.002
+
+# Note d'un plan
+ENERGY_WEIGHT = 40.0      # px de distance équivalents à 1 point d'énergie
+FALL_PENALTY = 1e6        # chute dans un trou (game over) : plan écarté, plus tôt = pire
+DEPTH_WEIGHT = 20.0       # par px sous l'écran en fin d'horizon (chute probable juste après)
+
+# Plans candidats : (pas de l'horizon où taper, boost 1re moitié, boost 2e moitié), par
+# priorité. Les taps plus tardifs servent à juger s'il vaut mieux attendre pour sauter.
+PLANS = (
+    ((), True, True),
+    ((), False, False),
+    ((0,), True, True),
+    ((0,), False, False),
+    ((), True, False),
+    ((), False, True),
+    ((0,), False, True),
+    ((0,), True, False),
+    ((0, 8), True, True),
+    ((0, 8), False, False),
+    ((8,), True, True),
+    ((8,), False, False),
+)
+
+
+class _Profile:
+    """
+    Copie du sol figé à l'écran (x écran, y) qui défile : les méthodes de Terrain
+    utilisées par Player.update, sur des données fixes (simulation anticipée).
+    """
+
+    def __init__(self, xs: List[float], ys: List[float]):
+        self.x0 = xs[0]
+        self.dx = xs[1] - xs[0]
+        self.ys = ys
+        self.n = len(ys)
+        self.scroll = 0.0
+
+    def update_scroll(self, px: float) -> None:
+        self.scroll += px
+
+    def _u(self, x_screen: float) -> float:
+        return (x_screen + self.scroll - self.x0) / self.dx
+
+    def get_height_screen_x(self, x_screen: float) -> float:
+        u = self._u(x_screen)
+        ys = self.ys
+        if u <= 0.0:
+            return ys[0]
+        if u >= self.n - 1:
+            return ys[-1]
+        i = int(u)
+        return ys[i] + (u - i) * (ys[i + 1] - ys[i])
+
+    def get_slope_screen_x(self, x_screen: float) -> float:
+        i = min(max(int(self._u(x_screen)), 0), self.n - 2)
+        return (self.ys[i + 1] - self.ys[i]) / self.dx
+
+    def profile_screen(self, x_from: float, x_to: float) -> Tuple[List[float], List[float]]:
+        i0 = min(max(int(self._u(x_from) // 1), 0), self.n - 2)
+        u_b = self._u(x_to)
+        i1 = min(max(int(-(-u_b // 1)), i0 + 1), self.n - 1)
+        x = self.x0 - self.scroll
+        return [x + j * self.dx for j in range(i0, i1 + 1)], self.ys[i0:i1 + 1]
+
+
+class Autopilot:
+    """Politique d'input : autopilot(world) -> (down, pressed), à appeler à chaque tick (ou frame)."""
+
+    def __init__(self, budget_s: Optional[float] = BUDGET_S, replan_ticks: int = REPLAN_TICKS,
+                 horizon_s: float = HORIZON_S, plan_dt: float = PLAN_DT):
+        self.budget_s = budget_s
+        self.replan_ticks = replan_ticks
+        self.plan_steps = max(2, int(round(horizon_s / plan_dt)))
+        self.plan_dt = plan_dt
+
+        self._plan = PLANS[0]
+        self._plan_tick = None      # tick de la dernière décision
+        self._tapped = False
+
+        # instrumentation
+        self.decisions = 0
+        self.plan_time_s = 0.0
+        self.max_plan_s = 0.0
+        self.last_plan_s = 0.0
+        self.rollouts = 0
+        self.over_budget = 0        # décisions arrêtées par le budget
+
+    def __call__(self, world) -> Tuple[bool, bool]:
+        ticks = world.ticks
+        if self._plan_tick is None or ticks - self._plan_tick >= self.replan_ticks or ticks < self._plan_tick:
+            self._decide(world.sim)
+            self._plan_tick = ticks
+            self._tapped = False
+
+        taps, first, second = self._plan
+        pressed = 0 in taps and not self._tapped
+        self._tapped = True
+        # boost de la 1re moitié de l'horizon jusqu'à la replanification
+        return first, pressed
+
+    # -------------------------
+    # PLANIFICATION
+    # -------------------------
+    def _decide(self, sim) -> None:
+        t0 = time.perf_counter()
+        player = sim.player
+        terrain = sim.terrain
+
+        # requêtes groupées : profil du sol jusqu'au bord droit, trous à portée
+        xs, ys = terrain.profile_screen(player.x - player.vx_max * PLAN_DT, sim.width + terrain.chunk_w)
+        reach = player.x + player.vx_max * self.plan_steps * self.plan_dt
+        gaps = terrain.gaps.touching(terrain.world_x0 + player.x, terrain.world_x0 + reach,
+                                     terrain.gap_ramp)
+
+        # sans trou à portée et au sol : les plans sans tap suffisent
+        plans = PLANS if gaps or player.state != "SOL" else [p for p in PLANS if not p[0]]
+
+        best, best_score = self._plan, None
+        done = 0
+        for plan in plans:
+            score = self._rollout(player, xs, ys, sim.height, plan)
+            done += 1
+            if best_score is None or score > best_score:
+                best, best_score = plan, score
+            if self.budget_s is not None and time.perf_counter() - t0 > self.budget_s:
+                break
+        self._plan = best
+
+        spent = time.perf_counter() - t0
+        self.decisions += 1
+        self.rollouts += done
+        self.over_budget += done < len(plans)
+        self.plan_time_s += spent
+        self.last_plan_s = spent
+        if spent > self.max_plan_s:
+            self.max_plan_s = spent
+
+    def _rollout(self, player, xs, ys, height: int, plan) -> float:
+        """Simule plan sur l'horizon ; retourne sa note."""
+        p = copy.copy(player)
+        profile = _Profile(xs, ys)
+        taps, first, second = plan
+        dt = self.plan_dt
+        half = self.plan_steps // 2
+        travelled = 0.0
+        for step in range(self.plan_steps):
+            step_px = p.scroll_step(dt)
+            travelled += step_px
+            profile.update_scroll(step_px)
+            p.boosting = first if step < half else second
+            p.action_pressed = step in taps
+            p.update(dt, profile)
+            if p.y > height + FALL_MARGIN:
+                return -FALL_PENALTY * (self.plan_steps - step)
+        return travelled + ENERGY_WEIGHT * p.energy - DEPTH_WEIGHT * max(0.0, p.y - height)
+
+    # -------------------------
+    # RAPPORT
+    # -------------------------
+    def report(self) -> dict:
+        """Coût de planification : par décision (moyenne, max, dernière), rollouts, budget."""
+        n = max(self.decisions, 1)
+        return {
+            "decisions": self.decisions,
+            "mean_ms": self.plan_time_s / n * 1000.0,
+            "max_ms": self.max_plan_s * 1000.0,
+            "last_ms": self.last_plan_s * 1000.0,
+            "rollouts_per_decision": self.rollouts / n,
+            "over_budget": self.over_budget,
+            "per_tick_ms": self.plan_time_s / n / self.replan_ticks * 1000.0,
+            "replan_hz": SIM_HZ / self.replan_ticks,
+        }
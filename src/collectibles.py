@@ -1,74 +1,217 @@
+import bisect
 import math
+from array import array
+
 import pygame
 
+# Compactage du stockage quand plus de la moitié des pièces sont derrière (élaguées)
+COMPACT_MIN = 64
+
+# Sprite de pièce : disque extérieur + cœur clair (rayons en px), fond en colorkey
+COIN_OUTER = ((255, 215, 0), 10)
+COIN_INNER = ((255, 240, 150), 6)
+COIN_COLORKEY = (255, 0, 255)
+SPIN_FPS = 12.0
+
+# Pièces fixes : cuites par tranches de LAYER_PX px monde dans des calques
+# (blit par calque et non par pièce), recalculés quand une pièce y est ramassée.
+LAYER_PX = 256
+
+
+def make_coin_frames(n, scale=1.0):
+    """
+    n images de pièce pré-rendues (n=1 : pièce fixe, identique aux deux cercles
+    d'origine ; n>1 : rotation, largeur en |cos|), rayons à l'échelle scale.
+    """
+    (c_out, r_out), (c_in, r_in) = COIN_OUTER, COIN_INNER
+    r_out = max(1, int(round(r_out * scale)))
+    r_in = max(1, int(round(r_in * scale)))
+    size = 2 * r_out + 1
+    frames = []
+    for k in range(n):
+        surf = pygame.Surface((size, size))
+        surf.fill(COIN_COLORKEY)
+        if k == 0:
+            pygame.draw.circle(surf, c_out, (r_out, r_out), r_out)
+            pygame.draw.circle(surf, c_in, (r_out, r_out), r_in)
+        else:
+            w = max(0.15, abs(math.cos(math.pi * k / n)))
+            wo = max(2, int(2 * r_out * w))
+            wi = max(1, int(2 * r_in * w))
+            pygame.draw.ellipse(surf, c_out, pygame.Rect(r_out - wo // 2, 0, wo, size - 1))
+            pygame.draw.ellipse(surf, c_in, pygame.Rect(r_out - wi // 2, r_out - r_in, wi, 2 * r_in))
+        surf.set_colorkey(COIN_COLORKEY, pygame.RLEACCEL)
+        frames.append(surf)
+    return frames
+
+
 class CollectibleManager:
     """
     Gère des pièces/soleils en coordonnées 'monde' (world_x).
-    Placement: y = get_height(x_screen) - offset.
+    Positions lues dans les chunks du monde (terrain.coins_between, espacement coin_every du terrain).
+    Stockage compact trié par x : tableaux parallèles (x monde, y du sol, ramassée),
+    hauteur résolue une fois au spawn ; draw / check_collect ne lisent que la fenêtre
+    utile (bisect) au lieu de toute la liste.
+    Rendu : sprites pré-rendus, en un seul Surface.blits par frame :
+    - spin_frames=1 (fixe) : pièces cuites dans des calques par tranche de LAYER_PX,
+      coût quasi indépendant du nombre de pièces visibles ;
+    - spin_frames>1 (rotation) : un sprite par pièce.
+    Placement: y = hauteur du sol - offset.
     """
-    def __init__(self, width, height, dx_world=500, y_offset=40):
+    def __init__(self, width, height, y_offset=40, spin_frames=1):
         self.width = width
         self.height = height
-        self.dx_world = dx_world      # espacement monde entre collectibles
         self.y_offset = y_offset
-        self.items = []               # liste de dict: {"wx":..., "taken":False}
+
+        # sprites créés au premier draw (pygame initialisé)
+        self.spin_frames = max(1, int(spin_frames))
+        self._frames = None
+        self._scale = None            # échelle des sprites / calques en cache
+        self._r = COIN_OUTER[1]       # rayon des sprites (px, à l'échelle)
+        self._blit_seq = []
+        self._layers = {}             # tranche -> (Surface, top) ou None (vide)
+        self._dirty = set()           # tranches à recuire (pièce ramassée)
+
+        # x monde (référentiel distance : wx), y écran du sol, drapeau ramassée
+        self.xs = array("d")
+        self.ys = array("d")
+        self.taken = bytearray()
+        self._lo = 0                  # premier index vivant (élagage par la gauche)
+
         self.next_spawn_wx = 800.0
 
+    def __len__(self):
+        return len(self.xs) - self._lo
+
+    def _window(self, wx_min, wx_max):
+        """Indices [i0, i1) des pièces avec wx_min <= wx <= wx_max."""
+        i0 = bisect.bisect_left(self.xs, wx_min, self._lo)
+        i1 = bisect.bisect_right(self.xs, wx_max, i0)
+        return i0, i1
+
     def update(self, distance_world, player_x_screen, terrain):
         """
         distance_world : distance parcourue (monde)
-        terrain        : utilisé pour get_height_screen_x
+        terrain        : source des positions et hauteurs (chunks monde, lus sans les figer)
         """
-        # Spawn en avance
-        while self.next_spawn_wx < distance_world + 2500:
-            self.items.append({"wx": self.next_spawn_wx, "taken": False})
-            self.next_spawn_wx += self.dx_world
+        # Spawn en avance (x terrain = wx + player_x_screen)
+        horizon = distance_world + 2500
+        if self.next_spawn_wx < horizon:
+            txs = terrain.coins_between(self.next_spawn_wx + player_x_screen,
+                                        horizon + player_x_screen)
+            if txs:
+                self.ys.extend(terrain.chunk_heights(txs))
+                self.xs.extend(tx - player_x_screen for tx in txs)
+                self.taken.extend(bytes(len(txs)))
+            self.next_spawn_wx = horizon
 
-        # Nettoyage
+        # Nettoyage : les pièces très loin derrière sortent par la gauche
         cutoff = distance_world - 2000
-        if len(self.items) > 0 and self.items[0]["wx"] < cutoff:
-            # supprime les items très loin derrière
-            self.items = [it for it in self.items if it["wx"] >= cutoff]
-
-    def draw(self, screen, distance_world, player_x_screen, terrain):
-        """Dessine les collectibles visibles."""
-        for it in self.items:
-            if it["taken"]:
-                continue
+        self._lo = bisect.bisect_left(self.xs, cutoff, self._lo)
+        if self._lo >= COMPACT_MIN and self._lo * 2 >= len(self.xs):
+            del self.xs[:self._lo]
+            del self.ys[:self._lo]
+            del self.taken[:self._lo]
+            self._lo = 0
 
-            # conversion world->screen
-            x_screen = player_x_screen + (it["wx"] - distance_world)
+    def _build_layer(self, layer):
+        """Cuit les pièces non ramassées de la tranche dans un calque (colorkey RLE), à l'échelle courante."""
+        lo = layer * LAYER_PX
+        i0 = bisect.bisect_left(self.xs, lo, self._lo)
+        i1 = bisect.bisect_left(self.xs, lo + LAYER_PX, i0)
+        r, scale = self._r, self._scale
+        lx = int(math.floor(lo * scale + 0.5))
+        pts = [(int(math.floor(self.xs[i] * scale + 0.5)) - lx,
+                int((self.ys[i] - self.y_offset) * scale) - r)
+               for i in range(i0, i1) if not self.taken[i]]
+        if not pts:
+            return None
 
-            if x_screen < -50 or x_screen > self.width + 50:
-                continue
+        top = min(y for _, y in pts)
+        bottom = max(y for _, y in pts) + 2 * r + 1
+        surf = pygame.Surface((int(math.ceil(LAYER_PX * scale)) + 2 * r + 1, bottom - top))
+        surf.fill(COIN_COLORKEY)
+        sprite = self._frames[0]
+        surf.blits([(sprite, (x, y - top)) for x, y in pts], False)
+        surf.set_colorkey(COIN_COLORKEY, pygame.RLEACCEL)
+        return surf, top
 
-            y_ground = terrain.get_height_screen_x(x_screen)
-            y = y_ground - self.y_offset
+    def draw(self, screen, distance_world, player_x_screen, terrain, distance_render=None, time_s=0.0,
+             scale=1.0):
+        """
+        Dessine les collectibles visibles (un seul Surface.blits).
+        distance_render : distance interpolée (rendu), par défaut distance_world.
+        time_s          : horloge d'animation (rotation), ignorée si spin_frames=1.
+        scale           : échelle de rendu (résolution interne) ; sprites et calques refaits si elle change.
+        """
+        if distance_render is None:
+            distance_render = distance_world
+        if scale != self._scale:
+            self._frames = make_coin_frames(self.spin_frames, scale)
+            self._r = self._frames[0].get_width() // 2
+            self._scale = scale
+            self._layers.clear()
+            self._dirty.clear()
+        frames = self._frames
+        n = len(frames)
+        r = self._r
 
-            # dessin simple (soleil/pièce)
-            pygame.draw.circle(screen, (255, 215, 0), (int(x_screen), int(y)), 10)
-            pygame.draw.circle(screen, (255, 240, 150), (int(x_screen), int(y)), 6)
+        # conversion world->screen : x_screen = player_x_screen + (wx - distance)
+        base = player_x_screen - distance_render
+        seq = self._blit_seq
+        seq.clear()
+
+        if n == 1:
+            # calques : un offset entier commun (comme les chunks de terrain)
+            ox = int(math.floor(base * scale + 0.5))
+            l_lo = int(math.floor((-50 - base) / LAYER_PX))
+            l_hi = int(math.floor((self.width + 50 - base) / LAYER_PX))
+            layers = self._layers
+            for layer in [k for k in layers if k < l_lo or k > l_hi]:
+                del layers[layer]
+                self._dirty.discard(layer)
+            for layer in range(l_lo, l_hi + 1):
+                if layer in self._dirty or layer not in layers:
+                    layers[layer] = self._build_layer(layer)
+                    self._dirty.discard(layer)
+                entry = layers[layer]
+                if entry is not None:
+                    lx = int(math.floor(layer * LAYER_PX * scale + 0.5))
+                    seq.append((entry[0], (ox + lx - r, entry[1])))
+        else:
+            # rotation : un sprite par pièce, phase propre à chaque pièce (tirée de son x)
+            i0, i1 = self._window(-50 - base, self.width + 50 - base)
+            xs, ys, taken = self.xs, self.ys, self.taken
+            f0 = int(time_s * SPIN_FPS)
+            for i in range(i0, i1):
+                if not taken[i]:
+                    frame = frames[(f0 + int(xs[i]) // 64) % n]
+                    seq.append((frame, (int((base + xs[i]) * scale) - r,
+                                        int((ys[i] - self.y_offset) * scale) - r)))
+
+        if seq:
+            screen.blits(seq, False)
 
     def check_collect(self, distance_world, player_x_screen, player_y, terrain, collect_radius=18):
         """
-        Ramassage par distance (pas de Rect).
+        Ramassage par distance (pas de Rect), sur les seules pièces à portée en x.
         Retourne le nombre d'items ramassés cette frame.
         """
         got = 0
-        for it in self.items:
-            if it["taken"]:
+        r2 = collect_radius * collect_radius
+        i0, i1 = self._window(distance_world - collect_radius, distance_world + collect_radius)
+        xs, ys, taken = self.xs, self.ys, self.taken
+        for i in range(i0, i1):
+            if taken[i]:
                 continue
 
-            x_screen = player_x_screen + (it["wx"] - distance_world)
-            if x_screen < -50 or x_screen > self.width + 50:
-                continue
-
-            y_ground = terrain.get_height_screen_x(x_screen)
-            y = y_ground - self.y_offset
-
-            dx = x_screen - player_x_screen
-            dy = y - player_y
-            if dx*dx + dy*dy <= collect_radius*collect_radius:
-                it["taken"] = True
+            dx = xs[i] - distance_world
+            dy = ys[i] - self.y_offset - player_y
+            if dx*dx + dy*dy <= r2:
+                taken[i] = 1
                 got += 1
-        return got
\ No newline at end of file
+                # seul un calque déjà cuit est à refaire (headless : aucun calque)
+                layer = int(math.floor(xs[i] / LAYER_PX))
+                if layer in self._layers:
+                    self._dirty.add(layer)
+        return got
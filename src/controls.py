@@ -0,0 +1,60 @@
+"""
+controls.py — Adaptateur d'inputs (Tiny Wings)
+
+ActionInput : traduit les événements pygame (ESPACE, souris / tap écran, doigts)
+en une action unique :
+- down    : état (tenue = boost),
+- pressed : edge (tap = saut), levé entre deux poll().
+Même action sur desktop et mobile (pas de clavier virtuel). Aucune dépendance à la
+simulation : poll() donne les arguments de World.step.
+"""
+
+from typing import Tuple
+
+import pygame
+
+# Touch events : absents de certains builds pygame
+_FINGERDOWN = getattr(pygame, "FINGERDOWN", None)
+_FINGERUP = getattr(pygame, "FINGERUP", None)
+
+
+class ActionInput:
+    """handle(event) pour chaque événement, puis poll() une fois par frame."""
+
+    def __init__(self):
+        self.down = False       # état (hold)
+        self.pressed = False    # edge (tap), depuis le dernier poll
+
+    def press(self) -> None:
+        """Action principale ON (equiv. ESPACE down / touch down)."""
+        if not self.down:
+            self.pressed = True
+        self.down = True
+
+    def release(self) -> None:
+        """Action principale OFF (equiv. ESPACE up / touch up)."""
+        self.down = False
+
+    def reset(self) -> None:
+        self.down = False
+        self.pressed = False
+
+    def handle(self, event) -> bool:
+        """Met à jour l'action depuis un événement pygame. True si l'événement la concerne."""
+        t = event.type
+        # Desktop: SPACE ; Mobile/Web: touch souvent via souris
+        if (t == pygame.KEYDOWN and event.key == pygame.K_SPACE) or t == pygame.MOUSEBUTTONDOWN \
+                or (_FINGERDOWN is not None and t == _FINGERDOWN):
+            self.press()
+            return True
+        if (t == pygame.KEYUP and event.key == pygame.K_SPACE) or t == pygame.MOUSEBUTTONUP \
+                or (_FINGERUP is not None and t == _FINGERUP):
+            self.release()
+            return True
+        return False
+
+    def poll(self) -> Tuple[bool, bool]:
+        """(down, pressed) de la frame ; l'edge est consommé."""
+        pressed = self.pressed
+        self.pressed = False
+        return self.down, pressed
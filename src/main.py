@@ -1,401 +1,354 @@
 """
 main.py — Tiny Wings (Pygame)
 
-Boucle principale du jeu.
-- Terrain infini (sinus) + scrolling piloté par vx.
-- Player + collectibles + score.
+Boucle principale du jeu (Game) : fenêtre, événements, audio, rendu. Rien n'est
+initialisé à l'import (fenêtre, mixer, polices) : uniquement dans Game / main().
+- Partie : world.World (simulation à pas fixe SIM_HZ, indépendante du FPS, sans
+  affichage) avancée par step(dt, down, pressed) ; ses événements (pièce, game over)
+  déclenchent sons et highscore. Le rendu interpole entre les deux derniers ticks.
+- Terrain infini + scrolling piloté par vx ; player + collectibles + score.
 - 3 causes de Game Over : nuit, chute dans un trou, énergie à 0 trop longtemps.
-- Audio : SFX + musique + bouton ON/OFF (touche M).
+- Difficulté : voir simulation.py (Level 1 à 3).
+- Audio (audio.py) : SFX + musique + bouton ON/OFF (touche M).
+- Assets (assets.py) : fichiers préparés par tools/build_assets.py s'il y a un manifest
+  (fond à la taille de rendu, sons compressés), sinon ceux d'origine ; seul le fond
+  est chargé avant la première frame, les sons ensuite, sous budget (ASSET_BUDGET_S),
+  avec un état de chargement à l'écran.
 - Web (pygbag) :
-  - musique jouée via pygame.mixer.Sound (plus fiable que mixer.music en Web),
-  - démarre après interaction utilisateur,
+  - musique démarrée après interaction utilisateur,
   - boucle async + await asyncio.sleep(0) pour éviter "Page ne répond pas".
-- Difficulté :
-  - Level 1 : terrain lisse, pas de trous
-  - Level 2 : terrain plus nerveux, quelques trous (max 4)
-  - Level 3 : terrain + trous deviennent plus durs progressivement avec la distance
-- Mobile :
-  - tap/hold écran = même action que ESPACE (pas de clavier virtuel)
+- Inputs (controls.py) : tap/hold écran = même action que ESPACE (pas de clavier virtuel).
+- Rendu (render.py) : frame complète ; résolution interne RENDER_SCALE agrandie dans
+  une fenêtre redimensionnable ; qualité adaptée au temps de frame mesuré (quality.py).
+- Terrain : chunks à venir générés en fin de frame sous budget (GEN_BUDGET_S),
+  pour éviter les pics quand dt explose (changement d'onglet, GC).
+- Profilage (profiler.py) : temps par phase de la frame, overlay sur F3,
+  export CSV / JSON à la fermeture (TINYWINGS_PROFILE_OUT).
+- Replay (replay.py) : TINYWINGS_RECORD enregistre la partie (seed, dt, actions) ;
+  TINYWINGS_REPLAY la rejoue en temps réel, avec rendu, à la
+  place des inputs (sessions de mesure sans humain) ; à la fin, le monde reste figé
+  sur l'écran de fin : ESC quitte, R relance le rejeu.
+- Démo (autopilot.py, TINYWINGS_AUTOPILOT=1) : le bot joue et relance les parties ;
+  la première action du joueur lui rend la main.
 """
 
-import pygame
-import sys
 import asyncio
+import os
+import sys
+import time
 
-from terrain import Terrain
-from player import Player
-from ui import UI
-from collectibles import CollectibleManager
+import pygame
 
-pygame.init()
+from assets import ASSETS, MANIFEST_PATH, Assets
+from audio import Audio
+from autopilot import Autopilot
+from controls import ActionInput
+from profiler import FrameProfiler
+from quality import QualityGovernor, level_index
+from render import FrameRenderer, Viewport
+from replay import Recording
+from ui import UI
+from world import COIN, GAME_OVER, World
 
 IS_WEB = (sys.platform == "emscripten")
 
-# -------------------------
-# AUDIO (SFX + MUSIC as Sound) + MUTE
-# -------------------------
-AUDIO_ENABLED = True
-SOUND_COIN = None
-SOUND_GAMEOVER = None
-
-MUSIC = None
-music_channel = None
-music_started = False
-user_interacted = False
-
-try:
-    pygame.mixer.init()
-    SOUND_COIN = pygame.mixer.Sound("assets/sounds/coin.wav")
-    SOUND_GAMEOVER = pygame.mixer.Sound("assets/sounds/gameover.wav")
-    MUSIC = pygame.mixer.Sound("assets/sounds/music_web.wav")
-except Exception:
-    AUDIO_ENABLED = False
-
-
-def set_audio_enabled(enabled: bool) -> None:
-    """ON/OFF son (web-safe) : volumes uniquement."""
-    global AUDIO_ENABLED
-    AUDIO_ENABLED = enabled
-
-    if not pygame.mixer.get_init():
-        AUDIO_ENABLED = False
-        return
-
-    if SOUND_COIN:
-        SOUND_COIN.set_volume(0.5 if AUDIO_ENABLED else 0.0)
-    if SOUND_GAMEOVER:
-        SOUND_GAMEOVER.set_volume(0.6 if AUDIO_ENABLED else 0.0)
-    if MUSIC:
-        MUSIC.set_volume(0.4 if AUDIO_ENABLED else 0.0)
-
-
-def try_start_music() -> None:
-    """Démarre la musique en boucle après interaction (web policy)."""
-    global music_started, music_channel
-    if music_started or MUSIC is None:
-        return
-    if not pygame.mixer.get_init():
-        return
-    try:
-        MUSIC.set_volume(0.4 if AUDIO_ENABLED else 0.0)
-        music_channel = MUSIC.play(loops=-1)
-        music_started = True
-    except pygame.error:
-        pass
-
-
-if pygame.mixer.get_init():
-    set_audio_enabled(True)
-
 # -------------------------
 # WINDOW
 # -------------------------
 WIDTH, HEIGHT = 900, 600
 FPS = 60
 
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Tiny Wings")
-
-background = pygame.image.load("assets/images/background.jpg").convert()
-background = pygame.transform.scale(background, (WIDTH, HEIGHT))
-
-clock = pygame.time.Clock()
-
-GROUND = (70, 190, 110)
-OUTLINE = (10, 60, 25)
-
-ui = UI()
-
-# -------------------------
-# INPUT ABSTRACTION (Desktop + Mobile)
-# -------------------------
-ACTION_DOWN = False       # état (hold)
-ACTION_PRESSED = False    # edge (tap)
-
-
-def action_down() -> None:
-    """Action principale ON (equiv. ESPACE down / touch down)."""
-    global ACTION_DOWN, ACTION_PRESSED
-    if not ACTION_DOWN:
-        ACTION_PRESSED = True
-    ACTION_DOWN = True
-
-
-def action_up() -> None:
-    """Action principale OFF (equiv. ESPACE up / touch up)."""
-    global ACTION_DOWN
-    ACTION_DOWN = False
-
-
-def reset_game():
-    """Réinitialise une partie (objets + compteurs)."""
-    terrain = Terrain(WIDTH, HEIGHT, dx=14, base_y_ratio=0.65)
-
-    bg_terrain = Terrain(WIDTH, HEIGHT, dx=30, base_y_ratio=0.65)
-    bg_terrain.waves = [(35, 0.006), (18, 0.012)]
-
-    player = Player(x_screen=250, radius=12)
-
-    collectibles = CollectibleManager(WIDTH, HEIGHT, dx_world=500, y_offset=45)
-    coins = 0
-
-    distance = 0.0
-    score = 0.0
-    night_world_x = -1200.0
-    energy_zero_time = 0.0
-
-    game_over = False
-    final_score = 0.0
-    game_over_time = 0.0
-    new_record = False
-    death_reason = ""
-
-    return (
-        terrain, bg_terrain, player, collectibles, coins,
-        distance, score, night_world_x, energy_zero_time,
-        game_over, final_score, game_over_time, new_record, death_reason
-    )
-
-
-(
-    terrain, bg_terrain, player, collectibles, coins,
-    distance, score, night_world_x, energy_zero_time,
-    game_over, final_score, game_over_time, new_record, death_reason
-) = reset_game()
-
-running = True
-phase = 0
-prev_phase = 0
-
-
-async def run():
-    global running, phase, prev_phase
-    global terrain, bg_terrain, player, collectibles, coins
-    global distance, score, night_world_x, energy_zero_time
-    global game_over, final_score, game_over_time, new_record, death_reason
-    global AUDIO_ENABLED, music_started, user_interacted, music_channel
-    global ACTION_DOWN, ACTION_PRESSED
-
-    while running:
-        dt = clock.tick(FPS) / 1000.0
-
-        # reset edge chaque frame
-        ACTION_PRESSED = False
-
-        # -------- EVENTS --------
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-
-            # WebAudio: 1ère interaction
-            if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
-                user_interacted = True
-                if not music_started:
-                    try_start_music()
-
-            # Toggle audio ON/OFF (M)
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_m:
-                set_audio_enabled(not AUDIO_ENABLED)
-                if user_interacted and (not music_started):
-                    try_start_music()
-
-            # ---- ACTION INPUT ----
-            # Desktop: SPACE
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                action_down()
-            if event.type == pygame.KEYUP and event.key == pygame.K_SPACE:
-                action_up()
-
-            # Mobile/Web: touch souvent via souris
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                action_down()
-            if event.type == pygame.MOUSEBUTTONUP:
-                action_up()
-
-            # Touch events (si disponibles selon build pygame)
-            if hasattr(pygame, "FINGERDOWN") and event.type == pygame.FINGERDOWN:
-                action_down()
-            if hasattr(pygame, "FINGERUP") and event.type == pygame.FINGERUP:
-                action_up()
-
-            # GAME OVER inputs
-            if game_over and event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-                elif event.key == pygame.K_r:
-                    (
-                        terrain, bg_terrain, player, collectibles, coins,
-                        distance, score, night_world_x, energy_zero_time,
-                        game_over, final_score, game_over_time, new_record, death_reason
-                    ) = reset_game()
-
-                    # reset musique (redémarre après interaction)
-                    if music_channel:
-                        try:
-                            music_channel.stop()
-                        except Exception:
-                            pass
-                    music_channel = None
-                    music_started = False
-                    user_interacted = False
-
-                    prev_phase = 0
-                    phase = 0
-                    ACTION_DOWN = False
-                    ACTION_PRESSED = False
-
-        # retry auto musique si interaction déjà faite
-        if user_interacted and (not music_started):
-            try_start_music()
-
-        # -------- UPDATE --------
-        if not game_over:
-            distance += player.vx * dt
-
-            mult = 2.0 if player.air_time >= 2.0 else 1.0
-            score += (player.vx * dt) * mult
-
-            prev_phase = phase
-            if distance < 12000:
-                phase = 0
-            elif distance < 30000:
-                phase = 1
-            else:
-                phase = 2
-
-            # changement de niveau -> reset trous
-            if phase != prev_phase:
-                terrain.gaps = []
-                terrain.next_gap_wx = distance + 900
-
-            # ---- difficulté / paramètres ----
-            if phase == 0:
-                terrain.gaps_enabled = False
-                terrain.gaps = []
-                terrain.set_waves([(55, 0.008), (25, 0.016), (10, 0.030)])
-                night_k, night_b = 0.80, 40.0
-
-            elif phase == 1:
-                terrain.gaps_enabled = True
-                terrain.set_waves([(70, 0.010), (35, 0.020), (15, 0.040)])
-                terrain.gap_every = 5000.0
-                terrain.gap_width = 90.0
-                terrain.gap_ramp = 260.0
-                if len(terrain.gaps) >= 4:
-                    terrain.gaps_enabled = False
-                night_k, night_b = 0.90, 60.0
-
-            else:
-                t3 = min(max((distance - 30000.0) / 60000.0, 0.0), 1.0)
-
-                waves_easy = [(75, 0.010), (38, 0.022), (18, 0.045)]
-                waves_hard = [(95, 0.016), (55, 0.035), (28, 0.070)]
-                terrain.set_waves([
-                    (waves_easy[i][0] + (waves_hard[i][0] - waves_easy[i][0]) * t3,
-                     waves_easy[i][1] + (waves_hard[i][1] - waves_easy[i][1]) * t3)
-                    for i in range(3)
-                ])
-
-                terrain.gaps_enabled = True
-                terrain.gap_every = 1800.0 - 900.0 * t3
-                terrain.gap_width = 140.0 + 140.0 * t3
-                terrain.gap_ramp = 240.0 - 80.0 * t3
-
-                night_k, night_b = 1.00, 100.0
-
-            # ---- nuit + scrolling ----
-            night_world_x += (player.vx * night_k + night_b) * dt
-
-            bg_terrain.update_scroll(player.vx * dt * 0.5)
-            terrain.update_scroll(player.vx * dt)
-
-            # ---- player input injection ----
-            player.boosting = ACTION_DOWN
-            player.action_pressed = ACTION_PRESSED
-            player.update(dt, terrain)
-
-            # collectibles
-            collectibles.update(distance, player.x, terrain)
-            got = collectibles.check_collect(distance, player.x, player.y, terrain)
-            if got > 0:
-                coins += got
-                if AUDIO_ENABLED and SOUND_COIN:
-                    SOUND_COIN.play()
-
-            # ---- game over ----
-            if night_world_x >= distance:
-                game_over = True
-                death_reason = "night"
-
-            if (not game_over) and (player.y > HEIGHT + 200):
-                game_over = True
-                death_reason = "hole"
-
-            if player.energy <= 0.01:
-                energy_zero_time += dt
+# Résolution de rendu interne (fraction de la taille affichée) : 0.5 / 0.75 pour les GPU faibles
+# Agrandissement : "sdl" (fenêtre pygame.SCALED, fait par SDL) ou "cpu" (transform.scale par frame).
+RENDER_SCALE = float(os.environ.get("TINYWINGS_SCALE", "1.0"))
+UPSCALE = os.environ.get("TINYWINGS_UPSCALE", "sdl")
+
+# Qualité de rendu : "auto" (gouverneur piloté par le temps de frame) ou niveau fixe
+# ("high", "medium", "low" ou son index), cf. quality.py
+QUALITY = os.environ.get("TINYWINGS_QUALITY", "auto")
+
+
+# Budget (s) de génération de terrain en avance, par frame (après le flip, avant de rendre la main)
+GEN_BUDGET_S = 0.001
+
+# Assets : "lazy" (sons chargés après la première frame, ASSET_BUDGET_S par frame) ou
+# "eager" (tout avant la première frame) ; manifest du pipeline ("" : fichiers d'origine).
+ASSET_LOADING = os.environ.get("TINYWINGS_ASSETS", "lazy")
+ASSET_MANIFEST = os.environ.get("TINYWINGS_ASSET_MANIFEST", MANIFEST_PATH)
+ASSET_BUDGET_S = 0.004
+
+# Profilage : mesure dès le lancement (sinon tant que l'overlay est affiché, F3),
+# et fichier d'export (.csv ou .json) écrit à la fermeture ; l'export active la mesure.
+PROFILE_OUT = os.environ.get("TINYWINGS_PROFILE_OUT", "")
+PROFILE = os.environ.get("TINYWINGS_PROFILE", "0") == "1" or bool(PROFILE_OUT)
+
+# Replay : fichier où enregistrer la partie (écrit au game over et à la fermeture ;
+# une nouvelle partie remplace la précédente), ou enregistrement à rejouer.
+RECORD_PATH = os.environ.get("TINYWINGS_RECORD", "")
+REPLAY_PATH = os.environ.get("TINYWINGS_REPLAY", "")
+
+# Mode démo : le bot joue (budget de planification autopilot.BUDGET_S par décision),
+# nouvelle partie DEMO_RESTART_S secondes après un game over.
+AUTOPILOT = os.environ.get("TINYWINGS_AUTOPILOT", "0") == "1"
+DEMO_RESTART_S = 3.0
+
+
+class Game:
+    """Fenêtre + boucle interactive autour d'un World."""
+
+    def __init__(self):
+        # instrumentation du démarrage (perf_counter) : création, première frame affichée
+        self.t_created = time.perf_counter()
+        self.t_first_frame = None
+
+        pygame.init()
+        self.audio = Audio()
+        self.user_interacted = False
+
+        # échelle restant à appliquer par le Viewport (1.0 si SDL agrandit déjà la fenêtre)
+        self.screen = None
+        self.view_scale = RENDER_SCALE
+        if RENDER_SCALE != 1.0 and UPSCALE == "sdl":
+            # la fenêtre affiche la Surface interne, agrandie par SDL (GPU / canvas web)
+            try:
+                self.screen = pygame.display.set_mode(
+                    (int(WIDTH * RENDER_SCALE), int(HEIGHT * RENDER_SCALE)),
+                    pygame.SCALED | pygame.RESIZABLE)
+                self.view_scale = 1.0
+            except pygame.error:
+                self.screen = None
+        if self.screen is None:
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
+        self.viewport = Viewport(WIDTH, HEIGHT, self.view_scale)
+        pygame.display.set_caption("Tiny Wings")
+
+        # assets critiques (fond) avant la première frame, le reste à la demande (pump)
+        self.assets = Assets("web" if IS_WEB else "desktop", ASSET_MANIFEST or None)
+        self.on_assets(self.assets.load_all() if ASSET_LOADING == "eager" else self.assets.load_critical())
+        # fond mis à la taille de rendu par le renderer s'il ne l'est pas déjà (et à chaque redimensionnement)
+        background = self.assets.get("background")
+
+        self.clock = pygame.time.Clock()
+
+        self.ui = UI()
+        self.renderer = FrameRenderer(background, self.ui)
+        self.governor = QualityGovernor(FPS, start=0 if QUALITY == "auto" else level_index(QUALITY),
+                                        adaptive=(QUALITY == "auto"))
+        self.apply_quality()
+
+        self.controls = ActionInput()
+        self.profiler = FrameProfiler(enabled=PROFILE, fps=FPS)
+        self.replay = Recording.load(REPLAY_PATH) if REPLAY_PATH else None
+        self.recording = None
+        self.autopilot = Autopilot() if AUTOPILOT and self.replay is None else None
+        self.running = True
+        self.reset()
+
+    def fit_window(self) -> None:
+        """(Re)cale la résolution interne sur la fenêtre (lancement, redimensionnement)."""
+        self.screen = pygame.display.get_surface()
+        if self.viewport.fit(self.screen):
+            self.renderer.set_scale(self.viewport.scale)
+
+    def apply_quality(self) -> None:
+        """Applique le niveau courant du gouverneur (rendu + résolution interne)."""
+        level = self.governor.level
+        self.renderer.set_quality(level)
+        self.viewport.render_scale = self.view_scale * level.render_scale
+        self.fit_window()
+
+    def reset(self, seed=None) -> None:
+        """Nouvelle partie (monde + compteurs d'affichage). seed=None : monde aléatoire."""
+        if self.replay is not None:
+            self.world = self.replay.new_world()
+            self.replay_frame = 0
+        else:
+            self.world = World(WIDTH, HEIGHT, seed=seed)
+        if RECORD_PATH:
+            self.recording = Recording(self.world.seed, WIDTH, HEIGHT)
+        self.game_over_time = 0.0
+        self.new_record = False
+        # partie du joueur : seule à compter pour le record (ni bot, ni replay)
+        self.player_game = self.autopilot is None and self.replay is None
+        self.controls.reset()
+        self.attach_profiler()
+
+    @property
+    def replay_done(self) -> bool:
+        """Rejeu en cours arrivé à la fin de l'enregistrement."""
+        return self.replay is not None and self.replay_frame >= len(self.replay)
+
+    def save_recording(self) -> None:
+        """Écrit l'enregistrement de la partie en cours (une seule fois, résultat compris)."""
+        rec = self.recording
+        if rec is not None and rec.result is None:
+            rec.finish(self.world)
+            rec.save(RECORD_PATH)
+
+    def on_assets(self, names) -> None:
+        """Assets venant d'être chargés : les sons vont à l'audio (le fond est lu une fois)."""
+        for name in names:
+            if ASSETS[name].kind == "sound":
+                self.audio.set_sound(name, self.assets.get(name))
+
+    def attach_profiler(self) -> None:
+        """Branche le profiler sur la simulation et le renderer (seulement s'il mesure)."""
+        prof = self.profiler if self.profiler.enabled else None
+        self.world.sim.profiler = prof
+        self.renderer.profiler = prof
+
+    def handle_event(self, event) -> None:
+        audio = self.audio
+        if event.type == pygame.QUIT:
+            self.running = False
+
+        if event.type == pygame.VIDEORESIZE:
+            self.fit_window()
+
+        # WebAudio: 1ère interaction
+        if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+            self.user_interacted = True
+            if not audio.music_started:
+                audio.try_start_music()
+
+        # Overlay de profilage (F3)
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.profiler.toggle_overlay()
+            self.attach_profiler()
+
+        # Toggle audio ON/OFF (M)
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_m:
+            audio.set_enabled(not audio.enabled)
+            if self.user_interacted and (not audio.music_started):
+                audio.try_start_music()
+
+        # ---- ACTION INPUT ----
+        if self.controls.handle(event) and self.autopilot is not None:
+            # démo : le joueur reprend la main sur une nouvelle partie ; celle du bot
+            # est abandonnée sans compter pour le record
+            self.autopilot = None
+            self.reset()
+
+        # GAME OVER inputs (aussi à la fin d'un rejeu arrêté avant le game over)
+        if (self.world.game_over or self.replay_done) and event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.running = False
+            elif event.key == pygame.K_r:
+                self.reset()
+                # reset musique (redémarre après interaction)
+                audio.stop_music()
+                self.user_interacted = False
+
+    def on_events(self, events) -> None:
+        """Réactions aux événements de la simulation : sons, highscore."""
+        for event in events:
+            if event.kind == COIN:
+                self.audio.play_coin()
+            elif event.kind == GAME_OVER:
+                self.audio.stop_music(rearm=False)
+                self.audio.play_game_over()
+                self.game_over_time = 0.0
+                # bot (démo) et replay : jamais de record, ni affiché ni sauvegardé
+                self.new_record = (self.player_game and self.autopilot is None and self.replay is None
+                                   and self.ui.update_highscore_if_needed(self.world.score))
+
+    async def run(self) -> None:
+        prof = self.profiler
+        work_ms = None
+        while self.running:
+            dt = self.clock.tick(FPS) / 1000.0
+            t_frame = time.perf_counter()
+            prof.begin_frame()
+
+            # qualité : temps de travail de la frame précédente, mesuré jusqu'à l'await
+            # (get_rawtime inclurait l'attente rendue au navigateur sous pygbag)
+            if work_ms is not None and self.governor.update(work_ms):
+                self.apply_quality()
+
+            # -------- EVENTS --------
+            for event in pygame.event.get():
+                self.handle_event(event)
+            prof.lap("events")
+
+            # retry auto musique si interaction déjà faite
+            if self.user_interacted and (not self.audio.music_started):
+                self.audio.try_start_music()
+
+            # -------- UPDATE (pas fixe) --------
+            if self.autopilot is not None and self.world.game_over and self.game_over_time >= DEMO_RESTART_S:
+                self.reset()
+            world = self.world
+            stepped = True
+            if self.autopilot is not None:
+                down, pressed = self.autopilot(world)
+                prof.lap("autopilot")
+                events = world.step(dt, down, pressed)
+            elif self.replay is None:
+                down, pressed = self.controls.poll()
+                events = world.step(dt, down, pressed)
+            elif not self.replay_done:
+                # dt et actions enregistrés (le limiteur de FPS garde le temps réel)
+                dt, down, pressed = self.replay.frames[self.replay_frame]
+                self.replay_frame += 1
+                events = world.step(dt, down, pressed)
             else:
-                energy_zero_time = 0.0
-
-            if (not game_over) and (energy_zero_time > 6.0):
-                game_over = True
-                death_reason = "energy"
-
-            if game_over:
-                if music_channel:
-                    try:
-                        music_channel.stop()
-                    except Exception:
-                        pass
-                if AUDIO_ENABLED and SOUND_GAMEOVER:
-                    SOUND_GAMEOVER.play()
-
-                final_score = score
-                game_over_time = 0.0
-                new_record = ui.update_highscore_if_needed(final_score)
-
-        # -------- DRAW --------
-        screen.blit(background, (0, 0))
-
-        bg_terrain.draw(screen, color_ground=(60, 120, 90), color_outline=None)
-        terrain.draw(screen, GROUND, OUTLINE)
-
-        player.draw(screen)
-        collectibles.draw(screen, distance, player.x, terrain)
-
-        night_screen_x = player.x - (distance - night_world_x)
-        if night_screen_x > 0:
-            w = int(min(night_screen_x, WIDTH))
-            overlay = pygame.Surface((w, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((10, 10, 30, 120))
-            screen.blit(overlay, (0, 0))
-
-        ui.draw_hud(screen, score, player.vx, player.state, player.boosting)
-
-        coins_txt = ui.font.render(f"Coins: {coins}", True, (10, 10, 10))
-        screen.blit(coins_txt, (12, 40))
-
-        level_txt = ui.font.render(f"Level: {phase+1}", True, (10, 10, 10))
-        screen.blit(level_txt, (12, 95))
-
-        if game_over:
-            game_over_time += dt
-            ui.draw_game_over_screen(screen, final_score, game_over_time, is_new_record=new_record)
-
-            reason_map = {
-                "night": "Night caught you",
-                "hole": "Fell in a hole",
-                "energy": "Out of energy",
-            }
-            reason = reason_map.get(death_reason, "Cause: Unknown")
-            reason_surf = ui.font.render(reason, True, (230, 230, 230))
-            screen.blit(reason_surf, (WIDTH // 2 - reason_surf.get_width() // 2, HEIGHT // 2 + 150))
-
-        pygame.display.flip()
-        await asyncio.sleep(0)
-
-
-asyncio.run(run())
-
-pygame.quit()
-if not IS_WEB:
-    sys.exit()
\ No newline at end of file
+                # fin de l'enregistrement : le monde reste figé, écran de fin affiché ;
+                # ESC quitte, R relance le rejeu (cf. handle_event)
+                stepped = False
+                down = pressed = False
+                events = []
+            prof.lap("world")
+            self.on_events(events)
+            prof.lap("audio")
+
+            # -------- DRAW (interpolé entre les deux derniers ticks) --------
+            if world.game_over:
+                self.game_over_time += dt
+            self.renderer.draw(self.viewport.surface, world.sim, world.alpha,
+                               self.game_over_time, self.new_record)
+            if prof.visible:
+                prof.draw(self.viewport.surface)
+                prof.lap("profiler")
+            if not self.assets.done:
+                self.ui.draw_loading(self.viewport.surface, self.assets.progress)
+            self.viewport.present()
+            if self.t_first_frame is None:
+                self.t_first_frame = time.perf_counter()
+            prof.lap("display.flip")
+
+            # génération du terrain à venir sous budget, puis on rend la main (web)
+            t_gen = time.perf_counter()
+            world.sim.terrain.pump(GEN_BUDGET_S)
+            world.sim.bg_terrain.pump(max(0.0, GEN_BUDGET_S - (time.perf_counter() - t_gen)))
+            # rien à réenregistrer une fois le rejeu terminé (le monde n'avance plus)
+            if stepped and self.recording is not None and self.recording.result is None:
+                self.recording.add(dt, down, pressed)
+                if world.game_over:
+                    self.save_recording()
+            prof.lap("terrain.pump")
+
+            # assets non critiques, par priorité (l'état de chargement est effacé à la fin)
+            if not self.assets.done:
+                self.on_assets(self.assets.pump(ASSET_BUDGET_S))
+                prof.lap("assets")
+            prof.end_frame()
+            work_ms = (time.perf_counter() - t_frame) * 1000.0
+            await asyncio.sleep(0)
+
+
+async def main() -> None:
+    game = Game()
+    await game.run()
+    if PROFILE_OUT:
+        game.profiler.export(PROFILE_OUT)
+    game.save_recording()
+    if PROFILE and game.autopilot is not None and not IS_WEB:
+        # coût de planification du bot, avec les autres mesures de profilage
+        print("autopilot :", ", ".join(f"{k} {v:.3g}" for k, v in game.autopilot.report().items()))
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
+    if not IS_WEB:
+        sys.exit()
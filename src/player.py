@@ -7,18 +7,26 @@ Objectif "feel" Tiny Wings :
 - Descente (pente positive) = légère accélération
 - Tap action = saut (jusqu'à 3)
 - Squash & stretch à l'impact + bille lisible (contour + highlight)
+- Collision continue (swept) : contact le plus tôt sur les segments de sol traversés
+  pendant le pas, décollage de crête au sommet franchi -> trajectoires stables à 20-60 Hz
 
 Compat mobile/web :
 - main.py peut piloter l'input via :
     player.boosting = ACTION_DOWN
     player.action_pressed = ACTION_PRESSED
-- fallback clavier (ESPACE) si main ne pilote pas.
+- fallback clavier (ESPACE) si main ne pilote pas (keyboard_fallback=False : désactivé).
 """
 
+import math
+from typing import Optional, Tuple
+
 import pygame
 
 GRAVITY = 1800.0  # px/s²
 
+# swept : pas max (s) de l'intégration au sol (énergie, vx), un pas de simulation à 120 Hz
+GROUND_SUBSTEP = 1.0 / 120
+
 
 class Player:
     """Joueur (bille) : saut multi-impulsions + boost contrôlé, avec freinage en montée."""
@@ -41,6 +49,9 @@ class Player:
         # Input injecté par main (mobile/web)
         self.action_pressed = False  # edge (tap)
 
+        # False : input 100% injecté (simulation à pas fixe, pas de lecture clavier)
+        self.keyboard_fallback = True
+
         # Triple saut (tap)
         self.jump_count = 0
         self.jump_max = 3
@@ -54,6 +65,14 @@ class Player:
         self.vx_min = 90.0
         self.vx_max = 520.0  # ↓ réduit pour éviter l'effet "fusil"
 
+        # Collision continue (cf. _fly) : permet une physique à bas tick rate.
+        # False : pas d'Euler + test d'atterrissage en fin de pas (référence PlayerBatch).
+        self.swept = True
+        # swept : trajet intégré du pas précédent moins vx * dt (le défilement du pas
+        # est décidé avant update, à vx de début de pas), rattrapé au pas suivant
+        self.scroll_carry = 0.0
+        self._travel = 0.0
+
         # Impact / squash
         self.impact_timer = 0.0
         self.impact_strength = 0.0
@@ -88,6 +107,9 @@ class Player:
         # boosting peut être piloté par main
         boosting = bool(getattr(self, "boosting", False))
 
+        if not self.keyboard_fallback:
+            return boosting, pressed_edge
+
         # Si main ne pilote pas (cas desktop standalone), fallback clavier
         # Heuristique : si action_pressed n'est jamais utilisé, on lit le clavier.
         keys = pygame.key.get_pressed()
@@ -107,6 +129,10 @@ class Player:
         self.space_prev = space
         return boosting, pressed_edge
 
+    def scroll_step(self, dt: float) -> float:
+        """Défilement (px) du pas à venir : vx * dt, plus le rattrapage du pas précédent."""
+        return self.vx * dt + self.scroll_carry
+
     def update(self, dt: float, terrain) -> None:
         boosting, action_pressed = self._read_input()
         self.boosting = boosting
@@ -121,6 +147,11 @@ class Player:
             self._last_ground_y = ground_y
         ground_vy = (ground_y - self._last_ground_y) / dt if dt > 0 else 0.0
 
+        # Le terrain a déjà défilé de scroll_step(dt) : pendant le pas, la bille a parcouru
+        # [x - vx0 * dt, x] en coordonnées écran courantes (au rattrapage près).
+        vx0 = self.vx
+        self._travel = 0.0
+
         # timer impact
         if self.impact_timer > 0.0:
             self.impact_timer -= dt
@@ -130,6 +161,7 @@ class Player:
         # gravité (un peu plus forte en boost)
         g = GRAVITY * (1.15 if self.boosting else 1.0)
 
+        # pente en fin de pas (swept : pente de chaque sous-pas, cf. _ground_path)
         uphill = max(0.0, -slope)    # pente négative => montée
         downhill = max(0.0, slope)   # pente positive => descente
 
@@ -140,6 +172,7 @@ class Player:
             # reset au sol
             self.jump_count = 0
             self.air_time = 0.0
+            launch_t = None   # instant (dans le pas) où la bille quitte le sol (mode swept)
 
             # Tap = saut
             if action_pressed:
@@ -147,23 +180,25 @@ class Player:
                 self.vy = -self.jump_strength
                 self.jump_count = 1
                 self.y -= 2.0
-
-            # Energy : charge surtout en descente, un peu en continu si boost
-            if self.boosting:
-                charge = self.base_charge + self.boost_gain * downhill
-                self.energy += charge * dt
-            else:
-                self.energy -= 0.40 * dt
-
-            self.energy = max(0.0, min(2.0, self.energy))
-
-            # --------- vx "Tiny Wings feel" ----------
-            self.vx += (self.boost_push * self.energy) * dt
-            self.vx -= (self.uphill_drag * uphill) * dt
-            self.vx += (self.downhill_push * downhill) * dt
-            self.vx *= (1.0 - self.friction * dt)
-
-            self.vx = max(self.vx_min, min(self.vx_max, self.vx))
+                launch_t = 0.0
+
+            if not self.swept:
+                self._ground_physics(dt, uphill, downhill)
+            elif launch_t is None:
+                # physique au sol jusqu'au premier sommet franchi pendant le pas (s'il y en
+                # a un), puis rebond crête si la vitesse y suffit ; sinon jusqu'à la fin du pas
+                crest = None if self.boosting else self._crest_on_path(terrain, vx0, dt)
+                if crest is not None:
+                    self._ground_path(terrain, vx0, dt, 0.0, crest[0], ground_y)
+                    if self.vx > 130:
+                        launch_t, crest_y = crest
+                        self.state = "VOL"
+                        self.vy = -0.45 * self.vx
+                        self.y = (crest_y - self.radius) - 2.0
+                    else:
+                        self._ground_path(terrain, vx0, dt, crest[0], dt, ground_y)
+                else:
+                    self._ground_path(terrain, vx0, dt, 0.0, dt, ground_y)
 
             # recoller au sol si toujours SOL
             if self.state == "SOL":
@@ -171,11 +206,16 @@ class Player:
                 self.vy = ground_vy
 
             # rebond crête (relâché = plus de vol)
-            if (not self.boosting) and (self.prev_slope < -0.05) and (slope > 0.05) and (self.vx > 130):
+            if (not self.swept and (not self.boosting) and (self.prev_slope < -0.05)
+                    and (slope > 0.05) and (self.vx > 130)):
                 self.state = "VOL"
                 self.vy = -0.45 * self.vx
                 self.y = (ground_y - self.radius) - 2.0
 
+            # vol sur la fin du pas, depuis l'instant du décollage
+            if self.swept and launch_t is not None:
+                self._fly(terrain, vx0, dt, launch_t, g, ground_y)
+
         # -------------------
         # VOL
         # -------------------
@@ -187,35 +227,189 @@ class Player:
                 self.vy = min(self.vy, 0.0) - strength
                 self.jump_count += 1
 
-            self.vy += g * dt
-            self.y += self.vy * dt
-            self.air_time += dt
+            if self.swept:
+                self._fly(terrain, vx0, dt, 0.0, g, ground_y)
+            else:
+                self.vy += g * dt
+                self.y += self.vy * dt
+                self.air_time += dt
 
-            # atterrissage
-            if self.vy >= 0 and self.y + self.radius >= ground_y:
-                impact_vy = self.vy
-                self.y = ground_y - self.radius
-                self.vy = 0.0
-                self.state = "SOL"
-
-                if impact_vy > 900.0:
-                    self.impact_timer = 0.12
-                    self.impact_strength = min(impact_vy / 1800.0, 1.0)
-                else:
-                    self.impact_strength = 0.0
+                # atterrissage
+                if self.vy >= 0 and self.y + self.radius >= ground_y:
+                    self._land(self.vy, ground_y)
 
         self._last_ground_y = ground_y
         self.prev_slope = slope
+        if self.swept:
+            self.scroll_carry = self._travel - vx0 * dt
+
+    def _ground_path(self, terrain, vx0: float, dt: float, t_a: float, t_b: float,
+                     ground_y: float) -> None:
+        """
+        swept : énergie + vx au sol de t_a à t_b dans le pas, par sous-pas d'au plus
+        GROUND_SUBSTEP, chacun avec la pente du bout de trajet qu'il parcourt
+        (ground_y : sol en fin de pas, sous la bille).
+        """
+        span = t_b - t_a
+        if span <= 0.0:
+            return
+        n = max(1, int(math.ceil(span / GROUND_SUBSTEP - 1e-9)))
+        h = span / n
+        x_prev = self.x - vx0 * (dt - t_a)
+        y_prev = terrain.get_height_screen_x(x_prev)
+        for i in range(1, n + 1):
+            x_i = self.x - vx0 * (dt - (t_a + i * h))
+            y_i = ground_y if i == n and t_b >= dt else terrain.get_height_screen_x(x_i)
+            s = (y_i - y_prev) / (x_i - x_prev) if x_i > x_prev else terrain.get_slope_screen_x(x_i)
+            v = self.vx
+            self._ground_physics(h, max(0.0, -s), max(0.0, s))
+            self._travel += 0.5 * (v + self.vx) * h
+            x_prev, y_prev = x_i, y_i
+
+    def _ground_physics(self, dt: float, uphill: float, downhill: float) -> None:
+        """Énergie + vx au sol pendant dt."""
+        # Energy : charge surtout en descente, un peu en continu si boost
+        if self.boosting:
+            charge = self.base_charge + self.boost_gain * downhill
+            self.energy += charge * dt
+        else:
+            self.energy -= 0.40 * dt
+
+        self.energy = max(0.0, min(2.0, self.energy))
+
+        # --------- vx "Tiny Wings feel" ----------
+        self.vx += (self.boost_push * self.energy) * dt
+        self.vx -= (self.uphill_drag * uphill) * dt
+        self.vx += (self.downhill_push * downhill) * dt
+        self.vx *= (1.0 - self.friction * dt)
+
+        self.vx = max(self.vx_min, min(self.vx_max, self.vx))
+
+    def _land(self, impact_vy: float, ground_y: float) -> None:
+        self.y = ground_y - self.radius
+        self.vy = 0.0
+        self.state = "SOL"
+
+        if impact_vy > 900.0:
+            self.impact_timer = 0.12
+            self.impact_strength = min(impact_vy / 1800.0, 1.0)
+        else:
+            self.impact_strength = 0.0
+
+    # -------------------------
+    # COLLISION CONTINUE (swept)
+    # -------------------------
+    def _crest_on_path(self, terrain, vx0: float, dt: float) -> Optional[Tuple[float, float]]:
+        """
+        Premier sommet franchi pendant le pas (segment de pente < -0.05 suivi d'un
+        segment de pente > 0.05, comme prev_slope / slope d'un tick à l'autre).
+        Retourne (instant, y du sol au sommet) ou None.
+        """
+        x_start = self.x - vx0 * dt
+        xs, ys = terrain.profile_screen(x_start, self.x)
+        left = self.prev_slope
+        for j in range(len(xs) - 1):
+            if xs[j + 1] <= x_start:
+                continue
+            if xs[j] > self.x:
+                break
+            s = (ys[j + 1] - ys[j]) / (xs[j + 1] - xs[j])
+            if left < -0.05 and s > 0.05:
+                if xs[j] <= x_start:
+                    return 0.0, terrain.get_height_screen_x(x_start)
+                t = (xs[j] - x_start) / vx0 if vx0 > 0.0 else 0.0
+                return t, ys[j]
+            left = s
+        return None
+
+    def _first_contact(self, terrain, x_a: float, vx: float, T: float,
+                       y0: float, vy0: float, g: float) -> Optional[float]:
+        """
+        Premier instant t in [0, T] où la bille (parabole partant de (x_a, y0)) touche
+        le sol en descendant (vy >= 0), segment de terrain par segment ; None sinon.
+        """
+        r = self.radius
+        t_v = max(0.0, -vy0 / g) if g > 0.0 else 0.0
+        if t_v > T:
+            return None
+
+        a = 0.5 * g
+        xs, ys = terrain.profile_screen(x_a, x_a + vx * T)
+        for j in range(len(xs) - 1):
+            xa, xb = xs[j], xs[j + 1]
+            if vx > 0.0:
+                ta = (xa - x_a) / vx
+                tb = (xb - x_a) / vx
+            else:
+                ta, tb = 0.0, T
+            lo = max(ta, t_v, 0.0)
+            hi = min(tb, T)
+            if j == len(xs) - 2:
+                hi = T
+            if hi < lo:
+                continue
+
+            # sol le long du trajet : G(t) = c0 + c1 * t
+            k = (ys[j + 1] - ys[j]) / (xb - xa)
+            c0 = ys[j] + k * (x_a - xa)
+            c1 = k * vx
+
+            # f(t) = bas de la bille - sol
+            b = vy0 - c1
+            c = y0 + r - c0
+            if a * lo * lo + b * lo + c >= 0.0:
+                return lo
+            if a <= 0.0:
+                if b > 0.0 and -c / b <= hi:
+                    return -c / b
+                continue
+            disc = b * b - 4.0 * a * c
+            if disc < 0.0:
+                continue
+            t = (-b + math.sqrt(disc)) / (2.0 * a)
+            if lo <= t <= hi:
+                return t
+        return None
+
+    def _fly(self, terrain, vx0: float, dt: float, t0: float, g: float, ground_y: float) -> None:
+        """
+        Vol de t0 à dt (trajectoire balistique exacte) avec collision continue :
+        atterrissage au premier contact, puis physique au sol sur le reste du pas.
+        """
+        T = dt - t0
+        if T <= 0.0:
+            return
+        y0, vy0 = self.y, self.vy
+        x_a = self.x - vx0 * T
+
+        tc = self._first_contact(terrain, x_a, vx0, T, y0, vy0, g)
+        if tc is None:
+            self.y = y0 + vy0 * T + 0.5 * g * T * T
+            self.vy = vy0 + g * T
+            self.air_time += T
+            self._travel += self.vx * T
+            return
+
+        self.air_time += tc
+        self._travel += self.vx * tc
+        self._land(vy0 + g * tc, ground_y)
+        self._ground_path(terrain, vx0, dt, t0 + tc, dt, ground_y)
+
+    def draw(self, screen, y: float = None, scale: float = 1.0) -> None:
+        """
+        Dessine la bille (lisible) + squash à l'impact. y : position interpolée (rendu),
+        scale : échelle de rendu (résolution interne).
+        """
+        if y is None:
+            y = self.y
 
-    def draw(self, screen) -> None:
-        """Dessine la bille (lisible) + squash à l'impact."""
         # couleur
         if self.boosting:
             color = (35, 35, 35)
         else:
             color = (230, 60, 60) if self.state == "VOL" else (40, 80, 240)
 
-        r = self.radius
+        r = self.radius * scale
         w = h = int(r * 2)
 
         # "s'affaisse" en boost
@@ -230,10 +424,10 @@ class Player:
             h = int(h * (1.0 - squash))
 
         rect = pygame.Rect(0, 0, w, h)
-        rect.center = (int(self.x), int(self.y))
+        rect.center = (int(self.x * scale), int(y * scale))
 
         pygame.draw.ellipse(screen, color, rect)
-        pygame.draw.ellipse(screen, (0, 0, 0), rect, 3)
+        pygame.draw.ellipse(screen, (0, 0, 0), rect, max(1, int(round(3 * scale))))
 
         highlight = rect.copy()
         highlight.width = int(rect.width * 0.35)
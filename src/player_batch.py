@@ -0,0 +1,256 @@
+"""
+player_batch.py — Physique de N billes à la fois (structure de tableaux NumPy)
+
+Pour régler le "feel" (boost_gain, uphill_drag, jump_decay, ...), on simule des
+milliers de billes en parallèle :
+- PlayerBatch : état de Player stocké en tableaux (une case par bille), même machine
+  à états SOL / VOL, charge d'énergie, freinage en pente et atterrissage que
+  Player.update, en mises à jour masquées. Les réglages peuvent différer par bille.
+- GroundBatch : sol commun (WorldGenerator + paramètres constants, cf. from_terrain),
+  avec un scroll propre à chaque bille ; hauteur et pente lues comme Terrain
+  (interpolation linéaire des échantillons k * dx, mêmes opérations flottantes).
+
+Résultat identique au bit près à N Player en swept=False (pas d'Euler, atterrissage testé
+en fin de pas, défilement vx * dt) sur N Terrain aux paramètres constants
+(cf. bench/bench_player_batch.py).
+
+Le jeu, lui, utilise swept=True : collision continue, physique au sol par sous-pas le long
+du trajet, rebond au sommet franchi pendant le pas, défilement rattrapé (scroll_carry).
+Ce modèle n'est pas reproduit ici : les résultats en lot sont APPROCHÉS. À 120 Hz, sur 12 s,
+swept=False s'écarte de la référence swept de quelques px (distance et hauteur, jusqu'à
+~7 px, cf. bench/check_swept_collision.py) ; un écart suffit à faire diverger une partie
+(trou franchi ou non, sommet raté). À utiliser pour dégrossir des réglages, puis à
+confirmer avec de vraies parties (World, bench/sweep.py).
+"""
+
+import math
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from player import GRAVITY, Player
+from terrain import CHUNK_PX
+from worldgen import WorldChunk, WorldGenerator, WorldParams
+
+# Réglages de Player qu'on peut faire varier par bille
+TUNING = ("jump_strength", "jump_decay", "vx_min", "vx_max", "boost_gain", "base_charge",
+          "uphill_drag", "downhill_push", "boost_push", "friction")
+
+
+class GroundBatch:
+    """
+    Sol partagé par un lot de billes, chacune avec son offset de scroll world_x0.
+    params : paramètres de difficulté constants (tous les chunks figés avec eux),
+    ou schedule : calendrier de difficulté par position (cf. Terrain.schedule).
+    """
+
+    def __init__(self, generator: WorldGenerator, params: WorldParams, n: int,
+                 committed: Optional[Dict[int, WorldChunk]] = None,
+                 queued: Optional[Dict[int, WorldParams]] = None, schedule=None):
+        self.world = generator
+        self.params = params
+        self.schedule = schedule
+        self.dx = generator.dx
+        # chunks déjà figés (ex. ceux d'un Terrain neuf, figés avant tout réglage),
+        # et paramètres capturés pour ceux déjà en file (cf. Terrain.chunk_params)
+        self._committed = dict(committed or {})
+        self._queued = dict(queued or {})
+        self.world_x0 = np.zeros(n, dtype=np.float64)
+
+        # même découpage que Terrain : k0 = premier échantillon gardé par son buffer
+        self.chunk_samples = max(1, CHUNK_PX // self.dx)
+        self.chunk_w = self.chunk_samples * self.dx
+
+        # bande d'échantillons monde [_k_start, _k_start + len(_strip)) (chunks concaténés)
+        self._k_start = 0
+        self._strip = np.empty(0, dtype=np.float64)
+
+    @classmethod
+    def from_terrain(cls, terrain, n: int) -> "GroundBatch":
+        """Sol d'un Terrain (chunks déjà figés ou en file + paramètres courants pour la suite)."""
+        committed, queued = terrain.chunk_state()
+        return cls(terrain.world, terrain.params(), n, committed, queued, terrain.schedule)
+
+    def _chunk(self, c: int) -> WorldChunk:
+        """Chunk c tel que Terrain le figerait (paramètres constants après les chunks figés)."""
+        chunk = self._committed.get(c)
+        if chunk is not None:
+            return chunk
+        if self.schedule is not None:
+            return self.world.scheduled_chunk(c, self.schedule)
+        prev = self._committed.get(c - 1)
+        prev_params = prev.params if prev is not None else self._queued.get(c - 1)
+        return self.world.chunk(c, self._queued.get(c, self.params), prev_params)
+
+    def update_scroll(self, scroll_px: np.ndarray) -> None:
+        self.world_x0 += scroll_px
+
+    def _ensure(self, k_min: int, k_max: int) -> None:
+        """Met dans la bande les échantillons monde [k_min, k_max]."""
+        k_end = self._k_start + len(self._strip)
+        if self._k_start <= k_min and k_max < k_end:
+            return
+        n = self.world.samples
+        c0 = k_min // n
+        c1 = k_max // n
+        self._strip = np.concatenate([self._chunk(c).ys
+                                      for c in range(c0, c1 + 1)])
+        self._k_start = c0 * n
+
+    def sample(self, x_screen: float) -> Tuple[np.ndarray, np.ndarray]:
+        """(hauteur, pente) à x_screen pour chaque bille (= Terrain.get_height/slope_screen_x)."""
+        dx = self.dx
+        S = self.chunk_samples
+        k0 = (np.floor(self.world_x0 / self.chunk_w).astype(np.int64) - 1) * S - 1
+
+        u = (x_screen + self.world_x0) / dx - k0
+        i = np.maximum(u, 0.0).astype(np.int64)
+        k = k0 + i
+        self._ensure(int(k.min()), int(k.max()) + 1)
+
+        p = k - self._k_start
+        y0 = self._strip[p]
+        y1 = self._strip[p + 1]
+        heights = y0 + (u - i) * (y1 - y0)
+        slopes = (y1 - y0) / dx
+        return heights, slopes
+
+
+class PlayerBatch:
+    """
+    N billes (x écran commun) : état et réglages en tableaux de taille N.
+    Modèle de Player en swept=False : approché pour le jeu (swept=True), cf. docstring du module.
+    """
+
+    def __init__(self, n: int, x_screen: float = 250.0, radius: int = 12, **tuning):
+        ref = Player(x_screen, radius)
+        self.n = n
+        self.x = ref.x
+        self.radius = ref.radius
+        self.jump_max = ref.jump_max
+
+        def full(v):
+            return np.full(n, v, dtype=np.float64)
+
+        self.y = full(ref.y)
+        self.vx = full(ref.vx)
+        self.vy = full(ref.vy)
+        self.on_ground = np.zeros(n, dtype=bool)       # state == "SOL"
+        self.boosting = np.zeros(n, dtype=bool)
+        self.jump_count = np.zeros(n, dtype=np.int64)
+        self.energy = full(ref.energy)
+        self.impact_timer = full(ref.impact_timer)
+        self.impact_strength = full(ref.impact_strength)
+        self.air_time = full(ref.air_time)
+        self.prev_slope = full(ref.prev_slope)
+        self._last_ground_y: Optional[np.ndarray] = None
+
+        # réglages : valeur de Player par défaut, scalaire ou tableau par bille sinon
+        for name in TUNING:
+            v = tuning.pop(name, getattr(ref, name))
+            setattr(self, name, np.broadcast_to(np.asarray(v, dtype=np.float64), (n,)).copy())
+        if tuning:
+            raise TypeError(f"réglages inconnus : {sorted(tuning)}")
+
+    @property
+    def state(self) -> np.ndarray:
+        """États "SOL" / "VOL" (comme Player.state)."""
+        return np.where(self.on_ground, "SOL", "VOL")
+
+    def update(self, dt: float, ground_y: np.ndarray, slope: np.ndarray,
+               boosting, action_pressed) -> None:
+        """Un pas de Player.update pour toutes les billes (input injecté, sans clavier)."""
+        n = self.n
+        boosting = np.broadcast_to(np.asarray(boosting, dtype=bool), (n,))
+        pressed = np.broadcast_to(np.asarray(action_pressed, dtype=bool), (n,))
+        self.boosting = boosting.copy()
+
+        if self._last_ground_y is None:
+            self._last_ground_y = ground_y.copy()
+        ground_vy = (ground_y - self._last_ground_y) / dt if dt > 0 else np.zeros(n)
+
+        # timer impact
+        m = self.impact_timer > 0.0
+        self.impact_timer[m] -= dt
+        np.maximum(self.impact_timer, 0.0, out=self.impact_timer)
+
+        # gravité (un peu plus forte en boost)
+        g = np.where(boosting, GRAVITY * 1.15, GRAVITY * 1.0)
+
+        uphill = np.maximum(0.0, -slope)
+        downhill = np.maximum(0.0, slope)
+
+        sol = self.on_ground.copy()
+        vol = ~sol
+        r = self.radius
+
+        # -------------------
+        # SOL
+        # -------------------
+        self.jump_count[sol] = 0
+        self.air_time[sol] = 0.0
+
+        jump = sol & pressed
+        self.on_ground[jump] = False
+        self.vy[jump] = -self.jump_strength[jump]
+        self.jump_count[jump] = 1
+        self.y[jump] -= 2.0
+
+        charge = sol & boosting
+        self.energy[charge] += (self.base_charge[charge]
+                                + self.boost_gain[charge] * downhill[charge]) * dt
+        drain = sol & ~boosting
+        self.energy[drain] -= 0.40 * dt
+        self.energy[sol] = np.maximum(0.0, np.minimum(2.0, self.energy[sol]))
+
+        vx = self.vx[sol]
+        vx += (self.boost_push[sol] * self.energy[sol]) * dt
+        vx -= (self.uphill_drag[sol] * uphill[sol]) * dt
+        vx += (self.downhill_push[sol] * downhill[sol]) * dt
+        vx *= (1.0 - self.friction[sol] * dt)
+        self.vx[sol] = np.maximum(self.vx_min[sol], np.minimum(self.vx_max[sol], vx))
+
+        stick = sol & self.on_ground
+        self.y[stick] = ground_y[stick] - r
+        self.vy[stick] = ground_vy[stick]
+
+        crest = (sol & ~boosting & (self.prev_slope < -0.05) & (slope > 0.05)
+                 & (self.vx > 130))
+        self.on_ground[crest] = False
+        self.vy[crest] = -0.45 * self.vx[crest]
+        self.y[crest] = (ground_y[crest] - r) - 2.0
+
+        # -------------------
+        # VOL
+        # -------------------
+        air_jump = vol & pressed & (self.jump_count < self.jump_max)
+        # décroissance par bille avec le pow de la libm, comme float ** int dans Player
+        # (la puissance vectorisée de NumPy peut différer d'un ulp) ; sauts rares
+        decay = [math.pow(d, k) for d, k in zip(self.jump_decay[air_jump].tolist(),
+                                                self.jump_count[air_jump].tolist())]
+        strength = self.jump_strength[air_jump] * np.asarray(decay, dtype=np.float64)
+        self.vy[air_jump] = np.minimum(self.vy[air_jump], 0.0) - strength
+        self.jump_count[air_jump] += 1
+
+        self.vy[vol] += g[vol] * dt
+        self.y[vol] += self.vy[vol] * dt
+        self.air_time[vol] += dt
+
+        land = vol & (self.vy >= 0) & (self.y + r >= ground_y)
+        impact_vy = self.vy[land]
+        self.y[land] = ground_y[land] - r
+        self.vy[land] = 0.0
+        self.on_ground[land] = True
+        hard = impact_vy > 900.0
+        idx = np.flatnonzero(land)
+        self.impact_timer[idx[hard]] = 0.12
+        self.impact_strength[idx] = np.where(hard, np.minimum(impact_vy / 1800.0, 1.0), 0.0)
+
+        self._last_ground_y = ground_y.copy()
+        self.prev_slope = slope.copy()
+
+    def step(self, dt: float, ground: GroundBatch, boosting, action_pressed) -> None:
+        """Scroll (vx * dt) puis update, dans l'ordre de Simulation.tick."""
+        ground.update_scroll(self.vx * dt)
+        ground_y, slope = ground.sample(self.x)
+        self.update(dt, ground_y, slope, boosting, action_pressed)
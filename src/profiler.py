@@ -0,0 +1,199 @@
+"""
+profiler.py — Profilage par frame (Tiny Wings)
+
+- FrameProfiler : temps de chaque phase de la frame par « tours » : lap(name) attribue
+  à name le temps écoulé depuis le lap précédent (ou begin_frame). Une phase appelée
+  plusieurs fois dans la frame (ticks de simulation) s'additionne.
+- Historique glissant (HISTORY_FRAMES) par phase + temps de frame total, percentiles.
+- Overlay (draw, touche F3 dans main.py) : graphe du temps de frame + p50 / p99 par
+  phase, textes recalculés quelques fois par seconde seulement.
+- Export (export) de toutes les frames enregistrées, en CSV ou JSON selon l'extension.
+- Désactivé : begin_frame / lap / end_frame sont remplacés par une fonction vide, et
+  la simulation / le renderer ne reçoivent pas de profiler (profiler = None).
+"""
+
+import json
+import time
+from array import array
+from typing import Dict, List, Optional
+
+import numpy as np
+import pygame
+
+# Frames gardées pour l'overlay (percentiles, graphe)
+HISTORY_FRAMES = 600
+# Frames gardées pour l'export (au-delà, les plus anciennes sont oubliées)
+EXPORT_MAX_FRAMES = 60 * 60 * 10
+# Recalcul des textes de l'overlay (frames)
+OVERLAY_REFRESH_FRAMES = 15
+
+PANEL_SIZE = (300, 250)
+PANEL_BG = (20, 20, 28)
+PANEL_TEXT = (230, 230, 230)
+GRAPH_COLOR = (120, 220, 120)
+BUDGET_COLOR = (220, 90, 90)
+
+
+def _noop(*_args) -> None:
+    pass
+
+
+class FrameProfiler:
+    """begin_frame(), lap(name) après chaque phase, end_frame() ; draw() pour l'overlay."""
+
+    def __init__(self, enabled: bool = False, fps: int = 60, history: int = HISTORY_FRAMES):
+        self.budget_ms = 1000.0 / fps
+        self.history = history
+        self.names: List[str] = []                  # phases, dans l'ordre d'apparition
+        self._ring: Dict[str, np.ndarray] = {}      # phase -> ms des dernières frames
+        self._total = np.zeros(history)             # temps de frame (ms)
+        self._log: Dict[str, array] = {}            # phase -> ms de toutes les frames (export)
+        self._log_total = array("d")
+        self.frames = 0
+        self._acc: Dict[str, float] = {}
+        self._t0 = 0.0
+        self._t = 0.0
+
+        self.visible = False
+        self._font = None
+        self._panel = None
+        self._panel_frame = -1
+        self.rect = pygame.Rect((0, 0), PANEL_SIZE)
+
+        self.enabled = False
+        self._always = enabled      # mesure demandée à la création (PROFILE, export)
+        self.set_enabled(enabled)
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Active / coupe la mesure (coupée : appels sans effet, quasi gratuits)."""
+        self.enabled = enabled
+        if enabled:
+            for name in ("begin_frame", "lap", "end_frame"):
+                self.__dict__.pop(name, None)
+        else:
+            self.begin_frame = self.lap = self.end_frame = _noop
+        self._acc.clear()
+
+    # -------------------------
+    # MESURE
+    # -------------------------
+    def begin_frame(self) -> None:
+        self._t0 = self._t = time.perf_counter()
+
+    def lap(self, name: str) -> None:
+        t = time.perf_counter()
+        acc = self._acc
+        acc[name] = acc.get(name, 0.0) + (t - self._t)
+        self._t = t
+
+    def end_frame(self) -> None:
+        """Range la frame (ms par phase, total) dans l'historique et le journal d'export."""
+        i = self.frames % self.history
+        n = len(self._log_total)
+        if n >= EXPORT_MAX_FRAMES:
+            drop = EXPORT_MAX_FRAMES // 10
+            for log in self._log.values():
+                del log[:drop]
+            del self._log_total[:drop]
+            n -= drop
+
+        acc = self._acc
+        for name in acc:
+            if name not in self._ring:
+                self.names.append(name)
+                self._ring[name] = np.zeros(self.history)
+                self._log[name] = array("d", bytes(8 * n))
+        for name in self.names:
+            ms = acc.get(name, 0.0) * 1000.0
+            self._ring[name][i] = ms
+            self._log[name].append(ms)
+        total = (self._t - self._t0) * 1000.0
+        self._total[i] = total
+        self._log_total.append(total)
+        acc.clear()
+        self.frames += 1
+
+    # -------------------------
+    # STATS
+    # -------------------------
+    def _window(self, values: np.ndarray) -> np.ndarray:
+        return values[:min(self.frames, self.history)]
+
+    def percentiles(self, name: Optional[str] = None, qs=(50, 99)) -> List[float]:
+        """Percentiles (ms) d'une phase (name) ou du temps de frame (None) sur l'historique."""
+        values = self._window(self._total if name is None else self._ring[name])
+        if values.size == 0:
+            return [0.0 for _ in qs]
+        return [float(v) for v in np.percentile(values, qs)]
+
+    # -------------------------
+    # OVERLAY
+    # -------------------------
+    def toggle_overlay(self) -> None:
+        """Affiche / masque l'overlay ; la mesure suit, sauf si elle a été demandée à la création."""
+        self.visible = not self.visible
+        if self.visible:
+            self.set_enabled(True)
+        elif not self._always:
+            self.set_enabled(False)
+
+    def _build_panel(self) -> None:
+        if self._font is None:
+            self._font = pygame.font.Font(None, 18)
+        font = self._font
+        panel = pygame.Surface(PANEL_SIZE)
+        panel.fill(PANEL_BG)
+
+        p50, p99 = self.percentiles()
+        lines = [f"frame  p50 {p50:5.2f}  p99 {p99:5.2f} ms  ({self.budget_ms:.1f} budget)"]
+        for name in self.names:
+            q50, q99 = self.percentiles(name)
+            lines.append(f"{name:<22.22} {q50:6.2f} {q99:6.2f}")
+        y = 4
+        for line in lines:
+            panel.blit(font.render(line, True, PANEL_TEXT), (6, y))
+            y += 13
+        self._panel = panel
+        self._graph_top = y + 4
+
+    def draw(self, screen) -> pygame.Rect:
+        """Dessine l'overlay en haut à droite de screen. Retourne la zone couverte."""
+        if self._panel is None or self.frames - self._panel_frame >= OVERLAY_REFRESH_FRAMES:
+            self._build_panel()
+            self._panel_frame = self.frames
+        self.rect.topright = (screen.get_width(), 0)
+        screen.blit(self._panel, self.rect)
+
+        # graphe : une colonne par frame, de la plus ancienne à la plus récente
+        w, h = PANEL_SIZE
+        top = self.rect.y + self._graph_top
+        gh = self.rect.bottom - 4 - top
+        n = min(self.frames, self.history, w - 8)
+        if n >= 2 and gh > 4:
+            idx = (np.arange(self.frames - n, self.frames) % self.history)
+            ys = np.minimum(self._total[idx] / (2.0 * self.budget_ms), 1.0)
+            x0 = self.rect.x + 4
+            pts = list(zip(range(x0, x0 + n), (top + gh - ys * gh).astype(int).tolist()))
+            y_budget = top + gh // 2
+            pygame.draw.line(screen, BUDGET_COLOR, (x0, y_budget), (x0 + w - 8, y_budget))
+            pygame.draw.lines(screen, GRAPH_COLOR, False, pts)
+        return self.rect
+
+    # -------------------------
+    # EXPORT
+    # -------------------------
+    def export(self, path: str) -> None:
+        """Écrit toutes les frames enregistrées (ms) : CSV, ou JSON si path finit par .json."""
+        n = len(self._log_total)
+        if path.endswith(".json"):
+            doc = {"budget_ms": self.budget_ms, "frames": n,
+                   "total_ms": self._log_total.tolist(),
+                   "sections": {name: self._log[name].tolist() for name in self.names}}
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(doc, f)
+            return
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(",".join(["frame", "total_ms"] + self.names) + "\n")
+            cols = [self._log_total] + [self._log[name] for name in self.names]
+            for i in range(n):
+                f.write(f"{i}," + ",".join(f"{c[i]:.4f}" for c in cols) + "\n")
@@ -0,0 +1,118 @@
+"""
+quality.py — Qualité de rendu adaptative (Tiny Wings)
+
+- QUALITY_LEVELS : niveaux du plus beau (0, rendu d'origine) au plus léger. Chaque
+  niveau ne touche qu'au rendu (la simulation ne change jamais) :
+  - terrain_detail : un échantillon de terrain sur N pour le tracé du sol,
+  - outline_width  : épaisseur du contour du sol (0 : sans contour),
+  - parallax       : terrain d'arrière-plan affiché ou non,
+  - render_scale   : résolution interne (cf. render.Viewport) ; le voile de nuit,
+    seul effet translucide plein écran, est dessiné à cette résolution.
+- QualityGovernor : percentile glissant du temps de frame (travail seul, mesuré par
+  perf_counter du début de la frame jusqu'à l'await : ni l'attente du limiteur de FPS
+  ni celle rendue au navigateur sous pygbag) comparé au budget de la frame ; descend
+  d'un niveau quand la marge manque, remonte quand elle est large, avec hystérésis
+  (seuils écartés + fenêtre de mesures complète après chaque changement + délai plus
+  long pour remonter). Niveau courant et journal des changements exposés.
+"""
+
+from collections import deque
+from typing import List, NamedTuple, Optional, Tuple
+
+
+class QualityLevel(NamedTuple):
+    """Réglages de rendu d'un niveau de qualité."""
+    name: str
+    terrain_detail: int
+    outline_width: int
+    parallax: bool
+    render_scale: float
+
+
+QUALITY_LEVELS = (
+    QualityLevel("high", 1, 3, True, 1.0),
+    QualityLevel("medium", 2, 2, False, 1.0),
+    QualityLevel("low", 3, 0, False, 0.5),
+)
+
+# Fenêtre glissante (frames) et percentile suivi
+WINDOW_FRAMES = 120
+PERCENTILE = 90
+
+# Seuils en fraction du budget de frame : on descend au-dessus de DOWN_RATIO,
+# on remonte sous UP_RATIO (écart = hystérésis), au plus une fois par UP_HOLD_FRAMES.
+DOWN_RATIO = 0.85
+UP_RATIO = 0.45
+UP_HOLD_FRAMES = 600
+
+
+def level_index(name_or_index, levels=QUALITY_LEVELS) -> int:
+    """Index d'un niveau à partir de son nom ("low") ou de son index ("1")."""
+    for i, level in enumerate(levels):
+        if level.name == name_or_index:
+            return i
+    i = int(name_or_index)
+    if not 0 <= i < len(levels):
+        raise ValueError(f"niveau de qualité inconnu : {name_or_index!r}")
+    return i
+
+
+class QualityGovernor:
+    """
+    update(frame_ms) à chaque frame ; retourne True quand le niveau change (à appliquer
+    au rendu). adaptive=False : niveau fixe, mesures gardées pour le journal.
+    """
+
+    def __init__(self, target_fps: float = 60.0, levels=QUALITY_LEVELS, start: int = 0,
+                 adaptive: bool = True):
+        self.levels = levels
+        self.index = start
+        self.adaptive = adaptive
+        self.budget_ms = 1000.0 / target_fps
+
+        self._samples: deque = deque(maxlen=WINDOW_FRAMES)
+        self.frames = 0
+        self._last_change = 0
+
+        # journal : (frame, niveau avant, niveau après, percentile mesuré en ms)
+        self.changes: List[Tuple[int, str, str, float]] = []
+        self.last_percentile: Optional[float] = None
+
+    @property
+    def level(self) -> QualityLevel:
+        return self.levels[self.index]
+
+    def percentile(self) -> Optional[float]:
+        """PERCENTILE-ième percentile des temps de la fenêtre (ms), None si vide."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        k = min(len(ordered) - 1, int(len(ordered) * PERCENTILE / 100.0))
+        return ordered[k]
+
+    def _set(self, index: int, p: float) -> None:
+        self.changes.append((self.frames, self.level.name, self.levels[index].name, p))
+        self.index = index
+        self._last_change = self.frames
+        self._samples.clear()       # mesures de l'ancien niveau : plus représentatives
+
+    def update(self, frame_ms: float) -> bool:
+        """Ajoute le temps de travail d'une frame (ms). True si le niveau vient de changer."""
+        self.frames += 1
+        self._samples.append(frame_ms)
+        if not self.adaptive or len(self._samples) < WINDOW_FRAMES:
+            return False
+        # une décision par demi-fenêtre au plus (le tri n'est pas gratuit)
+        if self.frames % (WINDOW_FRAMES // 2):
+            return False
+
+        p = self.percentile()
+        self.last_percentile = p
+        if p > self.budget_ms * DOWN_RATIO and self.index < len(self.levels) - 1:
+            self._set(self.index + 1, p)
+            return True
+        if (p < self.budget_ms * UP_RATIO and self.index > 0
+                and self.frames - self._last_change >= UP_HOLD_FRAMES):
+            self._set(self.index - 1, p)
+            return True
+        return False
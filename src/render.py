@@ -0,0 +1,170 @@
+"""
+render.py — Rendu d'une frame (Tiny Wings)
+
+- FrameRenderer.draw : dessine l'état interpolé d'une Simulation (fond, terrains,
+  joueur, pièces, nuit, HUD, écran de game over), en frame complète.
+- Échelle de rendu (set_scale) : la simulation reste en coordonnées logiques, chaque
+  couche est dessinée x scale (terrain, sprites de pièces, polices).
+- Niveau de qualité (set_quality, cf. quality.py) : détail / contour du terrain, parallaxe.
+- Viewport : résolution interne (ex. 0.5x, 0.75x) agrandie dans une fenêtre
+  redimensionnable, sans recharger les images.
+"""
+
+import pygame
+
+from quality import QUALITY_LEVELS
+
+GROUND = (70, 190, 110)
+OUTLINE = (10, 60, 25)
+BG_GROUND = (60, 120, 90)
+
+REASON_TEXT = {
+    "night": "Night caught you",
+    "hole": "Fell in a hole",
+    "energy": "Out of energy",
+}
+
+
+class FrameRenderer:
+    """Dessine une Simulation (frame complète, à présenter par Viewport.present)."""
+
+    def __init__(self, background, ui):
+        self.ui = ui
+
+        # échelle de rendu (résolution interne / taille logique), cf. Viewport
+        self.scale = 1.0
+        self.ui.set_scale(1.0)
+
+        # niveau de qualité (cf. quality.py ; render_scale est appliqué par le Viewport)
+        self.quality = QUALITY_LEVELS[0]
+
+        # image de fond d'origine, mise à la taille de la cible à la demande (cache)
+        self._background_src = background
+        self.background = background
+
+        # profiler.FrameProfiler (une phase par couche dessinée) ou None
+        self.profiler = None
+
+    def set_scale(self, scale: float) -> None:
+        """Échelle de rendu : monde et simulation inchangés, tout est dessiné en coordonnées x scale."""
+        self.scale = scale
+        self.ui.set_scale(scale)
+
+    def set_quality(self, level) -> None:
+        """Niveau de qualité (QualityLevel) : détail et contour du terrain, parallaxe."""
+        self.quality = level
+
+    def _fit_background(self, size) -> None:
+        """Fond à la taille de la cible (remis à l'échelle une fois par taille, sans recharger l'image)."""
+        if self.background.get_size() != size:
+            self.background = pygame.transform.scale(self._background_src, size)
+
+    def _draw_world(self, screen, sim, state) -> None:
+        """Couches opaques / colorkey : terrains, joueur, pièces."""
+        distance, _, player_y, terrain_x0, bg_x0 = state
+        player = sim.player
+        prof = self.profiler
+
+        s = self.scale
+        q = self.quality
+
+        if q.parallax:
+            sim.bg_terrain.draw(screen, color_ground=BG_GROUND, color_outline=None, world_x0=bg_x0,
+                                scale=s, detail=q.terrain_detail)
+        sim.terrain.draw(screen, GROUND, OUTLINE, world_x0=terrain_x0, scale=s,
+                         detail=q.terrain_detail, outline_width=q.outline_width)
+        if prof is not None:
+            prof.lap("draw.terrain")
+
+        player.draw(screen, y=player_y, scale=s)
+        if prof is not None:
+            prof.lap("draw.player")
+        sim.collectibles.draw(screen, sim.distance, player.x, sim.terrain, distance_render=distance,
+                              scale=s)
+        if prof is not None:
+            prof.lap("draw.coins")
+
+    def _draw_overlays(self, screen, sim, state) -> None:
+        """Couches translucides : nuit puis HUD."""
+        distance, night_world_x, _, _, _ = state
+        player = sim.player
+        prof = self.profiler
+        self.ui.draw_night(screen, (player.x - (distance - night_world_x)) * self.scale)
+        if prof is not None:
+            prof.lap("draw.night")
+        self.ui.draw_hud(screen, sim.score, player.vx, player.state, player.boosting,
+                         coins=sim.coins, level=sim.phase + 1)
+        if prof is not None:
+            prof.lap("draw.hud")
+
+    def draw(self, screen, sim, alpha: float, game_over_time: float = 0.0, new_record: bool = False) -> None:
+        """Dessine la frame (état interpolé à alpha)."""
+        prof = self.profiler
+        if prof is not None:
+            prof.lap("draw.setup")
+        self.ui.begin_frame()
+        self._fit_background(screen.get_size())
+        state = sim.render_state(alpha)
+
+        screen.blit(self.background, (0, 0))
+        if prof is not None:
+            prof.lap("draw.background")
+        self._draw_world(screen, sim, state)
+        self._draw_overlays(screen, sim, state)
+        if sim.game_over:
+            reason = REASON_TEXT.get(sim.death_reason, "Cause: Unknown")
+            self.ui.draw_game_over_screen(screen, sim.final_score, game_over_time,
+                                          is_new_record=new_record, reason=reason)
+            if prof is not None:
+                prof.lap("draw.game_over")
+
+
+class Viewport:
+    """
+    Fenêtre redimensionnable + résolution de rendu interne.
+    Le jeu (taille logique width x height) est dessiné à l'échelle
+    scale = render_scale * min(fenêtre / taille logique) dans surface, puis agrandi une
+    fois par frame au centre de la fenêtre (bandes noires si le ratio diffère).
+    Si surface a exactement la taille de la fenêtre, c'est la fenêtre elle-même :
+    aucune copie.
+    """
+
+    def __init__(self, width: int, height: int, render_scale: float = 1.0):
+        self.width = width
+        self.height = height
+        self.render_scale = render_scale
+
+        self.scale = None
+        self.surface = None       # cible du rendu
+        self.dest = None          # Rect de l'image agrandie dans la fenêtre
+        self._dest_surf = None    # sous-Surface de la fenêtre (cible de transform.scale)
+
+    def fit(self, window) -> bool:
+        """Adapte la cible à la fenêtre (au lancement, après redimensionnement). True si l'échelle a changé."""
+        ww, wh = window.get_size()
+        fit = min(ww / self.width, wh / self.height)
+        scale = self.render_scale * fit
+        size = (max(1, int(round(self.width * scale))), max(1, int(round(self.height * scale))))
+
+        self.dest = pygame.Rect(0, 0, int(round(self.width * fit)), int(round(self.height * fit)))
+        self.dest.center = (ww // 2, wh // 2)
+        self.dest = self.dest.clip(window.get_rect())
+
+        if size == (ww, wh):
+            self.surface = window
+            self._dest_surf = None
+        else:
+            if self.surface is None or self.surface is window or self.surface.get_size() != size:
+                self.surface = pygame.Surface(size).convert()
+            window.fill((0, 0, 0))
+            self._dest_surf = window.subsurface(self.dest)
+
+        changed = scale != self.scale
+        self.scale = scale
+        return changed
+
+    def present(self) -> None:
+        """Affiche la frame : flip si rendu direct, sinon agrandissement puis flip."""
+        if self._dest_surf is not None:
+            pygame.transform.scale(self.surface, self.dest.size, self._dest_surf)
+        pygame.display.flip()
@@ -0,0 +1,124 @@
+"""
+replay.py — Enregistrement et rejeu de parties (Tiny Wings)
+
+- Recording : tout ce qui fait avancer une partie, frame par frame : dt de la frame et
+  action (down, pressed) passées à World.step. Avec la seed du monde, la partie est
+  entièrement déterminée (la génération du terrain sous budget, Terrain.pump, ne change
+  pas le contenu des chunks : elle n'est pas enregistrée).
+- Format (.twr) : une ligne JSON (seed, taille, fréquence, résultat) puis les frames
+  compressées (zlib). Une frame = 1 octet de drapeaux, suivi du dt (float64) seulement
+  s'il change : ~1 octet par frame avant compression à FPS stable.
+- play_headless : rejoue un enregistrement sans affichage, aussi vite que possible ;
+  même score, pièces et cause de game over que la partie enregistrée.
+"""
+
+import json
+import struct
+import zlib
+from typing import Iterator, List, Optional, Tuple
+
+from simulation import SIM_HZ
+from world import World
+
+MAGIC = "tiny-wings-replay"
+VERSION = 2
+
+# Drapeaux d'une frame
+DOWN = 1
+PRESSED = 2
+NEW_DT = 4       # un float64 suit (dt différent de la frame précédente)
+
+_DT = struct.Struct("<d")
+
+Frame = Tuple[float, bool, bool]   # (dt, down, pressed)
+
+
+def world_result(world: World) -> dict:
+    """Résultat d'une partie, comparé entre enregistrement et rejeu."""
+    return {"ticks": world.ticks, "score": world.score, "coins": world.coins,
+            "game_over": world.game_over, "death_reason": world.death_reason}
+
+
+class Recording:
+    """Une partie enregistrée : seed + frames (dt, down, pressed) + résultat."""
+
+    def __init__(self, seed: int, width: int = 900, height: int = 600, hz: float = SIM_HZ):
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.hz = hz
+        self.frames: List[Frame] = []
+        self.result: Optional[dict] = None
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __iter__(self) -> Iterator[Frame]:
+        return iter(self.frames)
+
+    def add(self, dt: float, down: bool, pressed: bool) -> None:
+        self.frames.append((dt, down, pressed))
+
+    def finish(self, world: World) -> None:
+        self.result = world_result(world)
+
+    def new_world(self) -> World:
+        return World(self.width, self.height, seed=self.seed, hz=self.hz)
+
+    # -------------------------
+    # FICHIER
+    # -------------------------
+    def encode_frames(self) -> bytes:
+        out = bytearray()
+        last_dt = None
+        for dt, down, pressed in self.frames:
+            flags = (DOWN if down else 0) | (PRESSED if pressed else 0)
+            if dt != last_dt:
+                flags |= NEW_DT
+            out.append(flags)
+            if dt != last_dt:
+                out += _DT.pack(dt)
+                last_dt = dt
+        return bytes(out)
+
+    def decode_frames(self, data: bytes) -> None:
+        frames = self.frames
+        frames.clear()
+        dt = 0.0
+        i = 0
+        n = len(data)
+        while i < n:
+            flags = data[i]
+            i += 1
+            if flags & NEW_DT:
+                dt = _DT.unpack_from(data, i)[0]
+                i += _DT.size
+            frames.append((dt, bool(flags & DOWN), bool(flags & PRESSED)))
+
+    def save(self, path: str) -> None:
+        header = {"format": MAGIC, "version": VERSION, "seed": self.seed, "width": self.width,
+                  "height": self.height, "hz": self.hz, "frames": len(self.frames),
+                  "result": self.result}
+        with open(path, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            f.write(zlib.compress(self.encode_frames(), 9))
+
+    @classmethod
+    def load(cls, path: str) -> "Recording":
+        with open(path, "rb") as f:
+            header = json.loads(f.readline().decode("utf-8"))
+            body = f.read()
+        if header.get("format") != MAGIC or header.get("version") != VERSION:
+            raise ValueError(f"{path} : enregistrement inconnu ou de version non prise en charge")
+        rec = cls(header["seed"], header["width"], header["height"], header["hz"])
+        rec.result = header["result"]
+        rec.decode_frames(zlib.decompress(body))
+        return rec
+
+
+def play_headless(rec: Recording) -> World:
+    """Rejoue rec sans affichage ni attente ; retourne le World en fin d'enregistrement."""
+    world = rec.new_world()
+    for dt, down, pressed in rec.frames:
+        world.step(dt, down, pressed)
+    return world
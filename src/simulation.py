@@ -0,0 +1,329 @@
+"""
+simulation.py — Cœur de simulation à pas fixe (Tiny Wings)
+
+- Simulation : état d'une partie (terrains, joueur, pièces, score, nuit, game over),
+  avancé par tick(dt) avec un dt constant : même comportement quel que soit le FPS.
+- FixedStep : accumulateur de temps (pas fixe SIM_HZ, rattrapage borné à
+  MAX_CATCHUP_STEPS) + facteur d'interpolation alpha pour le rendu.
+- Difficulté :
+  - Level 1 : terrain lisse, pas de trous
+  - Level 2 : terrain plus nerveux, quelques trous espacés
+  - Level 3 : terrain + trous deviennent plus durs progressivement avec la distance
+  Tuning : facteurs appliqués aux trous et à la nuit de chaque phase (réglages, sweeps).
+  TerrainSchedule : la difficulté du terrain en fonction de la position (chunks du monde).
+"""
+
+import bisect
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from terrain import Terrain
+from player import Player
+from collectibles import CollectibleManager
+
+# Fréquence de la simulation (Hz) et nombre max de pas rattrapés par frame
+# (au-delà, le temps en trop est abandonné : ralenti plutôt que spirale de la mort).
+SIM_HZ = 120
+MAX_CATCHUP_STEPS = 8
+
+# Chute dans un trou : game over quand la bille passe FALL_MARGIN px sous l'écran
+FALL_MARGIN = 200
+
+# Distance (px) de début des phases 2 et 3 ; la phase 3 durcit sur LEVEL3_RAMP_PX
+PHASE_STARTS = (12000.0, 30000.0)
+LEVEL3_RAMP_PX = 60000.0
+
+# Sinusoïdes (amp, freq) de chaque phase (phase 3 : de EASY à HARD avec la distance)
+WAVES_LEVEL1 = [(55, 0.008), (25, 0.016), (10, 0.030)]
+WAVES_LEVEL2 = [(70, 0.010), (35, 0.020), (15, 0.040)]
+WAVES_LEVEL3_EASY = [(75, 0.010), (38, 0.022), (18, 0.045)]
+WAVES_LEVEL3_HARD = [(95, 0.016), (55, 0.035), (28, 0.070)]
+
+# Trous : le premier trou d'une phase est en x monde = distance + FIRST_GAP_PX au
+# changement de phase ; chaque trou (largeur, espacement jusqu'au suivant) est tiré avec les
+# paramètres du moment où il arrive à GAP_AHEAD_PX du bord droit de l'écran.
+FIRST_GAP_PX = 900.0
+GAP_AHEAD_PX = 3000.0
+
+# Nuit (night_k, night_b) de chaque phase
+NIGHT_LEVELS = ((0.80, 40.0), (0.90, 60.0), (1.00, 100.0))
+
+
+class FixedStep:
+    """Accumulateur pour pas fixe : advance(frame_dt) -> nombre de ticks à simuler."""
+
+    def __init__(self, hz: float = SIM_HZ, max_steps: int = MAX_CATCHUP_STEPS):
+        self.dt = 1.0 / hz
+        self.max_steps = max_steps
+        self.acc = 0.0
+        self.alpha = 0.0       # fraction de tick en attente (interpolation du rendu)
+        self.dropped = 0.0     # temps abandonné (s) quand le rattrapage est saturé
+
+    def advance(self, frame_dt: float) -> int:
+        self.acc += frame_dt
+        n = int(self.acc / self.dt)
+        if n > self.max_steps:
+            self.dropped += (n - self.max_steps) * self.dt
+            self.acc -= (n - self.max_steps) * self.dt
+            n = self.max_steps
+        self.acc -= n * self.dt
+        if self.acc < 0.0:
+            self.acc = 0.0
+        self.alpha = self.acc / self.dt
+        return n
+
+
+class Tuning(NamedTuple):
+    """Facteurs appliqués aux paramètres de difficulté de chaque phase (1.0 : jeu d'origine)."""
+    gap_every: float = 1.0
+    gap_width: float = 1.0
+    gap_ramp: float = 1.0
+    night_k: float = 1.0
+    night_b: float = 1.0
+
+
+DEFAULT_TUNING = Tuning()
+
+
+def lerp(a: float, b: float, t: float) -> float:
+    return a + (b - a) * t
+
+
+def phase_waves(phase: int, t3=0.0) -> List[Tuple[float, float]]:
+    """Sinusoïdes de la phase (t3 : avancée dans la phase 3, scalaire ou tableau NumPy)."""
+    if phase == 0:
+        return WAVES_LEVEL1
+    if phase == 1:
+        return WAVES_LEVEL2
+    return [(lerp(ae, ah, t3), lerp(fe, fh, t3))
+            for (ae, fe), (ah, fh) in zip(WAVES_LEVEL3_EASY, WAVES_LEVEL3_HARD)]
+
+
+class TerrainSchedule(NamedTuple):
+    """
+    Difficulté du terrain selon la position (hashable : clé de cache des chunks, cf.
+    worldgen.WorldGenerator.scheduled_chunk). L'abscisse monde x reçoit les sinusoïdes
+    de la distance x - lead, celle où elle entre par le bord droit de l'écran, et les
+    trous sont tirés en chaîne (un par un, espacement aléatoire) à partir du début de
+    chaque phase : le terrain change à l'écran au passage des seuils, quel que soit le
+    moment où ses chunks sont générés.
+    """
+    tuning: Tuning = DEFAULT_TUNING
+    lead: float = 900.0     # largeur de l'écran
+
+    @property
+    def phases(self) -> int:
+        return len(PHASE_STARTS) + 1
+
+    @staticmethod
+    def phase_of(distance: float) -> int:
+        return bisect.bisect_right(PHASE_STARTS, distance)
+
+    @staticmethod
+    def phase_start(phase: int) -> float:
+        return PHASE_STARTS[phase - 1] if phase > 0 else 0.0
+
+    @staticmethod
+    def level3_t(distance: float) -> float:
+        """Avancée dans la phase 3, dans [0, 1]."""
+        return min(max((distance - PHASE_STARTS[-1]) / LEVEL3_RAMP_PX, 0.0), 1.0)
+
+    def waves_at(self, xs: np.ndarray) -> List[Tuple[object, object]]:
+        """
+        Sinusoïdes [(amp, freq)] aux abscisses monde xs (croissantes) : scalaires si
+        toutes les abscisses ont les mêmes, tableaux NumPy sinon.
+        """
+        ds = xs - self.lead
+        lo, hi = self.phase_of(float(ds[0])), self.phase_of(float(ds[-1]))
+        waves = None
+        for phase in range(lo, hi + 1):
+            t3 = np.clip((ds - PHASE_STARTS[-1]) / LEVEL3_RAMP_PX, 0.0, 1.0) if phase == 2 else 0.0
+            wp = phase_waves(phase, t3)
+            if waves is None:
+                waves = wp
+            else:
+                m = ds >= self.phase_start(phase)
+                waves = [(np.where(m, a1, a0), np.where(m, f1, f0))
+                         for (a0, f0), (a1, f1) in zip(waves, wp)]
+        return waves
+
+    def gap_params(self, distance: float) -> Optional[Tuple[float, float, float]]:
+        """(gap_every, gap_width, gap_ramp) à cette distance, None sans trous (Level 1)."""
+        phase = self.phase_of(distance)
+        if phase == 0:
+            return None
+        if phase == 1:
+            every, width, ramp = 5000.0, 90.0, 260.0
+        else:
+            t3 = self.level3_t(distance)
+            every = 1800.0 - 900.0 * t3
+            width = 140.0 + 140.0 * t3
+            ramp = 240.0 - 80.0 * t3
+        tuning = self.tuning
+        return every * tuning.gap_every, width * tuning.gap_width, ramp * tuning.gap_ramp
+
+    def gap_origin(self, phase: int) -> Optional[float]:
+        """x monde du premier trou de la phase (None : phase sans trous)."""
+        if phase == 0:
+            return None
+        return self.phase_start(phase) + FIRST_GAP_PX
+
+    def gap_params_at(self, phase: int, x: float) -> Tuple[float, float, float]:
+        """Paramètres du trou de la phase qui démarre en x monde (ceux du moment où il est tiré)."""
+        return self.gap_params(max(self.phase_start(phase), x - self.lead - GAP_AHEAD_PX))
+
+
+class Simulation:
+    """Une partie : tick(dt, action_down, action_pressed) fait avancer tout l'état d'un pas."""
+
+    def __init__(self, width: int, height: int, seed: Optional[int] = None,
+                 tuning: Tuning = DEFAULT_TUNING):
+        self.width = width
+        self.height = height
+        self.tuning = tuning
+
+        # terrain de jeu : difficulté par position (le fond garde ses sinusoïdes)
+        self.schedule = TerrainSchedule(tuning, lead=float(width))
+        self.terrain = Terrain(width, height, dx=14, base_y_ratio=0.65,
+                               waves=WAVES_LEVEL1, seed=seed, coin_every=500,
+                               schedule=self.schedule)
+        self.bg_terrain = Terrain(width, height, dx=30, base_y_ratio=0.65,
+                                  waves=[(35, 0.006), (18, 0.012)], seed=seed)
+        self.seed = self.terrain.seed
+
+        self.player = Player(x_screen=250, radius=12)
+        self.player.keyboard_fallback = False   # input injecté par tick()
+
+        self.collectibles = CollectibleManager(width, height, y_offset=45)
+        self.coins = 0
+
+        self.distance = 0.0
+        self.score = 0.0
+        self.night_world_x = -1200.0
+        self.energy_zero_time = 0.0
+
+        self.game_over = False
+        self.final_score = 0.0
+        self.death_reason = ""
+
+        self.phase = 0
+        self.prev_phase = 0
+        self.night_k, self.night_b = 0.80, 40.0
+
+        self.ticks = 0
+        self._prev = self._snapshot()
+
+        # profiler.FrameProfiler (phases du tick) ou None
+        self.profiler = None
+
+    # -------------------------
+    # INTERPOLATION (rendu)
+    # -------------------------
+    def _snapshot(self) -> Tuple[float, ...]:
+        return (self.distance, self.night_world_x, self.player.y,
+                self.terrain.world_x0, self.bg_terrain.world_x0)
+
+    def render_state(self, alpha: float) -> Tuple[float, ...]:
+        """
+        État interpolé entre l'avant-dernier et le dernier tick :
+        (distance, night_world_x, player_y, terrain_x0, bg_terrain_x0).
+        """
+        cur = self._snapshot()
+        return tuple(lerp(p, c, alpha) for p, c in zip(self._prev, cur))
+
+    # -------------------------
+    # DIFFICULTÉ
+    # -------------------------
+    def _apply_difficulty(self) -> None:
+        terrain = self.terrain
+        distance = self.distance
+        schedule = self.schedule
+
+        self.prev_phase = self.phase
+        self.phase = schedule.phase_of(distance)
+
+        # paramètres courants du terrain (height_at_world, trous à portée du bot) ;
+        # ses chunks suivent le calendrier, par position (cf. TerrainSchedule)
+        terrain.set_waves(phase_waves(self.phase, schedule.level3_t(distance)))
+        gap_params = schedule.gap_params(distance)
+        terrain.gaps_enabled = gap_params is not None
+        if gap_params is not None:
+            terrain.gap_every, terrain.gap_width, terrain.gap_ramp = gap_params
+
+        night_k, night_b = NIGHT_LEVELS[self.phase]
+        self.night_k = night_k * self.tuning.night_k
+        self.night_b = night_b * self.tuning.night_b
+
+    # -------------------------
+    # TICK
+    # -------------------------
+    def tick(self, dt: float, action_down: bool, action_pressed: bool) -> int:
+        """Avance la partie d'un pas dt. Retourne le nombre de pièces ramassées pendant ce pas."""
+        if self.game_over:
+            return 0
+
+        prof = self.profiler
+        if prof is not None:
+            prof.lap("world")
+
+        self._prev = self._snapshot()
+        self.ticks += 1
+        player = self.player
+
+        step_px = player.scroll_step(dt)
+        self.distance += step_px
+
+        mult = 2.0 if player.air_time >= 2.0 else 1.0
+        self.score += step_px * mult
+
+        self._apply_difficulty()
+        if prof is not None:
+            prof.lap("difficulty")
+
+        # ---- nuit + scrolling ----
+        self.night_world_x += (player.vx * self.night_k + self.night_b) * dt
+
+        self.bg_terrain.update_scroll(player.vx * dt * 0.5)
+        self.terrain.update_scroll(step_px)
+        if prof is not None:
+            prof.lap("terrain.update_scroll")
+
+        # ---- player input injection ----
+        player.boosting = action_down
+        player.action_pressed = action_pressed
+        player.update(dt, self.terrain)
+        if prof is not None:
+            prof.lap("player.update")
+
+        # collectibles
+        self.collectibles.update(self.distance, player.x, self.terrain)
+        got = self.collectibles.check_collect(self.distance, player.x, player.y, self.terrain)
+        self.coins += got
+        if prof is not None:
+            prof.lap("collectibles")
+
+        # ---- game over ----
+        if self.night_world_x >= self.distance:
+            self.game_over = True
+            self.death_reason = "night"
+
+        if (not self.game_over) and (player.y > self.height + FALL_MARGIN):
+            self.game_over = True
+            self.death_reason = "hole"
+
+        if player.energy <= 0.01:
+            self.energy_zero_time += dt
+        else:
+            self.energy_zero_time = 0.0
+
+        if (not self.game_over) and (self.energy_zero_time > 6.0):
+            self.game_over = True
+            self.death_reason = "energy"
+
+        if self.game_over:
+            self.final_score = self.score
+
+        if prof is not None:
+            prof.lap("world")
+        return got
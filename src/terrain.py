@@ -1,58 +1,115 @@
 """
 terrain.py — Génération et rendu du terrain
 
-- Terrain "infini" généré par somme de sinusoïdes.
-- Scrolling : fenêtre glissante de points (pas de mémoire infinie).
+- Terrain "infini" généré par somme de sinusoïdes, lu par chunks depuis un WorldGenerator
+  seedé (worldgen.py) : chaque chunk est figé avec les paramètres courants au moment où il
+  entre dans la file de génération (par le scroll, donc par la simulation seule), ou,
+  avec un calendrier (schedule), avec les paramètres de chaque position (terrain de jeu).
+- Scrolling : buffer circulaire d'échantillons monde (x = k * dx) + offset de scroll
+  (mémoire fixe, coût proportionnel aux nouveaux points seulement).
 - get_height_screen_x : hauteur par interpolation linéaire.
-- Gaps optionnels : trous réels (vide) + rampes, avec randomisation.
+- Gaps optionnels : trous réels (vide) + rampes, tirés par le WorldGenerator.
+  Index trié (GapIndex) : requête en O(log g), nettoyage par la gauche sans réallocation.
+- height_at_world_many : échantillonnage vectorisé (NumPy) pour les requêtes en lot.
+- Génération incrémentale : les chunks monde devant l'écran sont mis en file et générés
+  sous budget de temps (pump) ; génération synchrone seulement si la fenêtre visible l'exige.
+  Les paramètres étant capturés à la mise en file, le budget (temps réel) ne décide que
+  du moment où un chunk est construit, jamais de son contenu.
+- Rendu : polygon des échantillons visibles à chaque frame, à une échelle (résolution
+  de rendu interne) et un niveau de détail donnés, sans toucher au monde.
 """
 
 import math
-import random
+import time
+from collections import deque
+import numpy as np
 import pygame
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from worldgen import GapIndex, WorldChunk, WorldGenerator, WorldParams, height_at, heights_at
+
+# Largeur visée (px) d'une tranche du buffer de hauteurs ; arrondie à un multiple de dx.
+CHUNK_PX = 256
+
+# Préchargement : chunks monde mis en file jusqu'à PREFETCH_CHUNKS chunks après le bord droit.
+PREFETCH_CHUNKS = 2
 
 
 class Terrain:
     """Terrain infini (sinus) + trous optionnels, exploité via get_height_screen_x et get_slope_screen_x."""
 
-    def __init__(self, width: int, height: int, dx: int = 20, base_y_ratio: float = 0.75):
+    def __init__(self, width: int, height: int, dx: int = 20, base_y_ratio: float = 0.75,
+                 waves=None, seed: Optional[int] = None, coin_every: Optional[float] = None,
+                 generator: Optional[WorldGenerator] = None, oscillators: bool = False,
+                 schedule=None):
         self.width = width
         self.height = height
         self.dx = dx
 
         self.base_y = int(height * base_y_ratio)
-
-        # Random generator (seed aléatoire par run)
-        self.rng = random.Random()
+        self.hole_y = height + 250
+
+        # Monde seedé (seed aléatoire par run si None) ; un generator peut être partagé
+        # entre plusieurs parties pour réutiliser son cache de chunks.
+        # oscillators=True : sinusoïdes synthétisées par phaseurs (cf. worldgen.PhasorBank ;
+        # benchmarks seulement, jamais en jeu).
+        self.world = generator if generator is not None else WorldGenerator(
+            seed, dx=dx, base_y=self.base_y, hole_y=self.hole_y, coin_every=coin_every,
+            oscillators=oscillators)
+        self.seed = self.world.seed
+
+        # Calendrier de difficulté (cf. simulation.TerrainSchedule) : si fourni, les chunks
+        # en dépendent seul (les paramètres courants ne servent plus qu'aux requêtes).
+        self.schedule = schedule
+
+        # Chunks monde figés (index -> WorldChunk), du chunk visible le plus à gauche
+        # jusqu'au plus loin généré (fenêtre visible, file) ; les lectures en avance
+        # (pièces) passent par peek_chunk sans figer.
+        self._committed: Dict[int, WorldChunk] = {}
+
+        # File de génération (index de chunks monde à préparer) + compteurs (en échantillons)
+        self._gen_queue: deque = deque()
+        # Paramètres capturés à la mise en file (index -> WorldParams), jusqu'au figement
+        self._queued_params: Dict[int, WorldParams] = {}
+        self._next_queued = 0
+        self.gen_stats = {"queued": 0, "generated": 0, "forced_sync": 0}
 
         # Multi-biomes
         self.waves_base: List[Tuple[float, float]] = [(85, 0.010), (45, 0.023), (22, 0.045)]
         self.waves_max:  List[Tuple[float, float]] = [(95, 0.016), (55, 0.035), (28, 0.070)]
-        self.waves: List[Tuple[float, float]] = list(self.waves_base)
+        # waves : sinusoïdes du début de partie (les premiers chunks sont figés dès l'init)
+        self.waves: List[Tuple[float, float]] = list(self.waves_base if waves is None else waves)
 
-        # Gaps (trous)
+        # Gaps (trous) : paramètres courants, appliqués aux prochains chunks figés.
+        # self.gaps indexe les trous des chunks figés (pour les requêtes / le lookahead).
         self.gaps_enabled = False
-        self.gaps: List[Tuple[float, float]] = []
+        self.gaps = GapIndex()
 
         self.gap_every = 2200.0
         self.gap_width = 180.0
         self.gap_ramp = 200.0
 
-        # Premier trou : RANDOM pour éviter "mêmes obstacles à chaque run"
-        self.next_gap_wx = self.rng.uniform(600.0, 1600.0)
-
-        # Coordonnée monde du bord gauche affiché
+        # Coordonnée monde du bord gauche affiché (offset de scroll)
         self.world_x0 = 0.0
 
-        # Points écran
-        self.points: List[List[float]] = []
+        # Buffer circulaire des hauteurs (échantillon k <=> x monde = k * dx).
+        # Stocké deux fois (miroir [0, cap) / [cap, 2*cap)) pour que la fenêtre
+        # [head, head + count) soit toujours contiguë, sans copie.
+        # Tranches : tranche c <=> échantillons [c * S, (c + 1) * S]. Le buffer garde les
+        # tranches visibles en entier (+ 1 échantillon de chaque côté pour le contour) :
+        # il ne change qu'au passage d'une frontière de tranche. Plus une tranche à gauche :
+        # le rendu interpolé (draw(world_x0=...)) peut être jusqu'à un tick en retard.
+        self.chunk_samples = max(1, CHUNK_PX // dx)
+        self.chunk_w = self.chunk_samples * dx
+        self.capacity = (width // self.chunk_w + 4) * self.chunk_samples + 3
+
+        self._ys = np.zeros(2 * self.capacity, dtype=np.float64)
+        self._head = 0    # index physique du premier échantillon
+        self._count = 0   # nombre d'échantillons valides
+        self._k0 = 0      # index monde du premier échantillon
         self._init_points()
-
-    def reset_gaps(self) -> None:
-        """Réinitialise complètement la séquence de trous (utile si tu veux un nouveau pattern)."""
-        self.gaps = []
-        self.next_gap_wx = self.rng.uniform(self.world_x0 + 600.0, self.world_x0 + 1600.0)
+        self._queue_ahead()
+        self._last_scroll_key = self._scroll_key()
 
     def set_biome(self, t: float) -> None:
         """Interpole les paramètres sinusoïdaux selon t in [0,1]."""
@@ -64,130 +121,316 @@ class Terrain:
             new_waves.append((amp, freq))
         self.waves = new_waves
 
-    def _spawn_gaps_until(self, max_world_x: float) -> None:
-        """Ajoute des trous à l'avance jusqu'à max_world_x (coord monde), avec randomisation."""
-        if not self.gaps_enabled:
-            return
-
-        while self.next_gap_wx < max_world_x:
-            start = self.next_gap_wx
-
-            # randomisation autour des réglages courants
-            width = self.rng.uniform(self.gap_width * 0.7, self.gap_width * 1.3)
-            every = self.rng.uniform(self.gap_every * 0.7, self.gap_every * 1.3)
-
-            end = start + width
-            self.gaps.append((start, end))
-            self.next_gap_wx += every
-
-        # nettoyage
+    def params(self) -> WorldParams:
+        """Paramètres de difficulté courants (ceux des prochains chunks figés)."""
+        return WorldParams(tuple(self.waves), bool(self.gaps_enabled),
+                           float(self.gap_every), float(self.gap_width), float(self.gap_ramp))
+
+    def chunk_params(self, index: int) -> WorldParams:
+        """Paramètres du chunk index : figé, capturés à sa mise en file, sinon courants."""
+        chunk = self._committed.get(index)
+        if chunk is not None:
+            return chunk.params
+        params = self._queued_params.get(index)
+        return params if params is not None else self.params()
+
+    def chunk_state(self) -> Tuple[Dict[int, WorldChunk], Dict[int, WorldParams]]:
+        """
+        Copie de l'état de génération : (chunks figés, paramètres capturés des chunks en file).
+        Avec params() et schedule, de quoi reproduire les chunks à venir (cf. player_batch).
+        """
+        return dict(self._committed), dict(self._queued_params)
+
+    def peek_chunk(self, index: int) -> WorldChunk:
+        """
+        Chunk monde index tel qu'il est ou sera figé (calendrier, ou paramètres de chunk_params),
+        sans le figer : lectures en avance (pièces) sans génération synchrone comptée.
+        Le chunk construit reste dans le cache du generator pour le figement.
+        """
+        chunk = self._committed.get(index)
+        if chunk is not None:
+            return chunk
+        if self.schedule is not None:
+            return self.world.scheduled_chunk(index, self.schedule)
+        prev = self._committed.get(index - 1)
+        prev_params = prev.params if prev is not None else self._queued_params.get(index - 1)
+        return self.world.chunk(index, self.chunk_params(index), prev_params)
+
+    def world_chunk(self, index: int, forced: bool = True) -> WorldChunk:
+        """
+        Chunk monde index : déjà figé, ou figé maintenant (peek_chunk).
+        forced=False : appel depuis la file de génération (pump), sinon génération synchrone.
+        """
+        chunk = self._committed.get(index)
+        if chunk is not None:
+            return chunk
+        self.gen_stats["generated" if not forced else "forced_sync"] += self.world.samples
+
+        chunk = self.peek_chunk(index)
+        self._committed[index] = chunk
+        self._queued_params.pop(index, None)
+
+        # index des trous (un chunk figé après un chunk plus à droite s'insère à sa place)
+        for gap in chunk.gaps:
+            self.gaps.insert(gap)
+
+        # nettoyage (trous et chunks loin derrière)
         cutoff = self.world_x0 - 2000.0
         if cutoff > 0:
-            self.gaps = [(a, b) for (a, b) in self.gaps if b >= cutoff]
+            self.gaps.prune(cutoff)
+        c_min = self.world.chunk_of(self.world_x0) - 1
+        for c in [c for c in self._committed if c < c_min]:
+            del self._committed[c]
+        for c in [c for c in self._queued_params if c < c_min]:
+            del self._queued_params[c]
+        return chunk
+
+    def _queue_ahead(self) -> None:
+        """
+        Met en file les chunks monde jusqu'à PREFETCH_CHUNKS chunks après le bord droit,
+        avec les paramètres courants (appelé par le scroll : même capture quel que soit
+        le moment où pump ou une lecture synchrone les figera).
+        """
+        target = self.world.chunk_of(self.world_x0 + self.width) + PREFETCH_CHUNKS
+        start = max(self._next_queued, self.world.chunk_of(self.world_x0))
+        params = self.params() if self.schedule is None else None
+        for c in range(start, target + 1):
+            if c not in self._committed:
+                self._gen_queue.append(c)
+                if params is not None:
+                    self._queued_params[c] = params
+                self.gen_stats["queued"] += self.world.samples
+        self._next_queued = max(self._next_queued, target + 1)
+
+    def pending(self) -> int:
+        """Nombre de chunks monde en attente dans la file."""
+        return len(self._gen_queue)
+
+    def pump(self, budget_s: float = 0.001) -> int:
+        """
+        Génère des chunks de la file tant que le budget (secondes) n'est pas épuisé.
+        Un chunk commencé est toujours terminé. Retourne le nombre de chunks générés.
+        """
+        t0 = time.perf_counter()
+        done = 0
+        queue = self._gen_queue
+        while queue and time.perf_counter() - t0 < budget_s:
+            c = queue.popleft()
+            if c in self._committed or c < self.world.chunk_of(self.world_x0):
+                continue
+            self.world_chunk(c, forced=False)
+            done += 1
+        return done
+
+    def coins_between(self, x_from: float, x_to: float) -> List[float]:
+        """x monde des pièces dans [x_from, x_to) (lus dans les chunks sans les figer)."""
+        coins = []
+        for c in range(self.world.chunk_of(x_from), self.world.chunk_of(x_to) + 1):
+            coins.extend(x for x in self.peek_chunk(c).coins if x_from <= x < x_to)
+        return coins
+
+    def chunk_heights(self, world_xs) -> List[float]:
+        """
+        Hauteurs du sol (chunks monde) aux abscisses monde données, par interpolation
+        linéaire des échantillons k * dx : ce que get_height_screen_x renverra à l'écran,
+        sans dépendre du scroll ni figer les chunks (peek_chunk).
+        """
+        n = self.world.samples
+        dx = self.dx
+        out = []
+        for x in world_xs:
+            u = x / dx
+            k = int(math.floor(u))
+            c = k // n
+            i = k - c * n
+            ys = self.peek_chunk(c).ys
+            y0 = ys[i]
+            y1 = ys[i + 1] if i + 1 < n else self.peek_chunk(c + 1).ys[0]
+            out.append(float(y0 + (u - k) * (y1 - y0)))
+        return out
 
     def height_at_world(self, world_x: float) -> float:
-        """Hauteur du sol (y écran) pour une abscisse monde."""
-        # hauteur normale
-        normal_y = self.base_y
-        for amp, freq in self.waves:
-            normal_y += amp * math.sin(world_x * freq)
-
-        # trous réels (vide) + rampes
-        if self.gaps_enabled:
-            hole_y = self.height + 250
-            for a, b in self.gaps:
-                r = self.gap_ramp
-
-                if a - r <= world_x < a:
-                    t = (world_x - (a - r)) / r
-                    return normal_y * (1 - t) + hole_y * t
-
-                if a <= world_x <= b:
-                    return hole_y
-
-                if b < world_x <= b + r:
-                    t = (world_x - b) / r
-                    return hole_y * (1 - t) + normal_y * t
-
-        return normal_y
+        """Hauteur du sol (y écran) pour une abscisse monde, avec les paramètres courants."""
+        return height_at(world_x, self.waves, self.gaps if self.gaps_enabled else None,
+                         self.gap_ramp, self.base_y, self.hole_y)
+
+    def height_at_world_many(self, world_xs) -> np.ndarray:
+        """Version vectorisée (NumPy) de height_at_world sur un tableau d'abscisses monde."""
+        return heights_at(world_xs, self.waves, self.gaps if self.gaps_enabled else None,
+                          self.gap_ramp, self.base_y, self.hole_y)
+
+    @property
+    def points(self) -> List[List[float]]:
+        """Points écran [x, y] de la fenêtre (copie, pour debug / compat)."""
+        xs = self._k0 * self.dx - self.world_x0 + np.arange(self._count) * self.dx
+        return np.column_stack((xs, self._window())).tolist()
+
+    def _window(self) -> np.ndarray:
+        """Vue contiguë (sans copie) des hauteurs de la fenêtre."""
+        return self._ys[self._head:self._head + self._count]
+
+    def _segment(self, x_screen: float) -> Tuple[int, float]:
+        """Index du segment contenant x_screen (borné à la fenêtre) + position u en échantillons."""
+        u = (x_screen + self.world_x0) / self.dx - self._k0
+        i = int(u) if u > 0.0 else 0
+        if i > self._count - 2:
+            i = self._count - 2
+        return self._head + i, u
 
     def get_height_screen_x(self, x_screen: float) -> float:
         """Hauteur du sol à x_screen par interpolation linéaire."""
-        if x_screen <= self.points[0][0]:
-            return float(self.points[0][1])
-        if x_screen >= self.points[-1][0]:
-            return float(self.points[-1][1])
-
-        i = int((x_screen - self.points[0][0]) // self.dx)
-        i = max(0, min(i, len(self.points) - 2))
+        u = (x_screen + self.world_x0) / self.dx - self._k0
+        if u <= 0.0:
+            return float(self._ys[self._head])
+        if u >= self._count - 1:
+            return float(self._ys[self._head + self._count - 1])
 
-        x0, y0 = self.points[i]
-        x1, y1 = self.points[i + 1]
-
-        if x1 == x0:
-            return float(y0)
-
-        t = (x_screen - x0) / (x1 - x0)
-        return float(y0 + t * (y1 - y0))
+        i = int(u)
+        y0 = self._ys[self._head + i]
+        y1 = self._ys[self._head + i + 1]
+        return float(y0 + (u - i) * (y1 - y0))
 
     def get_slope_screen_x(self, x_screen: float) -> float:
         """Pente dy/dx approximée près de x_screen."""
-        if x_screen <= self.points[0][0]:
-            x0, y0 = self.points[0]
-            x1, y1 = self.points[1]
-        elif x_screen >= self.points[-1][0]:
-            x0, y0 = self.points[-2]
-            x1, y1 = self.points[-1]
-        else:
-            i = int((x_screen - self.points[0][0]) // self.dx)
-            i = max(0, min(i, len(self.points) - 2))
-            x0, y0 = self.points[i]
-            x1, y1 = self.points[i + 1]
-
-        if x1 == x0:
-            return 0.0
-        return float((y1 - y0) / (x1 - x0))
+        p, _ = self._segment(x_screen)
+        return float((self._ys[p + 1] - self._ys[p]) / self.dx)
+
+    def profile_screen(self, x_from: float, x_to: float) -> Tuple[List[float], List[float]]:
+        """
+        Échantillons (x écran, y) du sol couvrant [x_from, x_to] (bornés à la fenêtre) :
+        les segments entre points consécutifs sont ceux de get_height_screen_x.
+        """
+        u_a = (x_from + self.world_x0) / self.dx - self._k0
+        u_b = (x_to + self.world_x0) / self.dx - self._k0
+        i0 = min(max(int(math.floor(u_a)), 0), self._count - 2)
+        i1 = min(max(int(math.ceil(u_b)), i0 + 1), self._count - 1)
+        x0 = (self._k0 + i0) * self.dx - self.world_x0
+        xs = [x0 + j * self.dx for j in range(i1 - i0 + 1)]
+        ys = self._ys[self._head + i0:self._head + i1 + 1].tolist()
+        return xs, ys
+
+    def _draw_offset(self, world_x0: Optional[float] = None) -> float:
+        """Offset de rendu : world_x0 borné à [self.world_x0 - chunk_w, self.world_x0] (buffer gardé)."""
+        if world_x0 is None:
+            return self.world_x0
+        return min(max(world_x0, self.world_x0 - self.chunk_w), self.world_x0)
+
+    def _visible_chunks(self, world_x0: Optional[float] = None) -> Tuple[int, int]:
+        """Indices [c_lo, c_hi] des chunks qui touchent l'écran (offset world_x0, par défaut le courant)."""
+        if world_x0 is None:
+            world_x0 = self.world_x0
+        c_lo = int(math.floor(world_x0 / self.chunk_w))
+        c_hi = int(math.floor((world_x0 + self.width) / self.chunk_w))
+        return c_lo, c_hi
+
+    def _visible_range(self) -> Tuple[int, int]:
+        """
+        Indices monde [k_lo, k_hi] à garder : chunks visibles entiers + le chunk
+        précédent (rendu interpolé) + 1 échantillon de marge.
+        """
+        c_lo, c_hi = self._visible_chunks()
+        k_lo = (c_lo - 1) * self.chunk_samples - 1
+        k_hi = (c_hi + 1) * self.chunk_samples + 1
+        return k_lo, k_hi
 
     def _init_points(self) -> None:
-        """Initialise les points couvrant la largeur écran."""
-        n = self.width // self.dx + 3
-        self.points = []
-        for i in range(n):
-            world_x = self.world_x0 + i * self.dx
-            self._spawn_gaps_until(world_x + 3000.0)
-            y = self.height_at_world(world_x)
-            x_screen = i * self.dx
-            self.points.append([x_screen, y])
+        """Initialise le buffer couvrant la largeur écran."""
+        k_lo, _ = self._visible_range()
+        self._head = 0
+        self._count = 0
+        self._k0 = k_lo
+        self._append_until()
+
+    def _append_until(self) -> None:
+        """Copie dans le buffer les échantillons manquants à droite, chunk monde par chunk monde."""
+        _, k_hi = self._visible_range()
+        n = self.world.samples
+        cap = self.capacity
+
+        k = self._k0 + self._count
+        while k <= k_hi:
+            c = k // n
+            chunk = self.world_chunk(c)
+            i0 = k - c * n
+            i1 = min(n, k_hi + 1 - c * n)
+            ys = chunk.ys[i0:i1]
+
+            # écriture (miroir) avec éventuel retour au début du buffer
+            p = (self._head + self._count) % cap
+            m = i1 - i0
+            first = min(m, cap - p)
+            self._ys[p:p + first] = ys[:first]
+            self._ys[p + cap:p + cap + first] = ys[:first]
+            if first < m:
+                self._ys[:m - first] = ys[first:]
+                self._ys[cap:cap + m - first] = ys[first:]
+
+            self._count += m
+            k += m
+
+    def _scroll_key(self) -> Tuple[int, int, int]:
+        """Tranches visibles + chunk monde du bord droit : fenêtre et file en dépendent seuls."""
+        x0 = self.world_x0
+        x1 = x0 + self.width
+        return (int(math.floor(x0 / self.chunk_w)), int(math.floor(x1 / self.chunk_w)),
+                int(math.floor(x1 / self.world.length)))
 
     def update_scroll(self, scroll_speed_px: float) -> None:
-        """Défilement : décale points, pop gauche, append droite."""
-        for p in self.points:
-            p[0] -= scroll_speed_px
-
-        while len(self.points) > 0 and self.points[0][0] < -self.dx:
-            self.points.pop(0)
-            self.world_x0 += self.dx
-
-        while len(self.points) < (self.width // self.dx + 3) or self.points[-1][0] < self.width + self.dx:
-            last_x = self.points[-1][0]
-            new_x = last_x + self.dx
-            i = new_x / self.dx
-            world_x = self.world_x0 + i * self.dx
-
-            self._spawn_gaps_until(world_x + 3000.0)
-            y = self.height_at_world(world_x)
-            self.points.append([new_x, y])
-
-    def draw(self, screen, color_ground, color_outline=None) -> None:
-        """Dessine le sol via polygon."""
-        poly = self.points[:]
-        poly.append([self.points[-1][0], self.height])
-        poly.append([self.points[0][0], self.height])
-
-        pygame.draw.polygon(screen, color_ground, poly)
-        if color_outline is not None:
-            pygame.draw.lines(screen, color_outline, False, self.points, 3)
-    
+        """Défilement : avance l'offset, libère à gauche, échantillonne à droite (O(nouveaux points))."""
+        self.world_x0 += scroll_speed_px
+
+        # aucune frontière de chunk franchie (cas de la plupart des ticks) : rien à faire
+        key = self._scroll_key()
+        if key == self._last_scroll_key:
+            return
+        self._last_scroll_key = key
+
+        # libère les échantillons sortis à gauche
+        k_lo, _ = self._visible_range()
+        drop = k_lo - self._k0
+        if drop > 0:
+            if drop >= self._count:
+                # saut plus grand que la fenêtre : on repart de zéro
+                self._head = 0
+                self._count = 0
+                self._k0 = k_lo
+            else:
+                self._head = (self._head + drop) % self.capacity
+                self._count -= drop
+                self._k0 += drop
+
+        self._append_until()
+        self._queue_ahead()
+
+    def draw(self, screen, color_ground, color_outline=None, world_x0: Optional[float] = None,
+             scale: float = 1.0, detail: int = 1, outline_width: int = 3) -> None:
+        """
+        Dessine le sol via polygon (échantillons visibles + un de chaque côté).
+        world_x0      : offset de scroll interpolé pour le rendu (au plus un chunk de retard).
+        scale         : échelle de rendu (résolution interne), coordonnées monde inchangées.
+        detail        : pas d'échantillonnage du tracé (1 : tous les échantillons), aligné
+                        sur les indices monde pour que le tracé ne scintille pas au scroll.
+        outline_width : épaisseur du contour (px logiques, 0 : sans contour).
+        Le monde (et donc la physique) n'est jamais modifié : seul le tracé change.
+        """
+        world_x0 = self._draw_offset(world_x0)
+        dx = self.dx
+        k_lo = (int(math.floor(world_x0 / dx)) // detail) * detail
+        k_hi = -(-int(math.ceil((world_x0 + self.width) / dx)) // detail) * detail
+        i0 = max(k_lo - self._k0, 0)
+        i1 = min(k_hi - self._k0, self._count - 1)
+        idx = np.arange(i0, i1 + 1, detail)
+        if idx[-1] != i1:
+            idx = np.append(idx, i1)
+
+        xs = ((self._k0 + idx) * dx - world_x0) * scale
+        ys = self._window()[idx] * scale
+        pts = np.column_stack((xs, ys)).tolist()
+        h = self.height * scale
+        pygame.draw.polygon(screen, color_ground, pts + [[pts[-1][0], h], [pts[0][0], h]])
+        if color_outline is not None and outline_width > 0:
+            pygame.draw.lines(screen, color_outline, False, pts, max(1, int(round(outline_width * scale))))
+
     def set_waves(self, waves):
         """Override direct des sinusoïdes (amp, freq)."""
         self.waves = list(waves)
\ No newline at end of file
@@ -2,10 +2,31 @@ import pygame
 import math
 import os
 import sys
+from collections import OrderedDict
 
 # Web detection (pygbag / emscripten)
 IS_WEB = (sys.platform == "emscripten")
 
+# Cache des textes rendus (font, texte, couleur) -> Surface, éviction LRU
+TEXT_CACHE_SIZE = 128
+
+# HUD : couleur et positions des textes
+HUD_COLOR = (10, 10, 10)
+HUD_SCORE_POS = (12, 10)
+HUD_COINS_POS = (12, 40)
+HUD_LEVEL_POS = (12, 95)
+
+# État de chargement des assets : panneau opaque en bas à gauche (marge, couleurs)
+LOADING_MARGIN = 10
+LOADING_BG = (20, 20, 28)
+LOADING_TEXT = (230, 230, 230)
+
+# Voile de nuit (RGBA)
+NIGHT_COLOR = (10, 10, 30, 120)
+
+# Images précalculées de la pulsation du score (écran de game over), sur une période
+PULSE_FRAMES = 24
+
 # LocalStorage helpers (web) / file helpers (desktop)
 def load_highscore_storage(default: int = 0) -> int:
     """Charge le highscore : localStorage (web) ou fichier (desktop)."""
@@ -48,23 +69,108 @@ class UI:
 
     def __init__(self):
         pygame.font.init()
-        self.font = pygame.font.Font(None, 32)
-        self.font_big = pygame.font.Font(None, 72)
-        self.font_med = pygame.font.Font(None, 44)
+        self.scale = None
+        self.set_scale(1.0)
 
         # Highscore : localStorage en web, fichier en desktop
         self.highscore = load_highscore_storage(0)
 
-    def draw_hud(self, screen, score, vx, state, dive):
-        txt = f"Score: {int(score)}"
-        surf = self.font.render(txt, True, (10, 10, 10))
-        screen.blit(surf, (12, 10))
+        # Cache texte (LRU) + compteurs de font.render (instrumentation)
+        self._text_cache = OrderedDict()
+        self.render_count = 0          # total depuis le lancement
+        self.frame_renders = 0         # depuis begin_frame()
+        self.cache_hits = 0
+
+        # Overlay de nuit réutilisé (cf. draw_night)
+        self._night_key = None
+        self._night = None
+        self._night_edge = None
+
+        # Écran de game over en cache (cf. draw_game_over_screen)
+        self._game_over_key = None
+        self._game_over = None
+
+    def set_scale(self, scale: float) -> None:
+        """Échelle de rendu (résolution interne) : polices et positions du HUD / game over."""
+        if scale == self.scale:
+            return
+        self.scale = scale
+        self.font = pygame.font.Font(None, max(8, int(round(32 * scale))))
+        self.font_big = pygame.font.Font(None, max(8, int(round(72 * scale))))
+        self.font_med = pygame.font.Font(None, max(8, int(round(44 * scale))))
+        self._hud_pos = [(int(x * scale), int(y * scale))
+                         for x, y in (HUD_SCORE_POS, HUD_COINS_POS, HUD_LEVEL_POS)]
+
+    def _px(self, v: float) -> int:
+        """Longueur logique -> pixels à l'échelle de rendu."""
+        return int(round(v * self.scale))
+
+    # -------------------------
+    # TEXTE (cache)
+    # -------------------------
+    def begin_frame(self) -> None:
+        """Remet à zéro le compteur de rendus de la frame."""
+        self.frame_renders = 0
+
+    def text(self, font, text, color):
+        """Surface du texte (rendue une fois puis servie depuis le cache LRU)."""
+        key = (font, text, tuple(color))
+        surf = self._text_cache.get(key)
+        if surf is not None:
+            self._text_cache.move_to_end(key)
+            self.cache_hits += 1
+            return surf
+
+        surf = font.render(text, True, color)
+        self.render_count += 1
+        self.frame_renders += 1
+        self._text_cache[key] = surf
+        if len(self._text_cache) > TEXT_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+        return surf
+
+    def draw_number(self, screen, font, prefix, value, color, pos) -> None:
+        """
+        Dessine prefix + value (entier) à pos : préfixe et chiffres sont des glyphes
+        en cache, donc un nombre qui change ne coûte aucun font.render.
+        """
+        x, y = pos
+        head = self.text(font, prefix, color)
+        screen.blit(head, (x, y))
+        x += head.get_width()
+        for ch in str(int(value)):
+            glyph = self.text(font, ch, color)
+            screen.blit(glyph, (x, y))
+            x += glyph.get_width()
+
+    def draw_hud(self, screen, score, vx, state, dive, coins=None, level=None):
+        score_pos, coins_pos, level_pos = self._hud_pos
+        self.draw_number(screen, self.font, "Score: ", score, HUD_COLOR, score_pos)
+        # textes qui changent rarement : une Surface en cache par valeur
+        if coins is not None:
+            screen.blit(self.text(self.font, f"Coins: {coins}", HUD_COLOR), coins_pos)
+        if level is not None:
+            screen.blit(self.text(self.font, f"Level: {level}", HUD_COLOR), level_pos)
 
     def draw_game_over(self, screen):
         surf = self.font_big.render("GAME OVER", True, (240, 240, 240))
         rect = surf.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2))
         screen.blit(surf, rect)
 
+    def draw_loading(self, screen, progress: float):
+        """
+        « Chargement... NN% » (assets en cours de chargement) sur un panneau opaque ;
+        retourne son rectangle.
+        """
+        surf = self.text(self.font, f"Chargement... {int(progress * 100)}%", LOADING_TEXT)
+        pad = self._px(6)
+        margin = self._px(LOADING_MARGIN)
+        rect = surf.get_rect().inflate(2 * pad, 2 * pad)
+        rect.bottomleft = (margin, screen.get_height() - margin)
+        screen.fill(LOADING_BG, rect)
+        screen.blit(surf, (rect.x + pad, rect.y + pad))
+        return rect
+
     def update_highscore_if_needed(self, score: float) -> bool:
         """
         Met à jour highscore si score > highscore.
@@ -78,33 +184,97 @@ class UI:
             return True
         return False
 
-    def draw_game_over_screen(self, screen, score, t, is_new_record=False):
-        w, h = screen.get_width(), screen.get_height()
+    # -------------------------
+    # NUIT (overlay réutilisé)
+    # -------------------------
+    def draw_night(self, screen, night_screen_x, soft_edge=0):
+        """
+        Voile de nuit sur [0, night_screen_x) : un overlay plein écran alloué une fois,
+        dont on ne blitte que la partie utile (area). soft_edge > 0 : bord dégradé
+        (pré-rendu une fois) de cette largeur au-delà du front.
+        """
+        if night_screen_x <= 0:
+            return
+        w_screen, h = screen.get_size()
+        key = (w_screen, h, soft_edge)
+        if key != self._night_key:
+            self._night = pygame.Surface((w_screen, h), pygame.SRCALPHA)
+            self._night.fill(NIGHT_COLOR)
+            self._night_edge = None
+            if soft_edge > 0:
+                r, g, b, a = NIGHT_COLOR
+                self._night_edge = pygame.Surface((soft_edge, h), pygame.SRCALPHA)
+                for i in range(soft_edge):
+                    alpha = int(a * (1.0 - (i + 0.5) / soft_edge))
+                    self._night_edge.fill((r, g, b, alpha), (i, 0, 1, h))
+            self._night_key = key
+
+        w = int(min(night_screen_x, w_screen))
+        screen.blit(self._night, (0, 0), (0, 0, w, h))
+        if self._night_edge is not None and w < w_screen:
+            screen.blit(self._night_edge, (w, 0))
+
+    # -------------------------
+    # GAME OVER (construit une fois)
+    # -------------------------
+    def _build_game_over(self, size, score, is_new_record, reason):
+        """Overlay, textes et images de pulsation du score : créés une fois par game over."""
+        w, h = size
+        blits = []
 
         overlay = pygame.Surface((w, h), pygame.SRCALPHA)
         overlay.fill((10, 10, 30, 200))
-        screen.blit(overlay, (0, 0))
+        blits.append((overlay, (0, 0)))
 
-        title = self.font_big.render("GAME OVER", True, (240, 240, 240))
-        screen.blit(title, title.get_rect(center=(w // 2, h // 2 - 120)))
+        def centered(surf, cx, cy):
+            blits.append((surf, surf.get_rect(center=(cx, cy)).topleft))
 
-        pulse = 1.0 + 0.06 * math.sin(6.0 * t)
-        score_txt = f"SCORE: {int(score)}"
-        score_surf = self.font_big.render(score_txt, True, (255, 255, 255))
-        score_surf = pygame.transform.smoothscale(
-            score_surf,
-            (int(score_surf.get_width() * pulse), int(score_surf.get_height() * pulse))
-        )
-        screen.blit(score_surf, score_surf.get_rect(center=(w // 2, h // 2 - 20)))
+        centered(self.font_big.render("GAME OVER", True, (240, 240, 240)), w // 2, h // 2 - self._px(120))
+        under = blits          # sous le score pulsé
+        blits = []
 
         hs_txt = f"HIGHSCORE: {int(self.highscore)}"
         hs_color = (255, 230, 140) if is_new_record else (220, 220, 220)
-        hs_surf = self.font_med.render(hs_txt, True, hs_color)
-        screen.blit(hs_surf, hs_surf.get_rect(center=(w // 2, h // 2 + 45)))
+        centered(self.font_med.render(hs_txt, True, hs_color), w // 2, h // 2 + self._px(45))
 
         if is_new_record:
-            badge = self.font.render("NEW RECORD!", True, (255, 230, 140))
-            screen.blit(badge, badge.get_rect(center=(w // 2, h // 2 + 80)))
+            centered(self.font.render("NEW RECORD!", True, (255, 230, 140)), w // 2, h // 2 + self._px(80))
+
+        centered(self.font.render("R : Rejouer   |   ESC : Quitter", True, (230, 230, 230)),
+                 w // 2, h // 2 + self._px(130))
+
+        if reason:
+            reason_surf = self.font.render(reason, True, (230, 230, 230))
+            blits.append((reason_surf, (w // 2 - reason_surf.get_width() // 2, h // 2 + self._px(150))))
+
+        # pulsation : PULSE_FRAMES images sur une période de 1 + 0.06 sin(6 t)
+        score_surf = self.font_big.render(f"SCORE: {int(score)}", True, (255, 255, 255))
+        pulse = []
+        for k in range(PULSE_FRAMES):
+            p = 1.0 + 0.06 * math.sin(2.0 * math.pi * k / PULSE_FRAMES)
+            frame = pygame.transform.smoothscale(
+                score_surf,
+                (int(score_surf.get_width() * p), int(score_surf.get_height() * p))
+            )
+            pulse.append((frame, frame.get_rect(center=(w // 2, h // 2 - self._px(20))).topleft))
+
+        return under, pulse, blits
+
+    def draw_game_over_screen(self, screen, score, t, is_new_record=False, reason=None):
+        """
+        Écran de game over. Tout est construit au premier appel d'un game over
+        (clé : taille, score, record, highscore, raison) ; ensuite, uniquement des blits.
+        """
+        size = screen.get_size()
+        key = (size, self.scale, int(score), bool(is_new_record), int(self.highscore), reason)
+        if key != self._game_over_key:
+            self._game_over = self._build_game_over(size, score, is_new_record, reason)
+            self._game_over_key = key
+        under, pulse, over = self._game_over
+
+        screen.blits(under, False)
+        k = int(t * 6.0 / (2.0 * math.pi) * PULSE_FRAMES) % PULSE_FRAMES
+        frame, pos = pulse[k]
+        screen.blit(frame, pos)
+        screen.blits(over, False)
 
-        hint = self.font.render("R : Rejouer   |   ESC : Quitter", True, (230, 230, 230))
-        screen.blit(hint, hint.get_rect(center=(w // 2, h // 2 + 130)))
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""
+world.py — Partie sans affichage (Tiny Wings)
+
+- World : une partie (Simulation) + son pas fixe (FixedStep), avancée par
+  step(dt, action_down, action_pressed) avec le dt de la frame ; retourne les
+  événements de la frame (pièces, changement de phase, game over et sa cause).
+- Aucun display, mixer ni police requis (ni à l'import, ni à l'exécution) :
+  utilisable pour des parties en masse (tests, réglages, bots). Le rendu
+  (render.FrameRenderer), l'audio et les inputs (controls.ActionInput) restent dehors
+  et réagissent aux événements.
+"""
+
+from typing import List, NamedTuple, Optional
+
+from simulation import DEFAULT_TUNING, SIM_HZ, FixedStep, Simulation, Tuning
+
+# Types d'événements
+COIN = "coin"              # value : pièces ramassées pendant le tick
+PHASE = "phase"            # value : nouvelle phase de difficulté (0, 1, 2)
+GAME_OVER = "game_over"    # value : cause ("night", "hole", "energy")
+
+
+class WorldEvent(NamedTuple):
+    """Événement de simulation, daté par le tick qui l'a produit."""
+    tick: int
+    kind: str
+    value: object
+
+
+class World:
+    """
+    step(dt, action_down, action_pressed) -> événements de la frame.
+    dt : temps réel de la frame (s), découpé en ticks de 1/hz. Le tap (edge) est
+    consommé par le premier tick : une frame sans tick le garde pour la suivante.
+    """
+
+    def __init__(self, width: int = 900, height: int = 600, seed: Optional[int] = None,
+                 hz: float = SIM_HZ, tuning: Tuning = DEFAULT_TUNING):
+        self.sim = Simulation(width, height, seed=seed, tuning=tuning)
+        self.stepper = FixedStep(hz)
+        self._pressed = False
+
+    # -------------------------
+    # ÉTAT (lecture)
+    # -------------------------
+    @property
+    def seed(self) -> int:
+        return self.sim.seed
+
+    @property
+    def alpha(self) -> float:
+        """Fraction de tick en attente (interpolation du rendu)."""
+        return self.stepper.alpha
+
+    @property
+    def ticks(self) -> int:
+        return self.sim.ticks
+
+    @property
+    def game_over(self) -> bool:
+        return self.sim.game_over
+
+    @property
+    def death_reason(self) -> str:
+        return self.sim.death_reason
+
+    @property
+    def score(self) -> float:
+        return self.sim.final_score if self.sim.game_over else self.sim.score
+
+    @property
+    def coins(self) -> int:
+        return self.sim.coins
+
+    @property
+    def phase(self) -> int:
+        return self.sim.phase
+
+    # -------------------------
+    # AVANCE
+    # -------------------------
+    def tick(self, action_down: bool, action_pressed: bool, events: Optional[list] = None) -> List[WorldEvent]:
+        """Un seul tick (dt fixe), sans accumulateur : pour les boucles headless."""
+        if events is None:
+            events = []
+        sim = self.sim
+        if sim.game_over:
+            return events
+
+        got = sim.tick(self.stepper.dt, action_down, action_pressed)
+        if got:
+            events.append(WorldEvent(sim.ticks, COIN, got))
+        if sim.phase != sim.prev_phase:
+            events.append(WorldEvent(sim.ticks, PHASE, sim.phase))
+        if sim.game_over:
+            events.append(WorldEvent(sim.ticks, GAME_OVER, sim.death_reason))
+        return events
+
+    def step(self, dt: float, action_down: bool, action_pressed: bool) -> List[WorldEvent]:
+        """Avance de dt secondes (0 à MAX_CATCHUP_STEPS ticks). Retourne les événements."""
+        events: List[WorldEvent] = []
+        self._pressed = self._pressed or action_pressed
+        for _ in range(self.stepper.advance(dt)):
+            if self.sim.game_over:
+                break
+            self.tick(action_down, self._pressed, events)
+            self._pressed = False
+        return events
@@ -0,0 +1,553 @@
+"""
+worldgen.py — Génération du monde par chunks (seedée, reproductible)
+
+- Le monde est découpé en chunks de taille fixe (échantillons k * dx).
+- Un chunk (hauteurs, trous, pièces) est une fonction pure de
+  (seed, index du chunk, paramètres de difficulté) : on peut le régénérer,
+  le calculer à l'avance ou le réutiliser (cache LRU borné).
+- Difficulté par position (scheduled_chunk) : les paramètres sont ceux d'un calendrier
+  (simulation.TerrainSchedule) évalué à chaque abscisse, et les trous suivent une chaîne
+  par phase (GapChain) : même terrain quel que soit l'ordre ou le moment de génération.
+- Formule de hauteur partagée avec Terrain : somme de sinusoïdes + trous avec rampes.
+- Mode oscillateurs (PhasorBank) : à pas fixe dx, chaque sinusoïde est un phaseur
+  (cos, sin) tourné d'une rotation précalculée au lieu d'un sin() par échantillon.
+  Expérimental, réservé aux benchmarks (bench/bench_oscillators.py) : jamais activé en
+  jeu. Sur un chunk (146 échantillons) le gain n'est que de 1.1x, et le terrain de jeu
+  (scheduled_chunk) a des sinusoïdes qui varient par échantillon en phase 3.
+"""
+
+import bisect
+import math
+import random
+from collections import OrderedDict, deque
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+# En dessous de cette taille de lot, la boucle scalaire reste plus rapide que NumPy
+# (coût fixe des appels NumPy : 0,3x à 16 abscisses, équilibre vers 64-96,
+# cf. bench/bench_terrain_sampling.py).
+SMALL_BATCH = 64
+
+# Longueur visée (px monde) d'un chunk ; arrondie à un multiple de dx.
+# Doit rester plus grande qu'un trou + ses deux rampes.
+WORLD_CHUNK_PX = 2048
+
+# Borne des rampes d'un calendrier (recherche des trous qui touchent un chunk)
+MAX_RAMP_PX = 1000.0
+
+# Renormalisation des phaseurs (|z| = 1) tous les N échantillons : borne la dérive.
+RENORM_EVERY = 4096
+
+
+class GapIndex:
+    """
+    Trous (start, end) triés par start, stockés en deux deques parallèles.
+    Les trous sont ajoutés à leur place (à droite dans le cas courant) et retirés par la
+    gauche, donc starts et ends restent triés : la recherche se fait par bisect.
+    """
+
+    def __init__(self):
+        self.starts: deque = deque()
+        self.ends: deque = deque()
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self):
+        return zip(self.starts, self.ends)
+
+    def __reversed__(self):
+        return zip(reversed(self.starts), reversed(self.ends))
+
+    def __getitem__(self, i: int) -> Tuple[float, float]:
+        return self.starts[i], self.ends[i]
+
+    def append(self, gap: Tuple[float, float]) -> None:
+        """Ajoute un trou (start doit être >= au dernier start)."""
+        a, b = gap
+        self.starts.append(a)
+        self.ends.append(b)
+
+    def insert(self, gap: Tuple[float, float]) -> None:
+        """Ajoute un trou à sa place dans l'ordre des starts (append si start >= au dernier)."""
+        a, b = gap
+        if not self.starts or a >= self.starts[-1]:
+            self.append(gap)
+            return
+        i = bisect.bisect_right(self.starts, a)
+        self.starts.insert(i, a)
+        self.ends.insert(i, b)
+
+    def clear(self) -> None:
+        self.starts.clear()
+        self.ends.clear()
+
+    def prune(self, cutoff: float) -> None:
+        """Retire (par la gauche) les trous finissant avant cutoff."""
+        starts, ends = self.starts, self.ends
+        while ends and ends[0] < cutoff:
+            starts.popleft()
+            ends.popleft()
+
+    def first_reaching(self, x: float, ramp: float) -> int:
+        """Index du premier trou dont la rampe de sortie atteint x (end + ramp >= x)."""
+        i = bisect.bisect_left(self.ends, x - ramp)
+        # x - ramp et end + ramp ne s'arrondissent pas pareil : on recule d'un cran
+        return i - 1 if i > 0 else 0
+
+    def find(self, x: float, ramp: float) -> int:
+        """
+        Index du premier trou (dans l'ordre) dont [start - ramp, end + ramp] contient x, ou -1.
+        Même résultat qu'un parcours linéaire de la liste.
+        """
+        starts, ends = self.starts, self.ends
+        n = len(starts)
+        i = bisect.bisect_left(ends, x - ramp)
+        if i > 0:
+            i -= 1
+        while i < n:
+            a = starts[i]
+            if a - ramp > x:
+                return -1
+            if x <= ends[i] + ramp:
+                return i
+            i += 1
+        return -1
+
+    def touching(self, x_min: float, x_max: float, ramp: float) -> List[Tuple[float, float]]:
+        """Trous (rampes incluses) qui touchent [x_min, x_max], dans l'ordre."""
+        i0 = self.first_reaching(x_min, ramp)
+        i1 = bisect.bisect_right(self.starts, x_max + ramp, lo=i0)
+        i1 = min(i1 + 1, len(self.starts))
+        return [(self.starts[i], self.ends[i]) for i in range(i0, i1)]
+
+
+# -------------------------
+# FORMULE DE HAUTEUR
+# -------------------------
+def height_at(world_x: float, waves, gaps: Optional[GapIndex], ramp: float,
+              base_y: float, hole_y: float) -> float:
+    """Hauteur du sol (y écran) pour une abscisse monde (gaps=None : pas de trous)."""
+    # hauteur normale
+    normal_y = base_y
+    for amp, freq in waves:
+        normal_y += amp * math.sin(world_x * freq)
+
+    # trous réels (vide) + rampes
+    if gaps is not None and gaps.starts:
+        r = ramp
+        i = gaps.find(world_x, r)
+        if i < 0:
+            return normal_y
+
+        a = gaps.starts[i]
+        b = gaps.ends[i]
+
+        if a - r <= world_x < a:
+            t = (world_x - (a - r)) / r
+            return normal_y * (1 - t) + hole_y * t
+
+        if a <= world_x <= b:
+            return hole_y
+
+        t = (world_x - b) / r
+        return hole_y * (1 - t) + normal_y * t
+
+    return normal_y
+
+
+def normal_heights(xs: np.ndarray, waves, base_y: float) -> np.ndarray:
+    """Somme de sinusoïdes sur un tableau d'abscisses monde (sans trous)."""
+    normal_y = np.full(xs.shape, float(base_y))
+    for amp, freq in waves:
+        normal_y += amp * np.sin(xs * freq)
+    return normal_y
+
+
+def apply_gaps(out: np.ndarray, normal_y: np.ndarray, xs: np.ndarray,
+               gaps: Sequence[Tuple[float, float]], ramp: float, hole_y: float) -> None:
+    """
+    Applique trous + rampes sur out (en place).
+    Parcours inverse : le premier trou de la séquence gagne (comme la version scalaire).
+    """
+    r = ramp
+    for a, b in reversed(gaps):
+        m = (xs >= a - r) & (xs < a)
+        t = (xs[m] - (a - r)) / r
+        ramp_in = normal_y[m] * (1 - t) + hole_y * t
+
+        m_hole = (xs >= a) & (xs <= b)
+
+        m_out = (xs > b) & (xs <= b + r)
+        t = (xs[m_out] - b) / r
+        ramp_out = hole_y * (1 - t) + normal_y[m_out] * t
+
+        out[m] = ramp_in
+        out[m_hole] = hole_y
+        out[m_out] = ramp_out
+
+
+def heights_at(world_xs, waves, gaps: Optional[GapIndex], ramp: float,
+               base_y: float, hole_y: float) -> np.ndarray:
+    """
+    Hauteurs du sol pour un tableau d'abscisses monde.
+    Même résultat que height_at point par point, mais toutes les sinusoïdes
+    et rampes sont évaluées sur le tableau entier.
+    """
+    xs = np.asarray(world_xs, dtype=np.float64)
+    if xs.size < SMALL_BATCH:
+        return np.array([height_at(x, waves, gaps, ramp, base_y, hole_y) for x in xs.tolist()],
+                        dtype=np.float64)
+
+    normal_y = normal_heights(xs, waves, base_y)
+    if gaps is None or len(gaps) == 0:
+        return normal_y
+
+    # seuls les trous qui touchent [x_min, x_max] (rampes incluses)
+    touching = gaps.touching(float(xs.min()), float(xs.max()), ramp)
+    if not touching:
+        return normal_y
+
+    out = normal_y.copy()
+    apply_gaps(out, normal_y, xs, touching, ramp, hole_y)
+    return out
+
+
+# -------------------------
+# OSCILLATEURS (PHASEURS)
+# -------------------------
+class PhasorBank:
+    """
+    Une sinusoïde amp * sin(k * dx * freq) par phaseur z = cos + i sin, avancé d'un
+    échantillon par z *= exp(i * freq * dx). Resynchronisation exacte (math.cos/sin)
+    à chaque seek() et à chaque changement de sinusoïdes, renormalisation tous les
+    renorm_every échantillons.
+    """
+
+    def __init__(self, waves, dx: float, renorm_every: int = RENORM_EVERY):
+        self.dx = dx
+        self.renorm_every = renorm_every
+        self.k = 0
+        self.waves: Tuple[Tuple[float, float], ...] = ()
+        self.set_waves(waves)
+
+    def set_waves(self, waves) -> None:
+        """Change les sinusoïdes (resynchronise exactement à l'échantillon courant)."""
+        waves = tuple((float(a), float(f)) for a, f in waves)
+        if waves == self.waves:
+            return
+        self.waves = waves
+        self._amps = [a for a, _ in waves]
+        self.amps = np.array(self._amps, dtype=np.float64)
+        self.freqs = np.array([f for _, f in waves], dtype=np.float64)
+        self.rot = [complex(math.cos(f * self.dx), math.sin(f * self.dx)) for _, f in waves]
+        self._rot_np = np.array(self.rot, dtype=np.complex128)
+        self.seek(self.k)
+
+    def seek(self, k: int) -> None:
+        """Place les phaseurs sur l'échantillon k (évaluation directe, sans dérive)."""
+        self.k = k
+        x = k * self.dx
+        self.z = [complex(math.cos(x * f), math.sin(x * f)) for _, f in self.waves]
+        self._since_sync = 0
+
+    def _renormalize(self) -> None:
+        self.z = [z / abs(z) for z in self.z]
+        self._since_sync = 0
+
+    def next(self) -> float:
+        """Somme des sinusoïdes à l'échantillon courant, puis avance d'un pas (scalaire)."""
+        z = self.z
+        y = 0.0
+        for amp, zi in zip(self._amps, z):
+            y += amp * zi.imag
+        self.z = [zi * r for zi, r in zip(z, self.rot)]
+        self.k += 1
+        self._since_sync += 1
+        if self._since_sync >= self.renorm_every:
+            self._renormalize()
+        return y
+
+    def run(self, n: int) -> np.ndarray:
+        """Somme des sinusoïdes sur n échantillons consécutifs (produit cumulé par blocs)."""
+        out = np.empty(n, dtype=np.float64)
+        if not self.waves:
+            out.fill(0.0)
+            self.k += n
+            return out
+
+        block = np.empty((len(self.waves), min(n, self.renorm_every)), dtype=np.complex128)
+        i = 0
+        while i < n:
+            m = min(n - i, self.renorm_every - self._since_sync)
+            seq = block[:, :m]
+            seq[:, 0] = self.z
+            seq[:, 1:] = self._rot_np[:, None]
+            np.cumprod(seq, axis=1, out=seq)
+            out[i:i + m] = self.amps @ seq.imag
+
+            self.z = (seq[:, -1] * self._rot_np).tolist()
+            self.k += m
+            self._since_sync += m
+            if self._since_sync >= self.renorm_every:
+                self._renormalize()
+            i += m
+        return out
+
+
+# -------------------------
+# CHUNKS
+# -------------------------
+class WorldParams(NamedTuple):
+    """Paramètres de difficulté figés pour un chunk (hashable : clé de cache)."""
+    waves: Tuple[Tuple[float, float], ...]
+    gaps_enabled: bool
+    gap_every: float
+    gap_width: float
+    gap_ramp: float
+
+
+class WorldChunk:
+    """Chunk index : échantillons k in [index * n, (index + 1) * n), x monde = k * dx."""
+
+    __slots__ = ("index", "params", "x0", "ys", "gaps", "coins")
+
+    def __init__(self, index: int, params: Optional[WorldParams], x0: float, ys: np.ndarray,
+                 gaps: List[Tuple[float, float]], coins: List[float]):
+        self.index = index
+        self.params = params  # None : chunk d'un calendrier (scheduled_chunk)
+        self.x0 = x0          # x monde du premier échantillon
+        self.ys = ys          # hauteurs (lecture seule : partagé via le cache)
+        self.gaps = gaps      # trous qui démarrent dans ce chunk
+        self.coins = coins    # x monde des pièces (hors trous)
+
+
+class GapChain:
+    """
+    Trous d'une phase (start, end, ramp), tirés un par un depuis l'origine de la phase :
+    largeur puis espacement jusqu'au suivant, avec un RNG propre à chaque trou (seed, phase,
+    rang). La chaîne s'arrête avant le premier trou de la phase suivante (limit).
+    """
+
+    __slots__ = ("starts", "gaps", "next_x", "limit", "done", "reach")
+
+    def __init__(self, origin: float, limit: float):
+        self.starts: List[float] = []
+        self.gaps: List[Tuple[float, float, float]] = []
+        self.next_x = origin
+        self.limit = limit
+        self.done = False
+        self.reach = 0.0      # plus grande étendue end + ramp - start (recherche par bisect)
+
+    def touching(self, x_min: float, x_max: float) -> List[Tuple[float, float, float]]:
+        """Trous (rampes incluses) qui touchent [x_min, x_max), dans l'ordre."""
+        i0 = bisect.bisect_left(self.starts, x_min - self.reach)
+        i1 = bisect.bisect_left(self.starts, x_max + MAX_RAMP_PX)
+        return [(a, b, r) for a, b, r in self.gaps[i0:i1] if a - r < x_max and b + r >= x_min]
+
+
+class WorldGenerator:
+    """
+    Génère les chunks du monde à partir d'une seed.
+    Les trous d'un chunk sont tirés sur une grille monde de pas gap_every
+    (un trou par case, position et largeur aléatoires), avec un RNG propre à
+    chaque case : aucun état ne dépend de l'ordre de génération.
+    """
+
+    def __init__(self, seed: Optional[int] = None, dx: int = 20, base_y: float = 450.0,
+                 hole_y: float = 850.0, coin_every: Optional[float] = None, cache_size: int = 64,
+                 oscillators: bool = False):
+        # seed aléatoire par run si non fournie
+        self.seed = random.randrange(2 ** 32) if seed is None else int(seed)
+        self.dx = dx
+        self.base_y = base_y
+        self.hole_y = hole_y
+        self.coin_every = coin_every
+
+        self.samples = max(1, WORLD_CHUNK_PX // dx)
+        self.length = self.samples * dx
+
+        # mode oscillateurs (benchmarks seulement) : sinusoïdes synthétisées par phaseurs
+        # (resync en début de chunk) ; ignoré par scheduled_chunk
+        self.oscillators = oscillators
+        self._bank: Optional[PhasorBank] = None
+
+        # cache LRU : (index, params, prev_params) ou (index, schedule) -> WorldChunk
+        self.cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        # chaînes de trous des calendriers : (schedule, phase) -> GapChain
+        self._chains = {}
+
+    def chunk_of(self, world_x: float) -> int:
+        """Index du chunk contenant world_x."""
+        return int(math.floor(world_x / self.length))
+
+    def gaps(self, index: int, params: WorldParams) -> List[Tuple[float, float]]:
+        """Trous qui démarrent dans le chunk index (rampe d'entrée incluse dans le chunk)."""
+        if not params.gaps_enabled:
+            return []
+
+        every = params.gap_every
+        r = params.gap_ramp
+        x0 = index * self.length
+        x1 = x0 + self.length
+
+        gaps = []
+        j = int(math.floor(x0 / every))
+        while j * every < x1:
+            rng = random.Random(f"{self.seed}/{j}")
+            start = (j + rng.uniform(0.35, 0.65)) * every
+            width = rng.uniform(params.gap_width * 0.7, params.gap_width * 1.3)
+            j += 1
+
+            if not (x0 <= start < x1):
+                continue
+            # la rampe d'entrée ne doit pas déborder sur le chunk précédent
+            start = max(start, x0 + r)
+            if gaps and start < gaps[-1][0]:
+                continue
+            gaps.append((start, start + width))
+        return gaps
+
+    def chunk(self, index: int, params: WorldParams,
+              prev_params: Optional[WorldParams] = None) -> WorldChunk:
+        """
+        Chunk index avec ses paramètres (prev_params : ceux du chunk précédent,
+        dont les trous peuvent déborder sur celui-ci ; par défaut = params).
+        """
+        if prev_params is None:
+            prev_params = params
+
+        key = (index, params, prev_params)
+        chunk = self._cache.get(key)
+        if chunk is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return chunk
+
+        self.misses += 1
+        chunk = self._build(index, params, prev_params)
+        self._store(key, chunk)
+        return chunk
+
+    def scheduled_chunk(self, index: int, schedule) -> WorldChunk:
+        """
+        Chunk index selon un calendrier de difficulté (hashable ; cf. simulation.TerrainSchedule :
+        waves_at, phases, gap_origin, gap_params_at) : sinusoïdes évaluées par échantillon,
+        trous des chaînes de chaque phase. params du chunk : None.
+        """
+        key = (index, schedule)
+        chunk = self._cache.get(key)
+        if chunk is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return chunk
+
+        self.misses += 1
+        chunk = self._build_scheduled(index, schedule)
+        self._store(key, chunk)
+        return chunk
+
+    def _store(self, key, chunk: WorldChunk) -> None:
+        self._cache[key] = chunk
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def gap_chain(self, schedule, phase: int, x_max: float) -> GapChain:
+        """Chaîne de trous de la phase, tirée au moins jusqu'à x_max (ou jusqu'à sa fin)."""
+        key = (schedule, phase)
+        chain = self._chains.get(key)
+        if chain is None:
+            limit = math.inf
+            if phase + 1 < schedule.phases:
+                nxt = schedule.gap_origin(phase + 1)
+                limit = nxt - schedule.gap_params_at(phase + 1, nxt)[2]
+            chain = self._chains[key] = GapChain(schedule.gap_origin(phase), limit)
+
+        while not chain.done and chain.next_x <= x_max:
+            a = chain.next_x
+            every, width, ramp = schedule.gap_params_at(phase, a)
+            rng = random.Random(f"{self.seed}/{phase}/{len(chain.gaps)}")
+            b = a + rng.uniform(width * 0.7, width * 1.3)
+            # le trou et sa rampe de sortie doivent finir avant la phase suivante
+            if b + ramp > chain.limit:
+                chain.done = True
+                break
+            chain.starts.append(a)
+            chain.gaps.append((a, b, ramp))
+            chain.reach = max(chain.reach, b + ramp - a)
+            chain.next_x = a + rng.uniform(every * 0.7, every * 1.3)
+        return chain
+
+    def _build(self, index: int, params: WorldParams, prev_params: WorldParams) -> WorldChunk:
+        n = self.samples
+        xs = np.arange(index * n, (index + 1) * n, dtype=np.float64) * self.dx
+
+        if self.oscillators:
+            if self._bank is None:
+                self._bank = PhasorBank(params.waves, self.dx)
+            self._bank.set_waves(params.waves)
+            self._bank.seek(index * n)
+            normal_y = self._bank.run(n)
+            normal_y += self.base_y
+        else:
+            normal_y = normal_heights(xs, params.waves, self.base_y)
+        ys = normal_y.copy()
+
+        own = self.gaps(index, params)
+        spill = self.gaps(index - 1, prev_params)
+        apply_gaps(ys, normal_y, xs, own, params.gap_ramp, self.hole_y)
+        apply_gaps(ys, normal_y, xs, spill, prev_params.gap_ramp, self.hole_y)
+        ys.setflags(write=False)
+
+        coins = []
+        if self.coin_every:
+            x0 = index * self.length
+            blocked = ([(a - prev_params.gap_ramp, b + prev_params.gap_ramp) for a, b in spill]
+                       + [(a - params.gap_ramp, b + params.gap_ramp) for a, b in own])
+            m = int(math.ceil(x0 / self.coin_every))
+            while m * self.coin_every < x0 + self.length:
+                cx = m * self.coin_every
+                # pas de pièce au-dessus d'un trou (invisible et impossible à ramasser)
+                if not any(lo <= cx <= hi for lo, hi in blocked):
+                    coins.append(cx)
+                m += 1
+
+        return WorldChunk(index, params, float(xs[0]), ys, own, coins)
+
+    def _build_scheduled(self, index: int, schedule) -> WorldChunk:
+        n = self.samples
+        xs = np.arange(index * n, (index + 1) * n, dtype=np.float64) * self.dx
+        x0 = index * self.length
+        x1 = x0 + self.length
+
+        normal_y = np.full(n, float(self.base_y))
+        for amp, freq in schedule.waves_at(xs):
+            normal_y += amp * np.sin(xs * freq)
+        ys = normal_y.copy()
+
+        touching = []
+        for phase in range(schedule.phases):
+            if schedule.gap_origin(phase) is not None:
+                touching.extend(self.gap_chain(schedule, phase, x1 + MAX_RAMP_PX).touching(x0, x1))
+        for a, b, r in touching:
+            apply_gaps(ys, normal_y, xs, [(a, b)], r, self.hole_y)
+        ys.setflags(write=False)
+        own = [(a, b) for a, b, _ in touching if x0 <= a < x1]
+
+        coins = []
+        if self.coin_every:
+            blocked = [(a - r, b + r) for a, b, r in touching]
+            m = int(math.ceil(x0 / self.coin_every))
+            while m * self.coin_every < x1:
+                cx = m * self.coin_every
+                # pas de pièce au-dessus d'un trou (invisible et impossible à ramasser)
+                if not any(lo <= cx <= hi for lo, hi in blocked):
+                    coins.append(cx)
+                m += 1
+
+        return WorldChunk(index, None, float(xs[0]), ys, own, coins)
@@ -0,0 +1,171 @@
+"""
+build_assets.py — Préparation des assets (Tiny Wings)
+
+Pour chaque asset de assets.ASSETS présent dans assets/ :
+- images : mises à la taille de rendu (WIDTH x HEIGHT, smoothscale) et réenregistrées
+  en JPEG ; le jeu n'a plus ni grande image à décoder ni mise à l'échelle au lancement ;
+- sons : convertis par plateforme (PLATFORMS) avec ffmpeg, en Ogg Vorbis (format
+  recommandé par pygbag) : qualité desktop en stéréo 44,1 kHz, web en mono 22,05 kHz
+  (téléchargement plus léger). Sans ffmpeg : WAV 16 bits au même nombre de canaux
+  et à la même fréquence (rééchantillonnage linéaire), non compressé (développement
+  seulement : --require-ffmpeg refuse ce repli, cf. deploy.sh).
+Puis manifest.json (fichiers par plateforme, tailles, priorités) lu par assets.Assets.
+Un fichier déjà à jour (plus récent que sa source) n'est pas refait, sauf --force.
+
+Usage (depuis la racine du projet) :
+    python tools/build_assets.py
+    python tools/build_assets.py --out /tmp/assets --force
+    python tools/build_assets.py --require-ffmpeg     # build web (deploy.sh)
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import wave
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+from assets import ASSET_DIR, ASSETS, MANIFEST_FORMAT, MANIFEST_PATH, MANIFEST_VERSION  # noqa: E402
+
+# Taille de rendu du jeu (cf. main.py)
+WIDTH, HEIGHT = 900, 600
+
+# Sons par plateforme : fréquence (Hz), canaux, qualité Vorbis (ffmpeg -q:a, 0 à 10)
+PLATFORMS = {
+    "desktop": {"rate": 44100, "channels": 2, "quality": 5},
+    "web": {"rate": 22050, "channels": 1, "quality": 2},
+}
+
+
+def up_to_date(src, dst, force):
+    return not force and os.path.exists(dst) and os.path.getmtime(dst) >= os.path.getmtime(src)
+
+
+# -------------------------
+# IMAGES
+# -------------------------
+def build_image(src, dst):
+    """Image mise à la taille de rendu, en JPEG."""
+    image = pygame.image.load(src)
+    if image.get_bitsize() not in (24, 32):
+        image = image.convert(24, 0)
+    pygame.image.save(pygame.transform.smoothscale(image, (WIDTH, HEIGHT)), dst)
+
+
+# -------------------------
+# SONS
+# -------------------------
+def encode_ogg(src, dst, settings):
+    subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-i", src,
+                    "-ac", str(settings["channels"]), "-ar", str(settings["rate"]),
+                    "-c:a", "libvorbis", "-q:a", str(settings["quality"]), dst], check=True)
+
+
+def resample_wav(src, dst, settings):
+    """WAV 16 bits aux canaux / fréquence de settings (repli sans ffmpeg)."""
+    with wave.open(src, "rb") as f:
+        channels, width, rate = f.getnchannels(), f.getsampwidth(), f.getframerate()
+        data = f.readframes(f.getnframes())
+    if width != 2:
+        shutil.copyfile(src, dst)
+        return
+    samples = np.frombuffer(data, dtype="<i2").reshape(-1, channels).astype(np.float64)
+
+    out_channels = min(settings["channels"], channels)
+    if out_channels == 1 and channels > 1:
+        samples = samples.mean(axis=1, keepdims=True)
+    out_rate = min(settings["rate"], rate)
+    if out_rate != rate:
+        n = int(len(samples) * out_rate / rate)
+        t = np.arange(n) * (rate / out_rate)
+        src_t = np.arange(len(samples))
+        samples = np.stack([np.interp(t, src_t, samples[:, c]) for c in range(samples.shape[1])], axis=1)
+
+    with wave.open(dst, "wb") as f:
+        f.setnchannels(samples.shape[1])
+        f.setsampwidth(2)
+        f.setframerate(out_rate)
+        f.writeframes(np.clip(np.round(samples), -32768, 32767).astype("<i2").tobytes())
+
+
+# -------------------------
+# PIPELINE
+# -------------------------
+def build(out_dir, force=False):
+    """Prépare tous les assets présents dans out_dir ; retourne le manifest."""
+    encoder = "ffmpeg" if shutil.which("ffmpeg") else "wav"
+    if encoder == "wav":
+        print("ffmpeg introuvable : sons en WAV rééchantillonné (non compressé)")
+
+    assets = {}
+    for name, spec in ASSETS.items():
+        src = os.path.join(ASSET_DIR, spec.source)
+        if not os.path.exists(src):
+            print(f"{name:<12} absent ({src}), ignoré")
+            continue
+        base = os.path.splitext(os.path.basename(spec.source))[0]
+        files = {}
+        if spec.kind == "image":
+            rel = os.path.join("images", base + ".jpg")
+            dst = os.path.join(out_dir, rel)
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            if not up_to_date(src, dst, force):
+                build_image(src, dst)
+            files = {platform: rel for platform in PLATFORMS}
+        else:
+            for platform, settings in PLATFORMS.items():
+                rel = os.path.join(platform, base + (".ogg" if encoder == "ffmpeg" else ".wav"))
+                dst = os.path.join(out_dir, rel)
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                if not up_to_date(src, dst, force):
+                    (encode_ogg if encoder == "ffmpeg" else resample_wav)(src, dst, settings)
+                files[platform] = rel
+        assets[name] = {
+            "kind": spec.kind,
+            "source": spec.source,
+            "priority": spec.priority,
+            "critical": spec.critical,
+            "files": files,
+            "bytes": {p: os.path.getsize(os.path.join(out_dir, f)) for p, f in files.items()},
+            "source_bytes": os.path.getsize(src),
+        }
+
+    manifest = {"format": MANIFEST_FORMAT, "version": MANIFEST_VERSION, "size": [WIDTH, HEIGHT],
+                "encoder": encoder, "assets": assets}
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Préparation des assets (images, sons, manifest)")
+    parser.add_argument("--out", default=os.path.dirname(MANIFEST_PATH), help="dossier de sortie")
+    parser.add_argument("--force", action="store_true", help="refait tous les fichiers")
+    parser.add_argument("--require-ffmpeg", action="store_true",
+                        help="échoue sans ffmpeg au lieu de livrer des WAV non compressés")
+    args = parser.parse_args()
+
+    if args.require_ffmpeg and not shutil.which("ffmpeg"):
+        print("ffmpeg introuvable : requis pour les sons Ogg du build web "
+              "(installer ffmpeg, cf. README)", file=sys.stderr)
+        return 1
+
+    os.makedirs(args.out, exist_ok=True)
+    manifest = build(args.out, args.force)
+    print(f"{'asset':<12} {'origine':>10} " + " ".join(f"{p:>10}" for p in PLATFORMS))
+    for name, entry in manifest["assets"].items():
+        sizes = " ".join(f"{entry['bytes'][p] / 1024:>8.0f} k" for p in PLATFORMS)
+        print(f"{name:<12} {entry['source_bytes'] / 1024:>8.0f} k {sizes}")
+    print(f"manifest -> {os.path.join(args.out, 'manifest.json')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())